@@ -0,0 +1,28 @@
+"""Qt environment setup; must not import Qt so it can run before PySide6 loads."""
+
+import os
+import sys
+
+
+def configure_qt_rendering() -> None:
+    """
+    Configure Qt rendering backend for stability.
+
+    Environment override:
+      - MANGA_READER_FORCE_SOFTWARE_RENDERING=1 -> force software rendering
+      - MANGA_READER_FORCE_SOFTWARE_RENDERING=0 -> force default (GPU)
+
+    If unset, software rendering is enabled by default on Linux.
+    """
+    setting = os.environ.get("MANGA_READER_FORCE_SOFTWARE_RENDERING")
+    if setting is not None:
+        force_software = setting.lower() in {"1", "true", "yes"}
+    else:
+        force_software = sys.platform.startswith("linux")
+
+    if not force_software:
+        return
+
+    os.environ.setdefault("QTWEBENGINE_CHROMIUM_FLAGS", "--disable-gpu")
+    os.environ.setdefault("QT_QUICK_BACKEND", "software")
+    os.environ.setdefault("QTWEBENGINE_DISABLE_SANDBOX", "1")
@@ -1,16 +1,21 @@
 """Context Panel Coordinator - Manages word context panel lifecycle and navigation requests."""
 
-from typing import Optional
+from itertools import islice
+from typing import List, Optional, Tuple
 
-from PySide6.QtCore import QObject, Slot, Signal
+from PySide6.QtCore import QObject, Qt, Slot, Signal
 
-from manga_reader.core import MangaVolume
+from manga_reader.core import MangaVolume, TrackedWord, WordAppearance
 from manga_reader.services import VocabularyService
 from manga_reader.ui import MainWindow, WordContextPanel
 
 from .view_modes import ViewMode
 from .word_interaction_coordinator import WordInteractionCoordinator
 
+# Same-thread wiring that must never be duplicated if a connect() runs twice
+_DIRECT_UNIQUE_CONNECTION = Qt.ConnectionType(
+    Qt.DirectConnection.value | Qt.UniqueConnection.value
+)
 
 
 class ContextPanelCoordinator(QObject):
@@ -28,6 +33,10 @@ class ContextPanelCoordinator(QObject):
     navigate_to_page_requested = Signal(int)  # page_index
     view_mode_change_requested = Signal(str, int)  # mode_name, target_page
     restore_view_requested = Signal(str, str, int)  # volume_path, mode_name, page_number
+    session_context_requested = Signal()  # emitted right before the panel opens
+
+    # Number of appearances fetched per batch when showing a word's context
+    APPEARANCES_PAGE_SIZE = 50
 
     def __init__(
         self,
@@ -54,9 +63,18 @@ class ContextPanelCoordinator(QObject):
         self._current_page: int = 0
         self._view_mode: Optional[ViewMode] = None
 
-        # Wire context panel signals
-        self.context_panel.closed.connect(self._on_context_panel_closed)
-        self.context_panel.appearance_selected.connect(self._on_appearance_selected)
+        # (word_id, appearances version, first batch) of the last word opened in the panel
+        self._last_appearances: Optional[Tuple[int, int, List[WordAppearance]]] = None
+
+        # (vocabulary version, formatted message) for the vocabulary list dialog
+        self._vocab_summary_cache: Optional[Tuple[int, str]] = None
+
+        # Wire context panel signals (same GUI thread, so connect directly)
+        self.context_panel.closed.connect(self._on_context_panel_closed, _DIRECT_UNIQUE_CONNECTION)
+        self.context_panel.appearance_selected.connect(self._on_appearance_selected, _DIRECT_UNIQUE_CONNECTION)
+        self.context_panel.more_appearances_requested.connect(
+            self._on_more_appearances_requested, _DIRECT_UNIQUE_CONNECTION
+        )
 
     def set_session_context(self, volume: Optional[MangaVolume], view_mode: ViewMode, current_page: int):
         """Update the current session context (called by ReaderController)."""
@@ -67,92 +85,132 @@ class ContextPanelCoordinator(QObject):
     @Slot()
     def handle_open_vocabulary_list(self):
         """Open basic vocabulary list info in a dialog (MVP)."""
+        version = self.vocabulary_service.tracked_words_version
+        if self._vocab_summary_cache is not None and self._vocab_summary_cache[0] == version:
+            self.main_window.show_info("Vocabulary List", self._vocab_summary_cache[1])
+            return
+
         try:
             tracked_words = self.vocabulary_service.list_tracked_words()
-            if not tracked_words:
-                self.main_window.show_info(
-                    "Vocabulary List",
-                    "You haven't tracked any words yet.\n\n"
-                    "Click on a word in the manga and use the 'Track' button.",
-                )
-                return
-
-            word_list = "\n".join(
-                f"• {w.lemma} ({w.reading}) - {w.part_of_speech}"
-                for w in tracked_words[:10]
-            )
-            more_text = (
-                f"\n... and {len(tracked_words) - 10} more"
-                if len(tracked_words) > 10
-                else ""
-            )
+        except Exception as e:
+            self.main_window.show_error("List Failed", f"Could not retrieve vocabulary list: {e}")
+            return
+
+        if not tracked_words:
             self.main_window.show_info(
                 "Vocabulary List",
-                f"You have tracked {len(tracked_words)} word(s):\n\n{word_list}{more_text}",
+                "You haven't tracked any words yet.\n\n"
+                "Click on a word in the manga and use the 'Track' button.",
             )
-        except Exception as e:
-            self.main_window.show_error("List Failed", f"Could not retrieve vocabulary list: {e}")
+            return
+
+        word_count = len(tracked_words)
+        word_list = "\n".join(w.display_line for w in islice(tracked_words, 10))
+        more_text = f"\n... and {word_count - 10} more" if word_count > 10 else ""
+        summary = f"You have tracked {word_count} word(s):\n\n{word_list}{more_text}"
+        self._vocab_summary_cache = (version, summary)
+        self.main_window.show_info("Vocabulary List", summary)
 
     @Slot(str)
     def handle_view_context_by_lemma(self, lemma: str):
         """Open context panel by lemma of a tracked word."""
         try:
-            tracked_words = self.vocabulary_service.list_tracked_words()
-            tracked_word = next((w for w in tracked_words if w.lemma == lemma), None)
-            if not tracked_word:
-                self.main_window.show_error(
-                    "Word Not Tracked",
-                    f"'{lemma}' is not yet tracked. Please track it first.",
-                )
-                return
-            self.handle_view_word_context(tracked_word.id)
+            tracked_word = self.vocabulary_service.get_tracked_word_by_lemma(lemma)
         except Exception as e:
             self.main_window.show_error("Context Lookup Failed", f"Could not retrieve word appearances: {e}")
+            return
+
+        if not tracked_word:
+            self.main_window.show_error(
+                "Word Not Tracked",
+                f"'{lemma}' is not yet tracked. Please track it first.",
+            )
+            return
+        self.handle_view_word_context(tracked_word.id, tracked_word=tracked_word)
 
     @Slot(int)
-    def handle_view_word_context(self, word_id: int):
-        """Open context panel showing all appearances of a tracked word."""
+    def handle_view_word_context(self, word_id: int, tracked_word: Optional[TrackedWord] = None):
+        """Open context panel showing all appearances of a tracked word.
+
+        Args:
+            word_id: The ID of the tracked word
+            tracked_word: The word itself, if the caller already looked it up
+        """
         try:
-            tracked_words = self.vocabulary_service.list_tracked_words()
-            tracked_word = next((w for w in tracked_words if w.id == word_id), None)
-            if not tracked_word:
-                self.main_window.show_error(
-                    "Word Not Found",
-                    "The requested word could not be found in vocabulary.",
-                )
-                return
-
-            appearances = self.vocabulary_service.list_appearances(word_id)
-            if not appearances:
-                self.main_window.show_info(
-                    "No Appearances",
-                    f"The word '{tracked_word.lemma}' has no recorded appearances.",
-                )
-                return
-
-            # Display panel
-            self.context_panel.display_word_context(
-                word_id=word_id,
-                word_lemma=tracked_word.lemma,
-                appearances=appearances,
+            if tracked_word is None:
+                tracked_word = self.vocabulary_service.get_tracked_word_by_id(word_id)
+            appearances = self._first_appearances(word_id) if tracked_word else []
+        except Exception as e:
+            self.main_window.show_error("Context Lookup Failed", f"Could not retrieve word appearances: {e}")
+            return
+
+        if not tracked_word:
+            self.main_window.show_error(
+                "Word Not Found",
+                "The requested word could not be found in vocabulary.",
             )
+            return
 
-            # Save current view mode and page number for restoration
-            if self._view_mode is not None:
-                self.previous_view_mode_name = self._view_mode.name
-            self.previous_page_number = self._current_page
-            # Save the current volume path so we can restore to it later
-            if self._current_volume is not None:
-                self.previous_volume_path = str(self._current_volume.volume_path)
-            self.context_panel_active = True
+        if not appearances:
+            self.main_window.show_info(
+                "No Appearances",
+                f"The word '{tracked_word.lemma}' has no recorded appearances.",
+            )
+            return
 
-            # Show the context panel
-            self.main_window.show_context_panel()
+        # Display panel
+        self.context_panel.display_word_context(
+            word_id=word_id,
+            word_lemma=tracked_word.lemma,
+            appearances=appearances,
+            has_more=len(appearances) == self.APPEARANCES_PAGE_SIZE,
+        )
 
-            # Request context view adjustment
-            self._request_context_view_adjustment()
+        # Session context is only pushed while the panel is active, so pull it now
+        self.session_context_requested.emit()
+
+        # Save current view mode and page number for restoration
+        if self._view_mode is not None:
+            self.previous_view_mode_name = self._view_mode.name
+        self.previous_page_number = self._current_page
+        # Save the current volume path so we can restore to it later
+        if self._current_volume is not None:
+            self.previous_volume_path = str(self._current_volume.volume_path)
+        self.context_panel_active = True
+
+        # Show the context panel
+        self.main_window.show_context_panel()
+
+        # Request context view adjustment
+        self._request_context_view_adjustment()
+
+    def _first_appearances(self, word_id: int) -> List[WordAppearance]:
+        """Return the first batch of a word's appearances, reusing the last fetch if still current."""
+        version = self.vocabulary_service.appearances_version
+        cached = self._last_appearances
+        if cached is not None and cached[0] == word_id and cached[1] == version:
+            return cached[2]
+        appearances = self.vocabulary_service.list_appearances(
+            word_id, limit=self.APPEARANCES_PAGE_SIZE
+        )
+        self._last_appearances = (word_id, version, appearances)
+        return appearances
+
+    @Slot(int, int)
+    def _on_more_appearances_requested(self, word_id: int, offset: int):
+        """Fetch the next batch of appearances when the panel scrolls past the loaded ones."""
+        try:
+            batch = self.vocabulary_service.list_appearances(
+                word_id, offset=offset, limit=self.APPEARANCES_PAGE_SIZE
+            )
         except Exception as e:
+            self.context_panel.more_appearances_failed()
             self.main_window.show_error("Context Lookup Failed", f"Could not retrieve word appearances: {e}")
+            return
+
+        self.context_panel.append_appearances(
+            batch, has_more=len(batch) == self.APPEARANCES_PAGE_SIZE
+        )
 
     @Slot()
     def _on_context_panel_closed(self):
@@ -1,6 +1,7 @@
 """Context Sync Coordinator - scans a volume to record tracked word appearances."""
 
-from typing import Optional, Set
+import logging
+from typing import Dict, List, Optional, Set, Tuple
 
 from PySide6.QtCore import QObject, Signal, Slot
 
@@ -8,6 +9,8 @@ from manga_reader.core import MangaVolume
 from manga_reader.services import MorphologyService, VocabularyService
 from manga_reader.ui import MainWindow
 
+logger = logging.getLogger(__name__)
+
 
 class ContextSyncCoordinator(QObject):
     """Orchestrates volume-wide context discovery for tracked words."""
@@ -74,6 +77,8 @@ class ContextSyncCoordinator(QObject):
 
         total_pages = self._current_volume.total_pages
         for page_index, page in enumerate(self._current_volume.pages):
+            # Appearances are written once per page, in a single transaction
+            page_appearances = []
             for block in page.ocr_blocks:
                 tokens = self._morphology.tokenize(block.full_text)
                 if not tokens:
@@ -89,23 +94,13 @@ class ContextSyncCoordinator(QObject):
                 for token in tokens:
                     if not token.lemma or token.lemma not in tracked_lemmas:
                         continue
+                    page_appearances.append(
+                        (token.lemma, page_index, crop_coordinates, block.full_text)
+                    )
 
-                    # TODO: refactor this
-                    try:
-                        appearance = self._vocabulary_service.add_appearance_if_new(
-                            lemma=token.lemma,
-                            volume_path=self._current_volume.volume_path,
-                            page_index=page_index,
-                            crop_coordinates=crop_coordinates,
-                            sentence_text=block.full_text,
-                        )
-                    except ValueError as exc:  # Fail-fast guard; should not occur
-                        print(f"Context sync skipped lemma: {exc}")
-                        continue
-
-                    if appearance:
-                        new_appearances += 1
-                        lemmas_with_hits.add(token.lemma)
+            added_lemmas = self._add_page_appearances(page_index, page_appearances)
+            new_appearances += len(added_lemmas)
+            lemmas_with_hits.update(added_lemmas)
 
             self.progress_updated.emit(page_index + 1, total_pages)
 
@@ -125,3 +120,24 @@ class ContextSyncCoordinator(QObject):
                 f"for {len(lemmas_with_hits)} tracked word(s)."
             ),
         )
+
+    def _add_page_appearances(
+        self,
+        page_index: int,
+        page_appearances: List[Tuple[str, int, Dict[str, float], str]],
+    ) -> List[str]:
+        """Persist one page's appearances, returning the lemmas that were newly added."""
+        volume_path = self._current_volume.volume_path
+        try:
+            return self._vocabulary_service.add_appearances_if_new(volume_path, page_appearances)
+        except ValueError as exc:  # Fail-fast guard; should not occur
+            logger.warning("Context sync skipped untracked lemmas on page %s: %s", page_index, exc)
+
+        # The batch is all-or-nothing, so retry without the lemmas that are no longer tracked
+        tracked_lemmas = self._vocabulary_service.get_all_tracked_lemmas()
+        page_appearances = [appearance for appearance in page_appearances if appearance[0] in tracked_lemmas]
+        try:
+            return self._vocabulary_service.add_appearances_if_new(volume_path, page_appearances)
+        except ValueError as exc:
+            logger.warning("Context sync skipped page %s: %s", page_index, exc)
+            return []
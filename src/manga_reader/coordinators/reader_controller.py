@@ -1,8 +1,9 @@
 """Reader Controller - Central coordinator for the reading session."""
 
+from functools import wraps
 from pathlib import Path
 
-from PySide6.QtCore import QObject, QTimer, Signal, Slot
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, Signal, Slot
 
 from manga_reader.coordinators.library_coordinator import LibraryCoordinator
 from manga_reader.core import MangaVolume
@@ -23,6 +24,53 @@ from .view_modes import (
 )
 
 
+# Same-thread wiring that must never be duplicated if a connect() runs twice
+_DIRECT_UNIQUE_CONNECTION = Qt.ConnectionType(
+    Qt.DirectConnection.value | Qt.UniqueConnection.value
+)
+
+
+def requires_volume(method):
+    """Turn a ReaderController method into a no-op while no volume is loaded."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.current_volume is None:
+            return None
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+class _VolumeIngestSignals(QObject):
+    """Signals for reporting a finished background ingest (QRunnable is not a QObject)."""
+    finished = Signal(object, object)  # volume_path, MangaVolume | None
+
+
+class _VolumeIngestWorker(QRunnable):
+    """Runs VolumeIngestor.ingest_volume on the thread pool."""
+
+    def __init__(self, ingestor: VolumeIngestor, volume_path: Path):
+        super().__init__()
+        self.ingestor = ingestor
+        self.volume_path = volume_path
+        self.signals = _VolumeIngestSignals()
+        self.setAutoDelete(True)
+
+    @Slot()
+    def run(self):
+        volume = self.ingestor.ingest_volume(self.volume_path)
+        self.signals.finished.emit(self.volume_path, volume)
+
+
+# ReaderController slots that are pure pass-throughs to ContextPanelCoordinator
+_CONTEXT_PANEL_DELEGATES = (
+    "handle_view_context_by_lemma",
+    "handle_open_vocabulary_list",
+    "handle_view_word_context",
+    "_on_context_panel_closed",
+    "_on_appearance_selected",
+)
+
+
 class ReaderController(QObject):
     """
     Central Nervous System of the application.
@@ -75,6 +123,11 @@ class ReaderController(QObject):
         self.sentence_analysis_coordinator = sentence_analysis_coordinator
         self.dictionary_panel_coordinator = dictionary_panel_coordinator
         self.sentence_panel = sentence_analysis_panel
+
+        # Context-panel slots (_CONTEXT_PANEL_DELEGATES) are the coordinator's own bound
+        # methods, exposed on the controller so callers skip a forwarding frame
+        for name in _CONTEXT_PANEL_DELEGATES:
+            setattr(self, name, getattr(context_coordinator, name))
         
         # Session state
         self.current_volume: MangaVolume | None = None
@@ -84,12 +137,42 @@ class ReaderController(QObject):
         
         # Timer for delayed highlighting (to allow async rendering)
         self._highlight_timer: Optional[QTimer] = None
+
+        # Set while a render is queued for the next event-loop pass
+        self._render_pending: bool = False
+
+        # (volume, page, view mode) last pushed to the coordinators
+        self._last_synced_context: Optional[tuple] = None
+
+        # Path of the volume currently being ingested in the background, if any
+        self._pending_ingest_path: Optional[Path] = None
         
 
-        # Wire context coordinator requests to handler slots
-        self.context_coordinator.navigate_to_page_requested.connect(self._handle_navigate_to_page_request)
-        self.context_coordinator.view_mode_change_requested.connect(self._handle_view_mode_change_request)
-        self.context_coordinator.restore_view_requested.connect(self._handle_restore_view_request)
+        # Wire context coordinator requests to handler slots (same GUI thread, so connect directly)
+        self.context_coordinator.navigate_to_page_requested.connect(
+            self._handle_navigate_to_page_request, _DIRECT_UNIQUE_CONNECTION
+        )
+        self.context_coordinator.view_mode_change_requested.connect(
+            self._handle_view_mode_change_request, _DIRECT_UNIQUE_CONNECTION
+        )
+        self.context_coordinator.restore_view_requested.connect(
+            self._handle_restore_view_request, _DIRECT_UNIQUE_CONNECTION
+        )
+        self.context_coordinator.session_context_requested.connect(
+            self._push_context_session, _DIRECT_UNIQUE_CONNECTION
+        )
+
+        # Wire canvas word and navigation requests to the coordinators that serve them
+        self.canvas.word_clicked.connect(self.word_interaction.handle_word_clicked)
+        self.canvas.track_word_requested.connect(self.word_interaction.handle_track_word)
+        self.canvas.view_word_context_requested.connect(self.handle_view_word_context)
+        self.canvas.view_context_by_lemma_requested.connect(self.context_coordinator.handle_view_context_by_lemma)
+        if self.dictionary_panel_coordinator:
+            self.canvas.show_full_definition_requested.connect(
+                self.dictionary_panel_coordinator.handle_show_full_definition
+            )
+        self.canvas.first_page_requested.connect(self.jump_to_first_page)
+        self.canvas.last_page_requested.connect(self.jump_to_last_page)
 
         # Wire sentence analysis actions
         self.canvas.block_clicked.connect(self._handle_block_clicked)
@@ -97,14 +180,14 @@ class ReaderController(QObject):
         self.sentence_panel.explain_clicked.connect(self.sentence_analysis_coordinator.request_explanation)
         self.sentence_panel.close_clicked.connect(self._handle_sentence_panel_closed)
         
-        # Wire coordinator signals to panel UI updates
-        self.sentence_analysis_coordinator.translation_started.connect(self.sentence_panel.show_translation_loading)
-        self.sentence_analysis_coordinator.translation_completed.connect(self.sentence_panel.show_translation_success)
-        self.sentence_analysis_coordinator.translation_failed.connect(self.sentence_panel.show_translation_error)
-        self.sentence_analysis_coordinator.explanation_loading.connect(self.sentence_panel.show_explanation_loading)
-        self.sentence_analysis_coordinator.explanation_completed.connect(self.sentence_panel.show_explanation_success)
-        self.sentence_analysis_coordinator.explanation_failed.connect(self.sentence_panel.show_explanation_error)
-        self.sentence_analysis_coordinator.block_selected.connect(self.sentence_panel.set_original_text)
+        # Wire coordinator signals to panel UI updates (all emitted on the GUI thread, so connect directly)
+        self.sentence_analysis_coordinator.translation_started.connect(self.sentence_panel.show_translation_loading, _DIRECT_UNIQUE_CONNECTION)
+        self.sentence_analysis_coordinator.translation_completed.connect(self.sentence_panel.show_translation_success, _DIRECT_UNIQUE_CONNECTION)
+        self.sentence_analysis_coordinator.translation_failed.connect(self.sentence_panel.show_translation_error, _DIRECT_UNIQUE_CONNECTION)
+        self.sentence_analysis_coordinator.explanation_loading.connect(self.sentence_panel.show_explanation_loading, _DIRECT_UNIQUE_CONNECTION)
+        self.sentence_analysis_coordinator.explanation_completed.connect(self.sentence_panel.show_explanation_success, _DIRECT_UNIQUE_CONNECTION)
+        self.sentence_analysis_coordinator.explanation_failed.connect(self.sentence_panel.show_explanation_error, _DIRECT_UNIQUE_CONNECTION)
+        self.sentence_analysis_coordinator.block_selected.connect(self.sentence_panel.set_original_text, _DIRECT_UNIQUE_CONNECTION)
         
         # Wire main window return to library signal
         self.main_window.return_to_library_requested.connect(self._handle_return_to_library)
@@ -133,9 +216,55 @@ class ReaderController(QObject):
         if save_previous_progress:
             self._persist_current_progress()
 
+        # A synchronous load supersedes any background ingest still in flight (and its status)
+        if self._pending_ingest_path is not None:
+            self._pending_ingest_path = None
+            self.main_window.clear_status()
+
         # Ingest the volume
         volume = self.ingestor.ingest_volume(volume_path)
-        
+        self._activate_volume(
+            volume_path,
+            volume,
+            show_success_dialog=show_success_dialog,
+            defer_render=defer_render,
+            resume_last_page=resume_last_page,
+        )
+
+    @Slot(Path)
+    def load_volume_in_background(self, volume_path: Path):
+        """
+        Handle when user selects a volume folder, parsing it off the UI thread.
+
+        The volume is opened (as by handle_volume_opened with default options) once
+        ingestion finishes; a newer request supersedes one still in flight.
+        """
+        self._persist_current_progress()
+        self._pending_ingest_path = volume_path
+        self.main_window.show_status(f"Loading {volume_path.name}...")
+
+        worker = _VolumeIngestWorker(self.ingestor, volume_path)
+        worker.signals.finished.connect(self._on_volume_ingested)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(object, object)
+    def _on_volume_ingested(self, volume_path: Path, volume: Optional[MangaVolume]):
+        """Open a volume parsed by load_volume_in_background (runs on the UI thread)."""
+        if volume_path != self._pending_ingest_path:
+            return  # Superseded by a newer load
+        self._pending_ingest_path = None
+        self.main_window.clear_status()
+        self._activate_volume(volume_path, volume)
+
+    def _activate_volume(
+        self,
+        volume_path: Path,
+        volume: Optional[MangaVolume],
+        show_success_dialog: bool = True,
+        defer_render: bool = False,
+        resume_last_page: bool = True,
+    ):
+        """Make an ingested volume the current reading session."""
         if volume is None:
             self.main_window.show_error(
                 "Volume Load Error",
@@ -156,6 +285,7 @@ class ReaderController(QObject):
 
         # Keep context sync coordinator aligned with the active volume
         self.context_sync_coordinator.set_volume(volume)
+        self.sentence_analysis_coordinator.on_volume_changed()
         
         # Add to library if we have a coordinator and set volume_id
         if self.library_coordinator:
@@ -178,7 +308,7 @@ class ReaderController(QObject):
         
         # Render the first page (unless deferred for later navigation)
         if not defer_render:
-            self._render_current_page()
+            self._schedule_render()
         
         # Show success message only if requested (skip for silent loads)
         if show_success_dialog:
@@ -213,11 +343,28 @@ class ReaderController(QObject):
         """Persist progress when the application is closing."""
         self._persist_current_progress()
     
+    def _schedule_render(self):
+        """
+        Queue a render of the current page(s) for the next event-loop pass.
+
+        Several slots can fire within one tick (e.g. a view mode change followed by
+        a page jump from the context panel); they collapse into a single render.
+        """
+        if self._render_pending:
+            return
+        self._render_pending = True
+        QTimer.singleShot(0, self._flush_render)
+
+    def _flush_render(self):
+        """Perform the queued render, if any."""
+        if not self._render_pending:
+            return
+        self._render_pending = False
+        self._render_current_page()
+
+    @requires_volume
     def _render_current_page(self):
         """Render the current page(s) to the canvas based on view mode."""
-        if self.current_volume is None:
-            return
-        
         pages_to_render = self.view_mode.pages_to_render(
             self.current_volume,
             self.current_page_number,
@@ -227,13 +374,54 @@ class ReaderController(QObject):
             tracked_lemmas = self.vocabulary_service.get_all_tracked_lemmas()
             self.canvas.render_pages(pages_to_render, tracked_lemmas=tracked_lemmas)
             # Keep coordinators in sync with current session context
-            self.word_interaction.set_volume_context(self.current_volume, self.current_page_number)
-            self.context_coordinator.set_session_context(self.current_volume, self.view_mode, self.current_page_number)
-            if self.dictionary_panel_coordinator:
-                self.dictionary_panel_coordinator.set_session_context(self.current_volume, self.current_page_number)
+            self._sync_session_context()
+            # While the sentence panel is in use, translate the visible bubbles in one request
+            if self.sentence_analysis_coordinator.selected_block_text is not None:
+                self.sentence_analysis_coordinator.warm_page_translations(
+                    [block.full_text for page in pages_to_render for block in page.ocr_blocks],
+                    str(self.current_volume.volume_path),
+                )
+            # Warm the neighbouring spreads once the current one is on screen
+            QTimer.singleShot(0, self._prefetch_adjacent_pages)
         else:
             self.canvas.hide_dictionary_popup()
 
+    def _sync_session_context(self):
+        """Push volume/page/view mode to the coordinators if they changed since the last push."""
+        last = self._last_synced_context
+        if (
+            last is not None
+            and last[0] is self.current_volume
+            and last[1] == self.current_page_number
+            and last[2] is self.view_mode
+        ):
+            return
+        self.word_interaction.set_volume_context(self.current_volume, self.current_page_number)
+        # The context coordinator pulls its state when the panel opens (see _push_context_session)
+        if self.context_coordinator.context_panel_active:
+            self._push_context_session()
+        if self.dictionary_panel_coordinator:
+            self.dictionary_panel_coordinator.set_session_context(self.current_volume, self.current_page_number)
+        self._last_synced_context = (self.current_volume, self.current_page_number, self.view_mode)
+
+    @Slot()
+    def _push_context_session(self):
+        """Give the context coordinator the current volume, view mode and page."""
+        self.context_coordinator.set_session_context(self.current_volume, self.view_mode, self.current_page_number)
+
+    @requires_volume
+    def _prefetch_adjacent_pages(self):
+        """Prefetch the pages one next/previous step away from the current view."""
+        volume = self.current_volume
+        pages = []
+        for page_number in (
+            self.view_mode.next_page_number(volume, self.current_page_number),
+            self.view_mode.previous_page_number(volume, self.current_page_number),
+        ):
+            if page_number != self.current_page_number:
+                pages.extend(self.view_mode.pages_to_render(volume, page_number))
+        self.canvas.prefetch_pages(pages)
+
     # Backwards-compatible delegating slots for tests and legacy wiring
     @Slot(str, str, int, int, int, int)
     def handle_word_clicked(
@@ -257,35 +445,29 @@ class ReaderController(QObject):
         self.word_interaction.set_volume_context(self.current_volume, self.current_page_number)
         self.word_interaction.handle_track_word(lemma, reading, part_of_speech)
     
+    @requires_volume
     def next_page(self):
         """Navigate to the next page, skipping appropriately in double page mode."""
-        if self.current_volume is None:
-            return
-        
-        next_page_num = self.view_mode.next_page_number(
-            self.current_volume,
-            self.current_page_number,
-        )
+        current = self.current_page_number
+        next_page_num = self.view_mode.next_page_number(self.current_volume, current)
         
-        if next_page_num != self.current_page_number:
+        if next_page_num != current:
             self.current_page_number = next_page_num
-            self._render_current_page()
+            self._schedule_render()
     
+    @requires_volume
     def previous_page(self):
         """Navigate to the previous page, accounting for double page mode."""
-        if self.current_volume is None:
+        current = self.current_page_number
+        if current <= 0:
             return
-        
-        if self.current_page_number > 0:
-            prev_page_num = self.view_mode.previous_page_number(
-                self.current_volume,
-                self.current_page_number,
-            )
-            
-            if prev_page_num != self.current_page_number:
-                self.current_page_number = prev_page_num
-                self._render_current_page()
+
+        prev_page_num = self.view_mode.previous_page_number(self.current_volume, current)
+        if prev_page_num != current:
+            self.current_page_number = prev_page_num
+            self._schedule_render()
     
+    @requires_volume
     def jump_to_page(self, page_number: int):
         """
         Jump to a specific page.
@@ -293,24 +475,23 @@ class ReaderController(QObject):
         Args:
             page_number: The page number to jump to (0-indexed)
         """
-        if self.current_volume is None:
+        if page_number == self.current_page_number:
             return
-        
         if 0 <= page_number < self.current_volume.total_pages:
             self.current_page_number = page_number
-            self._render_current_page()
+            self._schedule_render()
     
     @Slot()
+    @requires_volume
     def jump_to_first_page(self):
         """Jump to the first page of the current volume."""
-        if self.current_volume is not None:
-            self.jump_to_page(0)
+        self.jump_to_page(0)
     
     @Slot()
+    @requires_volume
     def jump_to_last_page(self):
         """Jump to the last page of the current volume."""
-        if self.current_volume is not None:
-            self.jump_to_page(self.current_volume.total_pages - 1)
+        self.jump_to_page(self.current_volume.total_pages - 1)
     
     @Slot(str)
     def handle_view_mode_changed(self, mode: str):
@@ -321,8 +502,11 @@ class ReaderController(QObject):
             mode: Either "single" or "double"
         """
         # Will raise if invalid, surfacing programming errors early
-        self.view_mode = create_view_mode(mode)
-        self._render_current_page()
+        new_mode = create_view_mode(mode)
+        if new_mode is self.view_mode:
+            return
+        self.view_mode = new_mode
+        self._schedule_render()
 
     @Slot()
     def toggle_view_mode(self):
@@ -333,7 +517,7 @@ class ReaderController(QObject):
         """
         self.view_mode = self.view_mode.toggle()
         self.view_mode_updated.emit(self.view_mode.name)
-        self._render_current_page()
+        self._schedule_render()
 
     # Slots to handle requests from ContextPanelCoordinator
     @Slot(int)
@@ -344,15 +528,20 @@ class ReaderController(QObject):
     @Slot(str, int)
     def _handle_view_mode_change_request(self, mode_name: str, target_page: int):
         """Handle view mode change request from ContextPanelCoordinator."""
-        self.view_mode = create_view_mode(mode_name)
+        new_mode = create_view_mode(mode_name)
+        if new_mode is self.view_mode and target_page == self.current_page_number:
+            return
+        self.view_mode = new_mode
         self.current_page_number = target_page
-        self._render_current_page()
+        self._schedule_render()
 
     @Slot(str, int)
     def _handle_restore_view_request(self, volume_path: str, mode_name: str, page_number: int):
         """Handle request to restore previous view state including volume."""
         from pathlib import Path
         
+        volume_reloaded = False
+
         # If we're in a different volume, load the correct one first
         if self.current_volume is None or Path(volume_path).resolve() != self.current_volume.volume_path.resolve():
             try:
@@ -364,14 +553,22 @@ class ReaderController(QObject):
                     save_previous_progress=False,
                     resume_last_page=False,
                 )
+                volume_reloaded = True
             except Exception as e:
                 print(f"Warning: Could not restore volume: {e}")
                 # Continue with current volume if restoration fails
         
         # Now restore the view mode and page number
-        self.view_mode = create_view_mode(mode_name)
+        new_mode = create_view_mode(mode_name)
+        if (
+            not volume_reloaded
+            and new_mode is self.view_mode
+            and page_number == self.current_page_number
+        ):
+            return
+        self.view_mode = new_mode
         self.current_page_number = page_number
-        self._render_current_page()
+        self._schedule_render()
 
     @Slot(int, str, int, dict)
     def handle_navigate_to_appearance(self, volume_id: int, volume_path: str, page_index: int, crop_coords: dict):
@@ -456,7 +653,7 @@ class ReaderController(QObject):
         if self.current_volume is not None:
             if 0 <= page_index < self.current_volume.total_pages:
                 self.current_page_number = page_index
-                self._render_current_page()
+                self._schedule_render()
         
         # Delay highlighting to allow page rendering (async JavaScript) to complete
         # Use a single-shot timer with 100ms delay to ensure canvas is rendered
@@ -470,35 +667,9 @@ class ReaderController(QObject):
         timer.start(100)  # 100ms delay for page rendering
 
 
-    # Word interaction is delegated to WordInteractionCoordinator
-
-    @Slot(str)
-    def handle_view_context_by_lemma(self, lemma: str):
-        """Delegate to ContextPanelCoordinator if available."""
-        self.context_coordinator.handle_view_context_by_lemma(lemma)
-
-    @Slot()
-    def handle_open_vocabulary_list(self):
-        """Delegate to ContextPanelCoordinator if available."""
-        self.context_coordinator.handle_open_vocabulary_list()
+    # Word interaction is delegated to WordInteractionCoordinator; context-panel
+    # slots are bound from ContextPanelCoordinator in __init__
 
-    # TODO: make more efficient
-    @Slot(int)
-    def handle_view_word_context(self, word_id: int):
-        """Delegate to ContextPanelCoordinator if available."""
-        self.context_coordinator.handle_view_word_context(word_id)
-    
-    @Slot()
-    def _on_context_panel_closed(self):
-        """Handle when user closes the context panel by delegating to coordinator."""
-        self.context_coordinator._on_context_panel_closed()
-
-    
-    @Slot(int, int, int)
-    def _on_appearance_selected(self, word_id: int, appearance_id: int, page_index: int):
-        """Forward appearance selection to coordinator."""
-        self.context_coordinator._on_appearance_selected(word_id, appearance_id, page_index)
-    
     @Slot()
     def _handle_return_to_library(self):
         """Handle Ctrl+L to return to library."""
@@ -558,7 +729,7 @@ class ReaderController(QObject):
         
         # Only render if we need to (preserves zoom level when clicking blocks on same page)
         if need_render:
-            self._render_current_page()
+            self._schedule_render()
 
         self.sentence_panel.set_original_text(text)
         self.main_window.show_sentence_panel()
@@ -573,4 +744,4 @@ class ReaderController(QObject):
         if self._sentence_previous_view_mode is not None:
             self.view_mode = self._sentence_previous_view_mode
             self._sentence_previous_view_mode = None
-            self._render_current_page()
+            self._schedule_render()
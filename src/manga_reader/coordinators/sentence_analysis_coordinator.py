@@ -1,11 +1,16 @@
 """Sentence Analysis Coordinator - Manages translate/explain workflow and panel state."""
 
+import logging
+import sys
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
-from PySide6.QtCore import QObject, QThreadPool, Signal, Slot
+from PySide6.QtCore import QCoreApplication, QObject, QThreadPool, QTimer, Signal, Slot
 
 from manga_reader.services import (
+    BatchTranslationWorker,
     CacheRecord,
     ExplanationService,
     ExplanationWorker,
@@ -17,126 +22,10 @@ from manga_reader.services import (
 )
 from manga_reader.ui import MainWindow
 
+logger = logging.getLogger(__name__)
 
-class _TranslationRequest(QObject):
-    """Helper class to hold translation request context and handle results safely."""
-    
-    def __init__(self, normalized: str, worker_id: int, parent: "SentenceAnalysisCoordinator"):
-        super().__init__()
-        self.normalized = normalized
-        self.worker_id = worker_id
-        self.parent_ref = parent
-    
-    @Slot(object)
-    def on_translation_result(self, result):
-        """Handle translation result safely."""
-        coordinator = self.parent_ref
-        if coordinator:
-            try:
-                coordinator._handle_translation_result(result, self.normalized, self.worker_id)
-            except RuntimeError:
-                # Coordinator might be destroyed, ignore
-                pass
-    
-    @Slot(str)
-    def on_translation_error(self, error: str):
-        """Handle translation error safely."""
-        coordinator = self.parent_ref
-        if coordinator:
-            try:
-                coordinator._handle_translation_error(error, self.worker_id)
-            except RuntimeError:
-                # Coordinator might be destroyed, ignore
-                pass
-
-
-class _ExplanationRequest(QObject):
-    """Helper class to hold explanation request context and handle results safely."""
-    
-    def __init__(
-        self,
-        normalized: str,
-        worker_id: int,
-        translation_text: str,
-        translation_model: str,
-        cached,
-        parent: "SentenceAnalysisCoordinator",
-    ):
-        super().__init__()
-        self.normalized = normalized
-        self.worker_id = worker_id
-        self.translation_text = translation_text
-        self.translation_model = translation_model
-        self.cached = cached
-        self.parent_ref = parent
-    
-    @Slot(object)
-    def on_explanation_result(self, result):
-        """Handle explanation result safely."""
-        coordinator = self.parent_ref
-        if coordinator:
-            try:
-                coordinator._handle_explanation_result(
-                    result,
-                    self.normalized,
-                    self.translation_text,
-                    self.translation_model,
-                    self.cached,
-                    self.worker_id,
-                )
-            except RuntimeError:
-                pass
-    
-    @Slot(str)
-    def on_explanation_error(self, error: str):
-        """Handle explanation error safely."""
-        coordinator = self.parent_ref
-        if coordinator:
-            try:
-                coordinator._handle_explanation_error(error, self.cached, self.worker_id)
-            except RuntimeError:
-                pass
-
-
-class _ExplanationTranslationRequest(QObject):
-    """Helper class to hold explanation translation request context."""
-    
-    def __init__(
-        self,
-        normalized: str,
-        cached,
-        api_key: str,
-        worker_id: int,
-        parent: "SentenceAnalysisCoordinator",
-    ):
-        super().__init__()
-        self.normalized = normalized
-        self.cached = cached
-        self.api_key = api_key
-        self.worker_id = worker_id
-        self.parent_ref = parent
-    
-    @Slot(object)
-    def on_translation_result(self, result):
-        """Handle translation result for explanation workflow."""
-        coordinator = self.parent_ref
-        if coordinator:
-            try:
-                coordinator._handle_translation_for_explanation(
-                    result, self.normalized, self.cached, self.api_key, self.worker_id
-                )
-            except RuntimeError:
-                pass
-    
-    @Slot(str)
-    def on_translation_error(self, error: str):
-        """Handle translation error for explanation workflow."""
-        coordinator = self.parent_ref
-        if coordinator:
-            try:
-                coordinator._handle_explanation_translation_error(error, self.cached, self.worker_id)
-            except RuntimeError:
-                pass
+# Block texts are re-normalized on every translate/explain click; memoize per text
+_normalize_cached = lru_cache(maxsize=512)(normalize_text)
 
 
 class SentenceAnalysisCoordinator(QObject):
@@ -163,6 +52,18 @@ class SentenceAnalysisCoordinator(QObject):
     explanation_failed = Signal(str)
     explanation_loading = Signal(str)
 
+    # Delay after a block is selected before its translation is fetched speculatively
+    SPECULATIVE_TRANSLATION_DELAY_MS = 150
+
+    # Concurrent API requests; the calls are network-bound, so a few threads suffice
+    API_MAX_THREADS = 4
+
+    # How long finished results are buffered before being written to the translation cache
+    CACHE_FLUSH_INTERVAL_MS = 500
+
+    # Max number of cache lookups (hits and misses) remembered in memory
+    CACHE_LOOKUP_MEMO_SIZE = 2000
+
     def __init__(
         self,
         main_window: MainWindow,
@@ -182,23 +83,64 @@ class SentenceAnalysisCoordinator(QObject):
         self.selected_block_text: Optional[str] = None
         self.current_volume_id: Optional[str] = None
         
-        # Thread pool for async API calls
-        self.thread_pool = QThreadPool.globalInstance()
-        print(f"Thread pool max threads: {self.thread_pool.maxThreadCount()}")
+        # Dedicated pool for async API calls, so volume loading and other users of the
+        # global pool cannot starve them (and they cannot starve the global pool)
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(self.API_MAX_THREADS)
+        logger.debug("Thread pool max threads: %s", self.thread_pool.maxThreadCount())
+
+        # Prime the translation connection in the background so the first click skips the handshake
+        api_key = self._current_api_key()
+        if api_key:
+            self.thread_pool.start(partial(self.translation_service.warm_up, api_key))
         
         # Track active workers to prevent race conditions
         # When state changes, we invalidate old workers so they don't update stale state
-        self._active_translation_worker_id: Optional[int] = None
-        self._active_explanation_worker_id: Optional[int] = None
+        self._valid_translation_ids: Set[int] = set()
+        self._valid_explanation_ids: Set[int] = set()
         self._worker_counter = 0  # Unique ID for each worker request
-        
-        # Keep references to helper objects so they don't get garbage collected
-        # while workers are running in background threads
-        self._translation_request_helper: Optional[_TranslationRequest] = None
-        self._explanation_request_helper: Optional[_ExplanationRequest] = None
-        self._explanation_translation_request_helper: Optional[_ExplanationTranslationRequest] = None
-
 
+        # LRU memo of cache lookups in front of the backing cache, kept in step with every put made here
+        self._cache_lookups: "OrderedDict[Tuple[str, str, str], Optional[CacheRecord]]" = OrderedDict()
+
+        # Records waiting to be written to the translation cache, coalesced per key
+        self._pending_puts: Dict[Tuple[str, str, str], CacheRecord] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.CACHE_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush_cache)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush_cache)
+
+        # In-flight API requests keyed by (volume_id, normalized, kind); each holds the
+        # (on_result, on_error) callbacks waiting on the single worker for that key
+        self._inflight_requests: Dict[
+            Tuple[str, str, str], List[Tuple[Callable, Optional[Callable]]]
+        ] = {}
+        # The (token, worker) serving each in-flight key, so it can be cancelled when the selection moves on
+        self._inflight_workers: Dict[
+            Tuple[str, str, str], Tuple[int, TranslationWorker | ExplanationWorker]
+        ] = {}
+
+        # Page warm-up batches in flight, keyed by a per-batch token, with the
+        # (volume_id, normalized) keys each one covers; keys are skipped while a batch holds them
+        self._batch_workers: Dict[int, Tuple[BatchTranslationWorker, List[Tuple[str, str]]]] = {}
+        self._batch_pending: Set[Tuple[str, str]] = set()
+        # (volume_id, normalized) keys the batch endpoint failed on; not retried this session
+        self._batch_failed: Set[Tuple[str, str]] = set()
+
+        # Source of the tokens that identify in-flight and warm-up workers in their signal callbacks
+        # (the callbacks must not reference the worker itself, or worker and callback keep each other alive)
+        self._token_counter = 0
+
+        # Debounced prefetch of the selected block's translation (restarted on every selection)
+        self._speculative_timer = QTimer(self)
+        self._speculative_timer.setSingleShot(True)
+        self._speculative_timer.setInterval(self.SPECULATIVE_TRANSLATION_DELAY_MS)
+        self._speculative_timer.timeout.connect(self._speculative_translate)
+
+    @Slot(str, str)
     def on_block_selected(self, block_text: str, volume_id: str) -> None:
         """
         Called when user clicks an OCR block.
@@ -209,13 +151,144 @@ class SentenceAnalysisCoordinator(QObject):
         """
         # Invalidate any pending workers when block selection changes
         # This prevents stale workers from updating UI with old data
-        self._active_translation_worker_id = None
-        self._active_explanation_worker_id = None
+        self._valid_translation_ids.clear()
+        self._valid_explanation_ids.clear()
+        self._cancel_inflight()
         
-        self.selected_block_text = block_text
-        self.current_volume_id = volume_id
+        # Index the new volume's stored translations off the UI thread (disk work stays off the API pool)
+        if volume_id and volume_id != self.current_volume_id:
+            self._cancel_batches()
+            QThreadPool.globalInstance().start(partial(self.translation_cache.preload, volume_id))
+
+        # Interned so repeat selections of the same block share one string (cheap hashing in the memo tables)
+        self.selected_block_text = sys.intern(block_text) if block_text else block_text
+        self.current_volume_id = sys.intern(volume_id) if volume_id else volume_id
         self.block_selected.emit(block_text)
+        self._speculative_timer.start()
+
+    @Slot()
+    def _speculative_translate(self) -> None:
+        """Fetch the selected block's translation into the cache ahead of a Translate click."""
+        api_key = self._current_api_key()
+        if not self.selected_block_text or not api_key or not self.current_volume_id:
+            return
+
+        normalized = _normalize_cached(self.selected_block_text)
+        cached = self._lookup_cached(normalized)
+        if cached and cached.translation:
+            return
+
+        self._worker_counter += 1
+        worker_id = self._worker_counter
+        self._valid_translation_ids.add(worker_id)
+
+        self._start_translation(
+            normalized,
+            api_key,
+            on_result=partial(self._handle_speculative_translation, normalized=normalized, worker_id=worker_id),
+        )
+
+    def _handle_speculative_translation(self, result, normalized: str, worker_id: int) -> None:
+        """Cache a speculative translation unless the selection has moved on; nothing is emitted."""
+        if worker_id not in self._valid_translation_ids or result.is_error:
+            return
+
+        record = CacheRecord(
+            normalized_text=normalized,
+            lang="en",
+            translation=result.text,
+            explanation=None,
+            model=result.model,
+            updated_at=datetime.now(),
+        )
+        self._store_cached(normalized, record)
 
+    def warm_page_translations(self, blocks: List[str], volume_id: str) -> None:
+        """
+        Fill the translation cache for a page's blocks with one batched request.
+
+        Blocks already cached, held by a running warm-up, or failed earlier in the
+        session are skipped.
+
+        Args:
+            blocks: Original Japanese text of each OCR block on the rendered page(s).
+            volume_id: Volume the rendered page(s) belong to (for cache keying).
+        """
+        api_key = self._current_api_key()
+        if not api_key or not volume_id or volume_id != self.current_volume_id:
+            return
+
+        pending: Dict[Tuple[str, str], str] = {}
+        for text in blocks:
+            key = (volume_id, _normalize_cached(text))
+            if not key[1] or key in pending or key in self._batch_pending or key in self._batch_failed:
+                continue
+            cached = self._lookup_cached(key[1])
+            if not (cached and cached.translation):
+                pending[key] = text
+        if not pending:
+            return
+
+        worker = BatchTranslationWorker(
+            translation_service=self.translation_service,
+            texts=list(pending.values()),
+            api_key=api_key,
+        )
+        self._token_counter += 1
+        token = self._token_counter
+        self._batch_workers[token] = (worker, list(pending))
+        self._batch_pending.update(pending)
+        worker.signals.batch_translation_result.connect(partial(self._handle_batch_translation, token=token))
+        worker.signals.error.connect(partial(self._handle_batch_translation_error, token=token))
+        self.thread_pool.start(worker)
+
+    def _handle_batch_translation(self, results, token: int) -> None:
+        """Cache the successful results of a page warm-up and remember the failures; nothing is emitted."""
+        entry = self._batch_workers.pop(token, None)
+        if entry is None:
+            return
+        keys = entry[1]
+        self._batch_pending.difference_update(keys)
+
+        for key, result in zip(keys, results):
+            if result.is_error:
+                self._batch_failed.add(key)
+                continue
+            # Batches of an earlier volume were cancelled, so key is in the current one
+            normalized = key[1]
+            record = CacheRecord(
+                normalized_text=normalized,
+                lang="en",
+                translation=result.text,
+                explanation=None,
+                model=result.model,
+                updated_at=datetime.now(),
+            )
+            self._store_cached(normalized, record)
+
+    def _handle_batch_translation_error(self, error: str, token: int) -> None:
+        """Remember every block of a failed page warm-up so it is not requested again."""
+        entry = self._batch_workers.pop(token, None)
+        if entry is None:
+            return
+        keys = entry[1]
+        self._batch_pending.difference_update(keys)
+        self._batch_failed.update(keys)
+        logger.warning("Page translation warm-up failed: %s", error)
+
+    @Slot()
+    def on_volume_changed(self) -> None:
+        """Called when another volume is opened; its pages no longer need the running warm-ups."""
+        self._cancel_batches()
+
+    def _cancel_batches(self) -> None:
+        """Cancel every running page warm-up and release the blocks it held."""
+        for worker, _ in self._batch_workers.values():
+            worker.cancel()
+        self._batch_workers.clear()
+        self._batch_pending.clear()
+
+    @Slot()
     def request_translation(self) -> None:
         """Request translation of the currently selected block."""
         if not self.selected_block_text:
@@ -233,13 +306,9 @@ class SentenceAnalysisCoordinator(QObject):
 
         self.translation_started.emit()
         
-        normalized = normalize_text(self.selected_block_text)
+        normalized = _normalize_cached(self.selected_block_text)
         
-        cached = self.translation_cache.get(
-            volume_id=self.current_volume_id,
-            normalized_text=normalized,
-            lang="en"
-        )
+        cached = self._lookup_cached(normalized)
         
         if cached and cached.translation:
             self.translation_completed.emit(cached.translation)
@@ -248,26 +317,96 @@ class SentenceAnalysisCoordinator(QObject):
         # Generate unique ID for this worker to detect stale completions
         self._worker_counter += 1
         worker_id = self._worker_counter
-        self._active_translation_worker_id = worker_id
+        self._valid_translation_ids.add(worker_id)
         
-        # Run API call in background thread
+        # Run API call in background thread (or join one already running for this text)
+        self._start_translation(
+            normalized,
+            api_key,
+            on_result=partial(self._handle_translation_result, normalized=normalized, worker_id=worker_id),
+            on_error=partial(self._handle_translation_error, worker_id=worker_id),
+        )
+
+    def _start_translation(
+        self,
+        normalized: str,
+        api_key: str,
+        on_result: Callable,
+        on_error: Optional[Callable] = None,
+    ) -> None:
+        """Translate the selected block, sharing one worker between identical requests."""
+        key = (self.current_volume_id, normalized, "translate")
+        if self._join_inflight(key, on_result, on_error):
+            return
+
         worker = TranslationWorker(
             translation_service=self.translation_service,
             text=self.selected_block_text,
             api_key=api_key,
         )
-        
-        # Use helper object to manage signal connections safely
-        # IMPORTANT: Store reference so it doesn't get garbage collected while worker runs
-        request_helper = _TranslationRequest(normalized, worker_id, self)
-        self._translation_request_helper = request_helper
-        
-        worker.signals.translation_result.connect(request_helper.on_translation_result)
-        worker.signals.error.connect(request_helper.on_translation_error)
-        
-        # Start the worker
+        self._watch_inflight(key, worker, worker.signals.translation_result)
         self.thread_pool.start(worker)
 
+    def _start_explanation(
+        self,
+        normalized: str,
+        translation_text: Optional[str],
+        api_key: str,
+        on_result: Callable,
+        on_error: Optional[Callable] = None,
+    ) -> None:
+        """Explain the selected block (translating it too if translation_text is None), sharing one worker between identical requests."""
+        kind = "explain" if translation_text is not None else "translate+explain"
+        key = (self.current_volume_id, normalized, kind)
+        if self._join_inflight(key, on_result, on_error):
+            return
+
+        worker = ExplanationWorker(
+            explanation_service=self.explanation_service,
+            original_jp=self.selected_block_text,
+            translation_en=translation_text,
+            api_key=api_key,
+        )
+        self._watch_inflight(key, worker, worker.signals.explanation_result)
+        self.thread_pool.start(worker)
+
+    def _join_inflight(self, key: Tuple[str, str, str], on_result: Callable, on_error: Optional[Callable]) -> bool:
+        """Register callbacks for key; return True if a worker for it is already running."""
+        waiters = self._inflight_requests.get(key)
+        if waiters is not None:
+            waiters.append((on_result, on_error))
+            return True
+        self._inflight_requests[key] = [(on_result, on_error)]
+        return False
+
+    def _watch_inflight(self, key: Tuple[str, str, str], worker, result_signal) -> None:
+        """Fan a worker's outcome out to everyone waiting on key."""
+        self._token_counter += 1
+        token = self._token_counter
+        self._inflight_workers[key] = (token, worker)
+        # Worker signals live on the GUI thread, so these callbacks are queued back to it
+        result_signal.connect(partial(self._finish_inflight, key=key, token=token, failed=False))
+        worker.signals.error.connect(partial(self._finish_inflight, key=key, token=token, failed=True))
+
+    def _finish_inflight(self, outcome, key: Tuple[str, str, str], token: int, failed: bool) -> None:
+        """Deliver a worker's result (or error message) to every callback waiting on key."""
+        # A cancelled worker may still deliver an outcome queued before cancellation
+        current = self._inflight_workers.get(key)
+        if current is None or current[0] != token:
+            return
+        del self._inflight_workers[key]
+        for on_result, on_error in self._inflight_requests.pop(key, []):
+            callback = on_error if failed else on_result
+            if callback is not None:
+                callback(outcome)
+
+    def _cancel_inflight(self) -> None:
+        """Cancel every running API worker; their waiters belong to a selection that is gone."""
+        for _, worker in self._inflight_workers.values():
+            worker.cancel()
+        self._inflight_workers.clear()
+        self._inflight_requests.clear()
+
     def _handle_translation_result(self, result, normalized: str, worker_id: int) -> None:
         """
         Handle translation result from worker thread (runs in main thread).
@@ -278,8 +417,8 @@ class SentenceAnalysisCoordinator(QObject):
             worker_id: ID of the worker that produced this result
         """
         # Ignore results from stale workers (user may have navigated or selected different block)
-        if worker_id != self._active_translation_worker_id:
-            print(f"DEBUG: Ignoring stale translation result (worker {worker_id}, current {self._active_translation_worker_id})")
+        if worker_id not in self._valid_translation_ids:
+            logger.debug("Ignoring stale translation result (worker %s)", worker_id)
             return
         
         if result.is_error:
@@ -295,12 +434,7 @@ class SentenceAnalysisCoordinator(QObject):
             updated_at=datetime.now(),
         )
         
-        self.translation_cache.put(
-            volume_id=self.current_volume_id,
-            normalized_text=normalized,
-            lang="en",
-            record=record,
-        )
+        self._store_cached(normalized, record)
         
         self.translation_completed.emit(result.text)
 
@@ -313,12 +447,13 @@ class SentenceAnalysisCoordinator(QObject):
             worker_id: ID of the worker that produced this error
         """
         # Ignore errors from stale workers
-        if worker_id != self._active_translation_worker_id:
-            print(f"DEBUG: Ignoring stale translation error (worker {worker_id}, current {self._active_translation_worker_id})")
+        if worker_id not in self._valid_translation_ids:
+            logger.debug("Ignoring stale translation error (worker %s)", worker_id)
             return
         
         self.translation_failed.emit(error)
 
+    @Slot()
     def request_explanation(self) -> None:
         """Request explanation of the currently selected block with translation fallback."""
         if not self.selected_block_text:
@@ -336,18 +471,14 @@ class SentenceAnalysisCoordinator(QObject):
 
         self.explanation_requested.emit(self.selected_block_text)
         self.explanation_started.emit()
-        normalized = normalize_text(self.selected_block_text)
+        normalized = _normalize_cached(self.selected_block_text)
         
         # Generate unique ID for this explanation request sequence
         self._worker_counter += 1
         worker_id = self._worker_counter
-        self._active_explanation_worker_id = worker_id
+        self._valid_explanation_ids.add(worker_id)
 
-        cached = self.translation_cache.get(
-            volume_id=self.current_volume_id,
-            normalized_text=normalized,
-            lang="en",
-        )
+        cached = self._lookup_cached(normalized)
 
         if cached and cached.explanation:
             if cached.translation:
@@ -359,9 +490,9 @@ class SentenceAnalysisCoordinator(QObject):
         translation_model = cached.model if cached else ""
 
         if not translation_text:
-            # Need to fetch translation first, then explanation
-            self.explanation_loading.emit("Fetching translation...")
-            self._request_translation_for_explanation(
+            # No translation yet: get both from a single call
+            self.explanation_loading.emit("Analyzing...")
+            self._request_translation_and_explanation(
                 api_key=api_key,
                 normalized=normalized,
                 cached=cached,
@@ -382,88 +513,49 @@ class SentenceAnalysisCoordinator(QObject):
                 worker_id=worker_id,
             )
 
-    def _request_translation_for_explanation(
+    def _request_translation_and_explanation(
         self, api_key: str, normalized: str, cached, worker_id: int
     ) -> None:
-        """Request translation as first step before explanation (async)."""
-        worker = TranslationWorker(
-            translation_service=self.translation_service,
-            text=self.selected_block_text,
-            api_key=api_key,
+        """Request translation and explanation together in one API call (async)."""
+        self._start_explanation(
+            normalized,
+            None,
+            api_key,
+            on_result=partial(
+                self._handle_translation_and_explanation,
+                normalized=normalized,
+                cached=cached,
+                worker_id=worker_id,
+            ),
+            on_error=partial(self._handle_explanation_error, cached=cached, worker_id=worker_id),
         )
 
-        # Use helper object to manage signal connections safely
-        # IMPORTANT: Store reference so it doesn't get garbage collected while worker runs
-        request_helper = _ExplanationTranslationRequest(normalized, cached, api_key, worker_id, self)
-        self._explanation_translation_request_helper = request_helper
-        
-        worker.signals.translation_result.connect(request_helper.on_translation_result)
-        worker.signals.error.connect(request_helper.on_translation_error)
-
-        # Start the worker
-        self.thread_pool.start(worker)
-
-    def _handle_translation_for_explanation(
-        self, result, normalized: str, cached, api_key: str, worker_id: int
-    ) -> None:
-        """Handle translation result when it's part of explanation workflow."""
+    def _handle_translation_and_explanation(self, result, normalized: str, cached, worker_id: int) -> None:
+        """Handle a combined translate+explain result (runs in main thread)."""
         # Ignore results from stale workers
-        if worker_id != self._active_explanation_worker_id:
-            print(f"DEBUG: Ignoring stale explanation translation result (worker {worker_id}, current {self._active_explanation_worker_id})")
+        if worker_id not in self._valid_explanation_ids:
+            logger.debug("Ignoring stale translate+explain result (worker %s)", worker_id)
             return
-        
-        if result.is_error:
+
+        if not result.is_success() or not result.translation:
             if cached and cached.explanation:
                 self.explanation_completed.emit(f"{cached.explanation}\n\n(cached)")
             else:
                 self.explanation_failed.emit(result.error or "Unknown error")
             return
 
-        translation_text = result.text
-        translation_model = result.model
-
-        # Store translation in cache
         record = CacheRecord(
             normalized_text=normalized,
             lang="en",
-            translation=translation_text,
-            explanation=cached.explanation if cached else None,
-            model=translation_model,
+            translation=result.translation,
+            explanation=result.text,
+            model=result.model,
             updated_at=datetime.now(),
         )
+        self._store_cached(normalized, record)
 
-        self.translation_cache.put(
-            volume_id=self.current_volume_id,
-            normalized_text=normalized,
-            lang="en",
-            record=record,
-        )
-
-        # Emit translation to UI
-        self.translation_completed.emit(translation_text)
-
-        # Now request explanation with the translation
-        self.explanation_loading.emit("Analyzing...")
-        self._request_explanation_with_translation(
-            api_key=api_key,
-            normalized=normalized,
-            translation_text=translation_text,
-            translation_model=translation_model,
-            cached=cached,
-            worker_id=worker_id,
-        )
-
-    def _handle_explanation_translation_error(self, error: str, cached, worker_id: int) -> None:
-        """Handle error when fetching translation for explanation."""
-        # Ignore errors from stale workers
-        if worker_id != self._active_explanation_worker_id:
-            print(f"DEBUG: Ignoring stale explanation translation error (worker {worker_id}, current {self._active_explanation_worker_id})")
-            return
-        
-        if cached and cached.explanation:
-            self.explanation_completed.emit(f"{cached.explanation}\n\n(cached)")
-        else:
-            self.explanation_failed.emit(error)
+        self.translation_completed.emit(result.translation)
+        self.explanation_completed.emit(result.text)
 
     def _request_explanation_with_translation(
         self,
@@ -475,25 +567,20 @@ class SentenceAnalysisCoordinator(QObject):
         worker_id: int,
     ) -> None:
         """Request explanation with translation already available (async)."""
-        worker = ExplanationWorker(
-            explanation_service=self.explanation_service,
-            original_jp=self.selected_block_text,
-            translation_en=translation_text,
-            api_key=api_key,
-        )
-
-        # Use helper object to manage signal connections safely
-        # IMPORTANT: Store reference so it doesn't get garbage collected while worker runs
-        request_helper = _ExplanationRequest(
-            normalized, worker_id, translation_text, translation_model, cached, self
+        self._start_explanation(
+            normalized,
+            translation_text,
+            api_key,
+            on_result=partial(
+                self._handle_explanation_result,
+                normalized=normalized,
+                translation_text=translation_text,
+                translation_model=translation_model,
+                cached=cached,
+                worker_id=worker_id,
+            ),
+            on_error=partial(self._handle_explanation_error, cached=cached, worker_id=worker_id),
         )
-        self._explanation_request_helper = request_helper
-        
-        worker.signals.explanation_result.connect(request_helper.on_explanation_result)
-        worker.signals.error.connect(request_helper.on_explanation_error)
-
-        # Start the worker
-        self.thread_pool.start(worker)
 
     def _handle_explanation_result(
         self,
@@ -506,8 +593,8 @@ class SentenceAnalysisCoordinator(QObject):
     ) -> None:
         """Handle explanation result from worker thread (runs in main thread)."""
         # Ignore results from stale workers
-        if worker_id != self._active_explanation_worker_id:
-            print(f"DEBUG: Ignoring stale explanation result (worker {worker_id}, current {self._active_explanation_worker_id})")
+        if worker_id not in self._valid_explanation_ids:
+            logger.debug("Ignoring stale explanation result (worker %s)", worker_id)
             return
         
         if not result.is_success():
@@ -526,20 +613,15 @@ class SentenceAnalysisCoordinator(QObject):
             updated_at=datetime.now(),
         )
 
-        self.translation_cache.put(
-            volume_id=self.current_volume_id,
-            normalized_text=normalized,
-            lang="en",
-            record=record_to_store,
-        )
+        self._store_cached(normalized, record_to_store)
 
         self.explanation_completed.emit(result.text)
 
     def _handle_explanation_error(self, error: str, cached, worker_id: int) -> None:
         """Handle error from explanation worker."""
         # Ignore errors from stale workers
-        if worker_id != self._active_explanation_worker_id:
-            print(f"DEBUG: Ignoring stale explanation error (worker {worker_id}, current {self._active_explanation_worker_id})")
+        if worker_id not in self._valid_explanation_ids:
+            logger.debug("Ignoring stale explanation error (worker %s)", worker_id)
             return
         
         if cached and cached.explanation:
@@ -547,15 +629,64 @@ class SentenceAnalysisCoordinator(QObject):
         else:
             self.explanation_failed.emit(error)
 
+    @Slot()
     def on_panel_closed(self) -> None:
         """Called when user closes the panel."""
         # Invalidate any pending workers when panel closes
-        self._active_translation_worker_id = None
-        self._active_explanation_worker_id = None
+        self._valid_translation_ids.clear()
+        self._valid_explanation_ids.clear()
+        self._cancel_inflight()
+        self._cancel_batches()
+        self._speculative_timer.stop()
+        self.flush_cache()
         
         self.selected_block_text = None
         self.panel_closed.emit()
 
+    def _lookup_cached(self, normalized: str) -> Optional[CacheRecord]:
+        """Return the cached record for the selected volume, consulting the backing cache once per key."""
+        key = (self.current_volume_id, normalized, "en")
+        if key in self._cache_lookups:
+            self._cache_lookups.move_to_end(key)
+            return self._cache_lookups[key]
+        record = self.translation_cache.get(
+            volume_id=self.current_volume_id,
+            normalized_text=normalized,
+            lang="en",
+        )
+        self._remember_lookup(key, record)
+        return record
+
+    def _store_cached(self, normalized: str, record: CacheRecord) -> None:
+        """Queue a record for the translation cache and keep the lookup memo in step."""
+        key = (self.current_volume_id, normalized, "en")
+        self._remember_lookup(key, record)
+        self._pending_puts[key] = record
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @Slot()
+    def flush_cache(self) -> None:
+        """Write all buffered records to the translation cache, one batch per volume."""
+        self._flush_timer.stop()
+        if not self._pending_puts:
+            return
+
+        by_volume: Dict[str, List[Tuple[str, str, CacheRecord]]] = {}
+        for (volume_id, normalized, lang), record in self._pending_puts.items():
+            by_volume.setdefault(volume_id, []).append((normalized, lang, record))
+        self._pending_puts = {}
+
+        for volume_id, entries in by_volume.items():
+            self.translation_cache.put_many(volume_id, entries)
+
+    def _remember_lookup(self, key: Tuple[str, str, str], record: Optional[CacheRecord]) -> None:
+        """Record a lookup result, evicting the least recently used entry when full."""
+        self._cache_lookups[key] = record
+        self._cache_lookups.move_to_end(key)
+        if len(self._cache_lookups) > self.CACHE_LOOKUP_MEMO_SIZE:
+            self._cache_lookups.popitem(last=False)
+
     def actions_enabled(self) -> bool:
         """Return True if translation/explanation actions should be enabled."""
         return bool(self._current_api_key()) and self.selected_block_text is not None
@@ -115,22 +115,9 @@ class DoublePageMode(ViewMode):
         current_page_number: int,
     ) -> List[MangaPage]:
         vol = _require_volume(volume)
-        current_page = vol.get_page(current_page_number)
-
-        # Landscape pages render alone
-        if not current_page.is_portrait():
-            return [current_page]
-
-        # Last page renders alone
-        if current_page_number >= vol.total_pages - 1:
-            return [current_page]
-
-        next_page = vol.get_page(current_page_number + 1)
-
-        # Pair portrait pages; otherwise render only current
-        if next_page.is_portrait():
-            return [current_page, next_page]
-        return [current_page]
+        # Landscape pages and the last page render alone; portrait pages pair up
+        spread_length = vol.double_spread_length(current_page_number)
+        return vol.pages[current_page_number:current_page_number + spread_length]
 
     def next_page_number(
         self,
@@ -139,8 +126,7 @@ class DoublePageMode(ViewMode):
     ) -> int:
 
         vol = _require_volume(volume)
-        pages_displayed = len(self.pages_to_render(vol, current_page_number))
-        next_index = current_page_number + pages_displayed
+        next_index = current_page_number + vol.double_spread_length(current_page_number)
         if next_index < vol.total_pages:
             return next_index
         return current_page_number
@@ -156,13 +142,9 @@ class DoublePageMode(ViewMode):
             return current_page_number
 
         # When possible, step back two pages if the previous spread was double portrait
-        if current_page_number >= 2:
-            if not (0 <= current_page_number - 2 < vol.total_pages):
-                return current_page_number - 1
-            prev_page = vol.get_page(current_page_number - 2)
-            current_prev = vol.get_page(current_page_number - 1)
-            if prev_page.is_portrait() and current_prev.is_portrait():
-                return current_page_number - 2
+        previous_start = current_page_number - 2
+        if 0 <= previous_start < vol.total_pages and vol.double_spread_length(previous_start) == 2:
+            return previous_start
         return current_page_number - 1
 
     def page_for_appearance(
@@ -176,16 +158,12 @@ class DoublePageMode(ViewMode):
         if not (0 <= target_page_index < vol.total_pages):
             return current_page_number
 
-        target_page = vol.get_page(target_page_index)
-
-        if not target_page.is_portrait():
+        if not vol.is_portrait(target_page_index):
             return target_page_index
 
         # Place portrait page on the left of a spread when possible
-        if target_page_index > 0 and (0 <= target_page_index - 1 < vol.total_pages):
-            prev_page = vol.get_page(target_page_index - 1)
-            if prev_page.is_portrait():
-                return target_page_index - 1
+        if target_page_index > 0 and vol.is_portrait(target_page_index - 1):
+            return target_page_index - 1
         return target_page_index
 
     def context_view_mode(self) -> ViewMode:
@@ -198,15 +176,19 @@ class DoublePageMode(ViewMode):
 SINGLE_PAGE_MODE = SinglePageMode()
 DOUBLE_PAGE_MODE = DoublePageMode()
 
+_VIEW_MODES = {mode.name: mode for mode in (SINGLE_PAGE_MODE, DOUBLE_PAGE_MODE)}
+
 
 def create_view_mode(mode: str) -> ViewMode:
     """Factory returning the appropriate view mode state.
 
+    Always returns the shared SINGLE_PAGE_MODE / DOUBLE_PAGE_MODE instances, so
+    callers may compare modes by identity.
+
     Raises:
         ValueError: If an unknown mode name is provided.
     """
-    if mode == "double":
-        return DOUBLE_PAGE_MODE
-    if mode == "single":
-        return SINGLE_PAGE_MODE
-    raise ValueError(f"Unknown view mode: {mode}")
+    view_mode = _VIEW_MODES.get(mode)
+    if view_mode is None:
+        raise ValueError(f"Unknown view mode: {mode}")
+    return view_mode
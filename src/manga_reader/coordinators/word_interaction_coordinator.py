@@ -1,6 +1,8 @@
 """Word Interaction Coordinator - Handles word clicks and vocabulary tracking."""
 
-from typing import Optional
+import sys
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 from PySide6.QtCore import QObject, Slot
 
@@ -20,6 +22,9 @@ class WordInteractionCoordinator(QObject):
     - Provide page/block context for tracking
     """
 
+    # Dictionary popup payloads kept for repeat clicks, keyed by (lemma, surface)
+    POPUP_CACHE_SIZE = 128
+
     def __init__(
         self,
         canvas: MangaCanvas,
@@ -44,6 +49,10 @@ class WordInteractionCoordinator(QObject):
         self._current_volume: Optional[MangaVolume] = None
         self._current_page: int = 0
 
+        # Mouse- and tracking-independent part of recent popup payloads
+        self._payload_cache: "OrderedDict[Tuple[str, str], dict]" = OrderedDict()
+
+    @Slot(object, int)
     def set_volume_context(self, volume: Optional[MangaVolume], current_page: int):
         """
         Update the current volume context (called by ReaderController).
@@ -69,6 +78,10 @@ class WordInteractionCoordinator(QObject):
         if self.dictionary_service is None:
             return
 
+        # Lemmas recur across clicks, the tracked-word index and the popup cache
+        lemma = sys.intern(lemma)
+        surface = sys.intern(surface)
+
         # Store click context
         self.last_clicked_lemma = lemma
         self.last_clicked_page_index = page_index if page_index >= 0 else self._current_page
@@ -97,11 +110,27 @@ class WordInteractionCoordinator(QObject):
                     "height": clicked_block.height,
                 }
 
-        entry = self.dictionary_service.lookup(lemma, surface)
-
         # Check if word is already tracked
         is_tracked = self.vocabulary_service.is_word_tracked(lemma)
 
+        payload = {
+            **self._entry_payload(lemma, surface),
+            "mouseX": mouse_x,
+            "mouseY": mouse_y,
+            "isTracked": is_tracked,
+        }
+
+        self.canvas.show_dictionary_popup(payload)
+
+    def _entry_payload(self, lemma: str, surface: str) -> dict:
+        """Return the dictionary part of the popup payload, reusing recent lookups."""
+        key = (lemma, surface)
+        cached = self._payload_cache.get(key)
+        if cached is not None:
+            self._payload_cache.move_to_end(key)
+            return cached
+
+        entry = self.dictionary_service.lookup(lemma, surface)
         payload = {
             # Normalize display to lemma so popup header shows base form (not conjugated surface)
             "surface": lemma or surface,
@@ -115,18 +144,20 @@ class WordInteractionCoordinator(QObject):
             ]
             if entry
             else [],
-            "mouseX": mouse_x,
-            "mouseY": mouse_y,
             "notFound": entry is None,
-            "isTracked": is_tracked,
             "lemma": lemma,
         }
 
-        self.canvas.show_dictionary_popup(payload)
+        self._payload_cache[key] = payload
+        if len(self._payload_cache) > self.POPUP_CACHE_SIZE:
+            self._payload_cache.popitem(last=False)
+        return payload
 
     @Slot(str, str, str)
     def handle_track_word(self, lemma: str, reading: str, part_of_speech: str):
         """Handle tracking a word from the dictionary popup."""
+        lemma = sys.intern(lemma)
+        part_of_speech = sys.intern(part_of_speech)
         if self._current_volume is None:
             raise RuntimeError("No volume loaded for tracking word")
         if self.last_clicked_block_text is None:
@@ -156,19 +187,20 @@ class WordInteractionCoordinator(QObject):
                 crop_coordinates=crop_coords,
                 sentence_text=sentence,
             )
-
-            # Update UI to show tracked status (mark word with black border)
-            self.canvas.add_tracked_lemma(lemma)
-            
-            # Update popup to show tracking state changed
-            self.canvas.mark_popup_word_as_tracked()
-
-            self.main_window.show_info(
-                "Word Tracked",
-                f"Added '{lemma}' to your vocabulary!\nReading: {reading}\nType: {part_of_speech}",
-            )
         except Exception as e:
             self.main_window.show_error(
                 "Tracking Failed",
                 f"Could not track word: {e}",
             )
+            return
+
+        # Update UI to show tracked status (mark word with black border)
+        self.canvas.add_tracked_lemma(lemma)
+
+        # Update popup to show tracking state changed
+        self.canvas.mark_popup_word_as_tracked()
+
+        self.main_window.show_info(
+            "Word Tracked",
+            f"Added '{lemma}' to your vocabulary!\nReading: {reading}\nType: {part_of_speech}",
+        )
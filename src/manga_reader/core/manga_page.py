@@ -1,13 +1,17 @@
 """MangaPage entity - represents a single page with OCR blocks."""
 
 from dataclasses import dataclass, field
+from math import floor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .ocr_block import OCRBlock
 
+# Side length (in page pixels) of the cells used to index blocks for hit-testing
+BLOCK_GRID_CELL_SIZE = 64
 
-@dataclass
+
+@dataclass(slots=True)
 class MangaPage:
     """Represents a single page containing page dimensions and a list of OCR blocks."""
     
@@ -16,17 +20,46 @@ class MangaPage:
     width: int
     height: int
     ocr_blocks: List[OCRBlock] = field(default_factory=list)
+    # Lazily built grid: cell -> (left, top, right, bottom, index) of blocks overlapping that cell
+    _block_grid: Optional[Dict[Tuple[int, int], List[Tuple[float, float, float, float, int]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _block_grid_size: int = field(default=0, init=False, repr=False, compare=False)
+    # Joined page text, valid while the block count is unchanged
+    _all_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _all_text_size: int = field(default=0, init=False, repr=False, compare=False)
     
     def find_block_at_position(self, x: float, y: float) -> Optional[OCRBlock]:
         """Find the OCR block that contains the given coordinates."""
-        for block in self.ocr_blocks:
-            if block.contains_point(x, y):
-                return block
+        if self._block_grid is None or self._block_grid_size != len(self.ocr_blocks):
+            self._build_block_grid()
+        cell = (floor(x / BLOCK_GRID_CELL_SIZE), floor(y / BLOCK_GRID_CELL_SIZE))
+        for left, top, right, bottom, index in self._block_grid.get(cell, ()):
+            if left <= x <= right and top <= y <= bottom:
+                return self.ocr_blocks[index]
         return None
+
+    def _build_block_grid(self) -> None:
+        """Index every block's bounding box under each grid cell it touches."""
+        grid: Dict[Tuple[int, int], List[Tuple[float, float, float, float, int]]] = {}
+        for index, block in enumerate(self.ocr_blocks):
+            bounds = (block.x, block.y, block.x + block.width, block.y + block.height, index)
+            first_col = floor(bounds[0] / BLOCK_GRID_CELL_SIZE)
+            last_col = floor(bounds[2] / BLOCK_GRID_CELL_SIZE)
+            first_row = floor(bounds[1] / BLOCK_GRID_CELL_SIZE)
+            last_row = floor(bounds[3] / BLOCK_GRID_CELL_SIZE)
+            for col in range(first_col, last_col + 1):
+                for row in range(first_row, last_row + 1):
+                    grid.setdefault((col, row), []).append(bounds)
+        self._block_grid = grid
+        self._block_grid_size = len(self.ocr_blocks)
     
     def get_all_text(self) -> str:
         """Returns all text content on this page."""
-        return "\n".join(block.full_text for block in self.ocr_blocks)
+        if self._all_text is None or self._all_text_size != len(self.ocr_blocks):
+            self._all_text = "\n".join(block.full_text for block in self.ocr_blocks)
+            self._all_text_size = len(self.ocr_blocks)
+        return self._all_text
     
     def is_portrait(self) -> bool:
         """Returns True if the page is in portrait orientation (height > width)."""
@@ -7,7 +7,7 @@ from typing import List, Optional
 from .manga_page import MangaPage
 
 
-@dataclass
+@dataclass(slots=True)
 class MangaVolume:
     """Acts as the authoritative expert on a specific book's content."""
     
@@ -15,6 +15,9 @@ class MangaVolume:
     volume_path: Path
     pages: List[MangaPage] = field(default_factory=list)
     volume_id: Optional[int] = None  # Database ID if loaded from library, None if opened directly
+    # Bit i is set when page i is portrait; rebuilt whenever the page count changes
+    _portrait_mask: int = field(default=0, init=False, repr=False, compare=False)
+    _portrait_mask_size: int = field(default=0, init=False, repr=False, compare=False)
     
     @property
     def total_pages(self) -> int:
@@ -34,6 +37,46 @@ class MangaVolume:
     def add_page(self, page: MangaPage) -> None:
         """Add a page to this volume."""
         self.pages.append(page)
+        if self._portrait_mask_size == len(self.pages) - 1:
+            self._portrait_mask |= int(page.is_portrait()) << self._portrait_mask_size
+            self._portrait_mask_size = len(self.pages)
+
+    def set_pages(self, pages: List[MangaPage]) -> None:
+        """Replace all pages of this volume at once."""
+        self.pages = list(pages)
+        self._portrait_mask_size = -1
+        self._portrait_bits()
+
+    def is_portrait(self, page_number: int) -> bool:
+        """Whether the page at page_number is portrait (False when out of bounds)."""
+        if page_number < 0:
+            return False
+        return bool(self._portrait_bits() >> page_number & 1)
+
+    def double_spread_length(self, page_number: int) -> int:
+        """Number of pages (1 or 2) in the two-page spread starting at page_number.
+
+        Portrait pages pair with a following portrait page; landscape pages
+        and the last page stand alone.
+
+        Raises:
+            ValueError: if page_number is out of bounds.
+        """
+        if not (0 <= page_number < self.total_pages):
+            self.get_page(page_number)
+        # Bits past the last page are clear, so the last page never pairs
+        return 2 if self._portrait_bits() >> page_number & 0b11 == 0b11 else 1
+
+    def _portrait_bits(self) -> int:
+        """Return the portrait bitmask, rebuilding it if pages were replaced."""
+        if self._portrait_mask_size != len(self.pages):
+            mask = 0
+            for index, page in enumerate(self.pages):
+                if page.is_portrait():
+                    mask |= 1 << index
+            self._portrait_mask = mask
+            self._portrait_mask_size = len(self.pages)
+        return self._portrait_mask
     
     def validate_coordinates(self, page_number: int, x: float, y: float) -> bool:
         """Validate if coordinates are within a page's bounds."""
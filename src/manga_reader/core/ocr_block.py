@@ -1,10 +1,10 @@
 """OCR Block entity - represents a single text area with bounding box."""
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OCRBlock:
     """Represents a single text area with its bounding box coordinates, orientation, and raw lines of text."""
     
@@ -12,13 +12,14 @@ class OCRBlock:
     y: float
     width: float
     height: float
-    text_lines: List[str]
+    text_lines: Tuple[str, ...]
     orientation: str = "vertical"  # Default for Japanese manga
+    full_text: str = field(init=False, repr=False, compare=False)
     
-    @property
-    def full_text(self) -> str:
-        """Returns all text lines concatenated."""
-        return "".join(self.text_lines)
+    def __post_init__(self) -> None:
+        # Blocks are immutable after ingest, so the joined text is computed once
+        object.__setattr__(self, "text_lines", tuple(self.text_lines))
+        object.__setattr__(self, "full_text", "".join(self.text_lines))
     
     def contains_point(self, x: float, y: float) -> bool:
         """Check if a point is within this block's bounding box."""
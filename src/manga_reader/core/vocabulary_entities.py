@@ -1,6 +1,7 @@
 """Vocabulary tracking entities used across services and persistence."""
 
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -13,15 +14,20 @@ class TrackedWord:
     part_of_speech: str
     date_added: Optional[str]
 
+    @cached_property
+    def display_line(self) -> str:
+        """Bullet line used when listing the word (built once per instance)."""
+        return f"• {self.lemma} ({self.reading}) - {self.part_of_speech}"
 
-@dataclass
+
+@dataclass(slots=True)
 class MangaVolumeEntry:
     id: Optional[int]
     path: Path
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WordAppearance:
     id: Optional[int]
     word_id: int
@@ -3,91 +3,95 @@
 import json
 import sqlite3
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from manga_reader.core import MangaVolumeEntry, TrackedWord, WordAppearance
 
+# Stored in PRAGMA user_version once the schema is in place; bump it whenever
+# _SCHEMA_SQL or the backfill in ensure_schema changes
+_SCHEMA_VERSION = 1
+
+# Whole schema as one script, applied in a single transaction
+_SCHEMA_SQL = """
+BEGIN;
+CREATE TABLE IF NOT EXISTS tracked_words (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    lemma TEXT NOT NULL UNIQUE,
+    reading TEXT NOT NULL DEFAULT '',
+    part_of_speech TEXT NOT NULL DEFAULT '',
+    date_added TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS manga_volumes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS word_appearances (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    word_id INTEGER NOT NULL,
+    volume_id INTEGER NOT NULL,
+    page_index INTEGER NOT NULL,
+    crop_coordinates TEXT NOT NULL,
+    sentence_text TEXT NOT NULL DEFAULT '',
+
+    FOREIGN KEY(word_id) REFERENCES tracked_words(id) ON DELETE CASCADE,
+    FOREIGN KEY(volume_id) REFERENCES manga_volumes(id) ON DELETE CASCADE,
+    UNIQUE(word_id, volume_id, page_index, crop_coordinates)
+);
+CREATE TABLE IF NOT EXISTS library_volumes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    folder_path TEXT NOT NULL UNIQUE,
+    cover_image_path TEXT,
+    date_added INTEGER NOT NULL,
+    last_opened INTEGER NOT NULL,
+    last_page_read INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_tracked_words_lemma
+ON tracked_words(lemma);
+-- Matches list_appearances_for_word's filter and ORDER BY (the rowid id is
+-- implicitly the last index column), so results come out pre-sorted
+CREATE INDEX IF NOT EXISTS idx_word_appearances_word_volume_page
+ON word_appearances(word_id, volume_id, page_index);
+DROP INDEX IF EXISTS idx_word_appearances_word;
+COMMIT;
+"""
+
 
 class DatabaseManager:
     """Owns SQLite connection, schema, and vocabulary persistence helpers."""
 
     def __init__(self, db_path: Path) -> None:
         self.db_path = Path(db_path)
-        self.connection = sqlite3.connect(self.db_path)
+        # Statement cache shared with LibraryRepository, which reuses this connection
+        self.connection = sqlite3.connect(self.db_path, cached_statements=256)
         self.connection.row_factory = sqlite3.Row
         self.connection.execute("PRAGMA foreign_keys = ON;")
+        if str(db_path) != ":memory:":
+            # WAL lets readers run alongside writes; NORMAL skips the per-commit journal fsync
+            self.connection.execute("PRAGMA journal_mode = WAL;")
+            self.connection.execute("PRAGMA synchronous = NORMAL;")
+        self.connection.execute("PRAGMA temp_store = MEMORY;")
+        self.connection.execute("PRAGMA cache_size = -20000;")
+        # Volume rows by id, so new appearances get their volume name/path without a join
+        self._volumes_by_id: Dict[int, MangaVolumeEntry] = {}
+        self._volumes_by_path: Dict[str, MangaVolumeEntry] = {}
 
     def ensure_schema(self) -> None:
         """Create tables and indexes if they do not exist."""
-        cur = self.connection.cursor()
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tracked_words (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                lemma TEXT NOT NULL UNIQUE,
-                reading TEXT NOT NULL DEFAULT '',
-                part_of_speech TEXT NOT NULL DEFAULT '',
-                date_added TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
-            );
-            """
-        )
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS manga_volumes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                path TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            );
-            """
-        )
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS word_appearances (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                word_id INTEGER NOT NULL,
-                volume_id INTEGER NOT NULL,
-                page_index INTEGER NOT NULL,
-                crop_coordinates TEXT NOT NULL,
-                sentence_text TEXT NOT NULL DEFAULT '',
-
-                FOREIGN KEY(word_id) REFERENCES tracked_words(id) ON DELETE CASCADE,
-                FOREIGN KEY(volume_id) REFERENCES manga_volumes(id) ON DELETE CASCADE,
-                UNIQUE(word_id, volume_id, page_index, crop_coordinates)
-            );
-            """
-        )
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS library_volumes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                folder_path TEXT NOT NULL UNIQUE,
-                cover_image_path TEXT,
-                date_added INTEGER NOT NULL,
-                last_opened INTEGER NOT NULL,
-                last_page_read INTEGER NOT NULL DEFAULT 0
-            );
-            """
-        )
-        cur.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_tracked_words_lemma
-            ON tracked_words(lemma);
-            """
-        )
-        cur.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_word_appearances_word
-            ON word_appearances(word_id);
-            """
-        )
+        user_version = self.connection.execute("PRAGMA user_version;").fetchone()[0]
+        if user_version == _SCHEMA_VERSION:
+            return
+        self.connection.executescript(_SCHEMA_SQL)
         # Backfill schema changes for existing databases
+        cur = self.connection.cursor()
         cur.execute("PRAGMA table_info(library_volumes);")
         library_columns = {row[1] for row in cur.fetchall()}
         if "last_page_read" not in library_columns:
             cur.execute(
                 "ALTER TABLE library_volumes ADD COLUMN last_page_read INTEGER NOT NULL DEFAULT 0;"
             )
+        cur.execute(f"PRAGMA user_version = {_SCHEMA_VERSION};")
         self.connection.commit()
 
     # to be reviewed
@@ -97,35 +101,43 @@ class DatabaseManager:
         lemma = lemma.strip()
         reading = (reading or "").strip()
         part_of_speech = part_of_speech or ""
-        cur = self.connection.cursor()
-        cur.execute(
+        # Unchanged rows are not rewritten (nothing reaches the WAL) and return no row
+        row = self.connection.execute(
             """
             INSERT INTO tracked_words (lemma, reading, part_of_speech)
             VALUES (?, ?, ?)
             ON CONFLICT(lemma) DO UPDATE SET
                 reading = excluded.reading,
                 part_of_speech = excluded.part_of_speech
+            WHERE tracked_words.reading IS NOT excluded.reading
+                OR tracked_words.part_of_speech IS NOT excluded.part_of_speech
+            RETURNING id, lemma, reading, part_of_speech, date_added
             """,
             (lemma, reading, part_of_speech),
-        )
+        ).fetchone()
         self.connection.commit()
-        return self._get_tracked_word(lemma, reading)
+        if row is None:
+            return self._get_tracked_word(lemma, reading)
+        return self._row_to_tracked_word(row)
 
     def upsert_volume(self, path: Path, name: Optional[str] = None) -> MangaVolumeEntry:
         path_obj = Path(path).resolve()
         volume_name = name or path_obj.name
-        cur = self.connection.cursor()
-        cur.execute(
+        row = self.connection.execute(
             """
             INSERT INTO manga_volumes (path, name)
             VALUES (?, ?)
             ON CONFLICT(path) DO UPDATE SET
                 name = excluded.name
+            WHERE manga_volumes.name IS NOT excluded.name
+            RETURNING id, path, name
             """,
             (str(path_obj), volume_name),
-        )
+        ).fetchone()
         self.connection.commit()
-        return self._get_volume(path_obj)
+        if row is None:
+            return self._get_volume(path_obj)
+        return self._remember_volume(self._row_to_volume(row))
 
     def insert_word_appearance(
         self,
@@ -136,25 +148,57 @@ class DatabaseManager:
         sentence_text: str,
     ) -> WordAppearance:
         coords_json = json.dumps(crop_coordinates, ensure_ascii=True)
-        cur = self.connection.cursor()
         try:
-            cur.execute(
+            row = self.connection.execute(
                 """
                 INSERT INTO word_appearances (
                     word_id, volume_id, page_index, crop_coordinates, sentence_text
                 ) VALUES (?, ?, ?, ?, ?)
+                RETURNING id, word_id, volume_id, page_index, crop_coordinates, sentence_text
                 """,
                 (word_id, volume_id, page_index, coords_json, sentence_text or ""),
-            )
+            ).fetchone()
             self.connection.commit()
-            appearance_id = cur.lastrowid
         except sqlite3.IntegrityError as e:
             raise ValueError(
                 f"Word appearance already exists: word_id={word_id}, volume_id={volume_id}, "
                 f"page_index={page_index}"
             ) from e
         
-        return self._get_word_appearance_by_id(appearance_id)
+        appearance = self._row_to_word_appearance(row)
+        volume = self._get_volume_by_id(appearance.volume_id)
+        appearance.volume_name = volume.name
+        appearance.volume_path = volume.path
+        return appearance
+
+    def insert_word_appearances(
+        self,
+        rows: List[Tuple[int, int, int, Dict[str, float], str]],
+    ) -> List[bool]:
+        """Insert many (word_id, volume_id, page_index, crop_coordinates, sentence_text) rows in one transaction.
+
+        Rows that already exist are skipped. Returns, per row, whether it was inserted.
+        """
+        inserted: List[bool] = []
+        with self.connection:
+            cur = self.connection.cursor()
+            for word_id, volume_id, page_index, crop_coordinates, sentence_text in rows:
+                cur.execute(
+                    """
+                    INSERT OR IGNORE INTO word_appearances (
+                        word_id, volume_id, page_index, crop_coordinates, sentence_text
+                    ) VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (
+                        word_id,
+                        volume_id,
+                        page_index,
+                        json.dumps(crop_coordinates, ensure_ascii=True),
+                        sentence_text or "",
+                    ),
+                )
+                inserted.append(cur.rowcount == 1)
+        return inserted
 
     def list_tracked_words(self) -> List[TrackedWord]:
         cur = self.connection.cursor()
@@ -168,28 +212,34 @@ class DatabaseManager:
         rows = cur.fetchall()
         return [self._row_to_tracked_word(row) for row in rows]
 
-    def list_appearances_for_word(self, word_id: int) -> List[WordAppearance]:
+    def list_appearances_for_word(
+        self, word_id: int, limit: Optional[int] = None, offset: int = 0
+    ) -> List[WordAppearance]:
+        """List a word's appearances in reading order, optionally one page of results at a time."""
+        # Volume name/path come from the id cache rather than being joined onto every row
         cur = self.connection.cursor()
         cur.execute(
             """
-            SELECT
-                wa.id,
-                wa.word_id,
-                wa.volume_id,
-                wa.page_index,
-                wa.crop_coordinates,
-                wa.sentence_text,
-                mv.name AS volume_name,
-                mv.path AS volume_path
-            FROM word_appearances wa
-            JOIN manga_volumes mv ON wa.volume_id = mv.id
-            WHERE wa.word_id = ?
-            ORDER BY wa.volume_id ASC, wa.page_index ASC, wa.id ASC
+            SELECT id, word_id, volume_id, page_index, crop_coordinates, sentence_text
+            FROM word_appearances
+            WHERE word_id = ?
+            ORDER BY volume_id ASC, page_index ASC, id ASC
+            LIMIT ? OFFSET ?
             """,
-            (word_id,),
+            (word_id, -1 if limit is None else limit, offset),
         )
         rows = cur.fetchall()
-        return [self._row_to_word_appearance(row) for row in rows]
+        volumes = self._get_volumes_by_ids({row["volume_id"] for row in rows})
+        appearances = []
+        for row in rows:
+            volume = volumes.get(row["volume_id"])
+            if volume is None:
+                continue
+            appearance = self._row_to_word_appearance(row)
+            appearance.volume_name = volume.name
+            appearance.volume_path = volume.path
+            appearances.append(appearance)
+        return appearances
 
     def close(self) -> None:
         self.connection.close()
@@ -210,6 +260,9 @@ class DatabaseManager:
         return self._row_to_tracked_word(row)
 
     def _get_volume(self, path: Path) -> MangaVolumeEntry:
+        cached = self._volumes_by_path.get(str(path))
+        if cached is not None:
+            return cached
         cur = self.connection.cursor()
         cur.execute(
             """
@@ -220,31 +273,46 @@ class DatabaseManager:
         row = cur.fetchone()
         if row is None:
             raise ValueError(f"Volume not found: path={path}")
-        return self._row_to_volume(row)
+        return self._remember_volume(self._row_to_volume(row))
+
+    def _remember_volume(self, volume: MangaVolumeEntry) -> MangaVolumeEntry:
+        """Cache a volume row by id and path (volumes only change through upsert_volume)."""
+        self._volumes_by_id[volume.id] = volume
+        self._volumes_by_path[str(volume.path)] = volume
+        return volume
+
+    def _get_volumes_by_ids(self, volume_ids: Set[int]) -> Dict[int, MangaVolumeEntry]:
+        missing = [volume_id for volume_id in volume_ids if volume_id not in self._volumes_by_id]
+        if missing:
+            placeholders = ", ".join("?" * len(missing))
+            cur = self.connection.cursor()
+            cur.execute(
+                f"SELECT id, path, name FROM manga_volumes WHERE id IN ({placeholders})",
+                missing,
+            )
+            for row in cur.fetchall():
+                self._remember_volume(self._row_to_volume(row))
+        return {
+            volume_id: self._volumes_by_id[volume_id]
+            for volume_id in volume_ids
+            if volume_id in self._volumes_by_id
+        }
 
-    def _get_word_appearance_by_id(self, appearance_id: int) -> WordAppearance:
+    def _get_volume_by_id(self, volume_id: int) -> MangaVolumeEntry:
+        volume = self._volumes_by_id.get(volume_id)
+        if volume is not None:
+            return volume
         cur = self.connection.cursor()
         cur.execute(
             """
-            SELECT
-                wa.id,
-                wa.word_id,
-                wa.volume_id,
-                wa.page_index,
-                wa.crop_coordinates,
-                wa.sentence_text,
-                mv.name AS volume_name,
-                mv.path AS volume_path
-            FROM word_appearances wa
-            JOIN manga_volumes mv ON wa.volume_id = mv.id
-            WHERE wa.id = ?
+            SELECT id, path, name FROM manga_volumes WHERE id = ?
             """,
-            (appearance_id,),
+            (volume_id,),
         )
         row = cur.fetchone()
         if row is None:
-            raise ValueError(f"Word appearance not found: id={appearance_id}")
-        return self._row_to_word_appearance(row)
+            raise ValueError(f"Volume not found: id={volume_id}")
+        return self._remember_volume(self._row_to_volume(row))
 
     @staticmethod
     def _row_to_tracked_word(row: sqlite3.Row) -> TrackedWord:
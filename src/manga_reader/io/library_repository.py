@@ -3,7 +3,7 @@
 import sqlite3
 import time
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 from manga_reader.core import LibraryVolume
 
@@ -29,6 +29,8 @@ class LibraryRepository:
             raise RuntimeError("Database connection required")
         self.connection = connection
         self.connection.row_factory = sqlite3.Row
+        # Volumes read by folder path; cleared on every write to library_volumes
+        self._volumes_by_path: Dict[str, LibraryVolume] = {}
 
     def add_volume(
         self,
@@ -70,6 +72,7 @@ class LibraryRepository:
                 (title, str(folder_path), str(cover_image_path), now, now, 0),
             )
             self.connection.commit()
+            self._volumes_by_path.clear()
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to add volume to library: {e}") from e
 
@@ -88,6 +91,9 @@ class LibraryRepository:
             RuntimeError: If volume not found.
         """
         folder_path = Path(folder_path).resolve()
+        cached = self._volumes_by_path.get(str(folder_path))
+        if cached is not None:
+            return cached
         try:
             cur = self.connection.cursor()
             cur.execute(
@@ -103,7 +109,9 @@ class LibraryRepository:
                 raise RuntimeError(
                     f"Volume not found in library: {folder_path}"
                 )
-            return self._row_to_library_volume(row)
+            volume = self._row_to_library_volume(row)
+            self._volumes_by_path[str(folder_path)] = volume
+            return volume
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to retrieve volume: {e}") from e
 
@@ -193,6 +201,7 @@ class LibraryRepository:
             if cur.rowcount == 0:
                 raise RuntimeError(f"Volume not found: {folder_path}")
             self.connection.commit()
+            self._volumes_by_path.clear()
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to update volume title: {e}") from e
 
@@ -226,6 +235,7 @@ class LibraryRepository:
             if cur.rowcount == 0:
                 raise RuntimeError(f"Volume not found: {folder_path}")
             self.connection.commit()
+            self._volumes_by_path.clear()
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to update last_opened: {e}") from e
 
@@ -260,6 +270,7 @@ class LibraryRepository:
             if cur.rowcount == 0:
                 raise RuntimeError(f"Volume not found: {volume_id}")
             self.connection.commit()
+            self._volumes_by_path.clear()
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to update last_page_read: {e}") from e
 
@@ -317,6 +328,7 @@ class LibraryRepository:
             if cur.rowcount == 0:
                 raise RuntimeError(f"Volume not found: {folder_path}")
             self.connection.commit()
+            self._volumes_by_path.clear()
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to delete volume: {e}") from e
 
@@ -349,6 +361,7 @@ class LibraryRepository:
             if cur.rowcount == 0:
                 raise RuntimeError(f"Volume not found: {old_path}")
             self.connection.commit()
+            self._volumes_by_path.clear()
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to update folder path: {e}") from e
 
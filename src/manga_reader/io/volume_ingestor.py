@@ -1,11 +1,15 @@
 """Volume Ingestor - parses Mokuro JSON and validates image files."""
 
 import json
+import logging
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set
 
 from manga_reader.core import MangaPage, MangaVolume, OCRBlock
 
+logger = logging.getLogger(__name__)
+
 
 class VolumeIngestor:
     """Data Factory responsible for parsing Mokuro JSON files and validating images."""
@@ -21,12 +25,15 @@ class VolumeIngestor:
             MangaVolume object if successful, None if parsing fails
         """
         try:
-            # Find the .mokuro file
-            mokuro_files = list(volume_path.glob("*.mokuro"))
-            if not mokuro_files:
+            # Find the .mokuro file; the same listing later validates page images
+            listings: Dict[Path, Set[str]] = {}
+            mokuro_names = sorted(
+                name for name in self._list_directory(volume_path, listings) if name.endswith(".mokuro")
+            )
+            if not mokuro_names:
                 raise FileNotFoundError(f"No .mokuro file found in {volume_path}")
             
-            mokuro_file = mokuro_files[0]
+            mokuro_file = volume_path / mokuro_names[0]
             
             # Parse JSON
             with open(mokuro_file, 'r', encoding='utf-8') as f:
@@ -38,20 +45,28 @@ class VolumeIngestor:
             # Create the volume
             volume = MangaVolume(title=title, volume_path=volume_path)
             
-            # Process each page
+            # Process each page, then hand them to the volume in one go
             pages_data = data.get("pages", [])
-            for page_idx, page_data in enumerate(pages_data):
-                page = self._parse_page(page_idx, page_data, volume_path)
-                if page:
-                    volume.add_page(page)
+            pages = [
+                page
+                for page_idx, page_data in enumerate(pages_data)
+                if (page := self._parse_page(page_idx, page_data, volume_path, listings))
+            ]
+            volume.set_pages(pages)
             
             return volume
             
         except Exception as e:
-            print(f"Error ingesting volume: {e}")
+            logger.error("Error ingesting volume %s: %s", volume_path, e)
             return None
     
-    def _parse_page(self, page_number: int, page_data: dict, volume_path: Path) -> Optional[MangaPage]:
+    def _parse_page(
+        self,
+        page_number: int,
+        page_data: dict,
+        volume_path: Path,
+        listings: Dict[Path, Set[str]],
+    ) -> Optional[MangaPage]:
         """
         Parse a single page from Mokuro JSON.
         
@@ -59,6 +74,7 @@ class VolumeIngestor:
             page_number: The page index
             page_data: Dictionary containing page information
             volume_path: Path to the volume directory
+            listings: Directory listings already read during this ingest
             
         Returns:
             MangaPage object if successful, None otherwise
@@ -72,34 +88,57 @@ class VolumeIngestor:
             image_path = volume_path / image_filename
             
             # Validate image exists
-            if not image_path.exists():
+            if not self._image_exists(image_path, listings):
                 raise FileNotFoundError(f"Image not found: {image_path}")
             
             # Get page dimensions
             width = page_data.get("img_width", 0)
             height = page_data.get("img_height", 0)
             
+            # Parse OCR blocks in one pass (bound method hoisted out of the loop)
+            parse_block = self._parse_block
+            blocks_data = page_data.get("blocks", [])
+            ocr_blocks = [
+                block
+                for block_data in blocks_data
+                if (block := parse_block(block_data)) is not None
+            ]
+            # Reported once per page rather than once per bad block
+            skipped_blocks = len(blocks_data) - len(ocr_blocks)
+            if skipped_blocks:
+                logger.warning("Page %d: skipped %d malformed OCR block(s)", page_number, skipped_blocks)
+            
             # Create page
-            page = MangaPage(
+            return MangaPage(
                 page_number=page_number,
                 image_path=image_path,
                 width=width,
-                height=height
+                height=height,
+                ocr_blocks=ocr_blocks,
             )
             
-            # Parse OCR blocks
-            blocks_data = page_data.get("blocks", [])
-            for block_data in blocks_data:
-                block = self._parse_block(block_data)
-                if block:
-                    page.ocr_blocks.append(block)
-            
-            return page
-            
         except Exception as e:
-            print(f"Error parsing page {page_number}: {e}")
+            logger.warning("Skipping page %d: %s", page_number, e)
             return None
     
+    @classmethod
+    def _image_exists(cls, image_path: Path, listings: Dict[Path, Set[str]]) -> bool:
+        """Check for an image file using one directory read per folder instead of a stat per page."""
+        return image_path.name in cls._list_directory(image_path.parent, listings)
+    
+    @staticmethod
+    def _list_directory(directory: Path, listings: Dict[Path, Set[str]]) -> Set[str]:
+        """Return the entry names in a directory, reading it at most once per ingest."""
+        names = listings.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                names = set()
+            listings[directory] = names
+        return names
+    
     def _parse_block(self, block_data: dict) -> Optional[OCRBlock]:
         """
         Parse a single OCR block from Mokuro JSON.
@@ -108,19 +147,19 @@ class VolumeIngestor:
             block_data: Dictionary containing block information
             
         Returns:
-            OCRBlock object if successful, None otherwise
+            OCRBlock object if successful, None if the block is malformed
         """
         try:
             # Extract bounding box coordinates
             box = block_data.get("box", [])
-            if len(box) < 4:
+            if not isinstance(box, (list, tuple)) or len(box) < 4:
                 return None
             
             x, y, width, height = box[0], box[1], box[2] - box[0], box[3] - box[1]
             
             # Extract text lines
             lines_data = block_data.get("lines", [])
-            text_lines = [line for line in lines_data if isinstance(line, str)]
+            text_lines = tuple([line for line in lines_data if type(line) is str])
             
             # Parse orientation from 'vertical' flag (default to vertical for Japanese manga)
             is_vertical = block_data.get("vertical", True)
@@ -135,6 +174,6 @@ class VolumeIngestor:
                 orientation=orientation
             )
             
-        except Exception as e:
-            print(f"Error parsing block: {e}")
+        except (TypeError, ValueError, AttributeError):
+            # Counted and reported by _parse_page
             return None
@@ -0,0 +1,29 @@
+"""Scoped wall-clock timers for startup steps, enabled with MANGA_READER_PROFILE=1."""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+PROFILE_ENABLED = os.environ.get("MANGA_READER_PROFILE", "").lower() in {"1", "true", "yes"}
+
+# Accumulated seconds per label, in first-seen order
+_timings: Dict[str, float] = {}
+
+
+@contextmanager
+def profile(label: str) -> Iterator[None]:
+    """Time the enclosed block under label (no-op unless profiling is enabled)."""
+    if not PROFILE_ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _timings[label] = _timings.get(label, 0.0) + time.perf_counter() - start
+
+
+def report() -> str:
+    """Return the recorded timings, one 'label: N.N ms' line per step."""
+    return "\n".join(f"{label}: {seconds * 1000:.1f} ms" for label, seconds in _timings.items())
@@ -14,7 +14,7 @@ from manga_reader.services.thumbnail_service import ThumbnailService
 from manga_reader.services.settings_manager import SettingsManager
 
 # Text processing services
-from manga_reader.services.text_processing import MorphologyService, Token, normalize_text, TranslationWorker, ExplanationWorker, WorkerSignals
+from manga_reader.services.text_processing import MorphologyService, Token, normalize_text, TranslationWorker, BatchTranslationWorker, ExplanationWorker, WorkerSignals
 
 # Translation services
 from manga_reader.services.translation import TranslationService, TranslationResult, GeminiTranslationService
@@ -50,6 +50,7 @@ __all__ = [
 	"SettingsManager",
 	"normalize_text",
 	"TranslationWorker",
+	"BatchTranslationWorker",
 	"ExplanationWorker",
 	"WorkerSignals",
 ]
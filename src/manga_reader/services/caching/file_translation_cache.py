@@ -1,6 +1,7 @@
 """File-based translation cache implementation for per-volume persistent storage."""
 
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -38,6 +39,12 @@ class FileTranslationCache(TranslationCache):
     def __init__(self):
         self._in_memory_lru: dict[str, dict[tuple[str, str], CacheRecord]] = {}
         self._max_lru_size = 100
+        # Full contents of preloaded cache files, kept in step with writes
+        self._file_index: dict[str, dict[tuple[str, str], CacheRecord]] = {}
+        self._file_generation: dict[str, int] = {}
+        # Number of cache file writes currently in progress per volume
+        self._file_writes: dict[str, int] = {}
+        self._file_index_lock = threading.Lock()
 
     def get(
         self, volume_id: str, normalized_text: str, lang: str = "en"
@@ -49,6 +56,13 @@ class FileTranslationCache(TranslationCache):
             if key in self._in_memory_lru[volume_id]:
                 return self._in_memory_lru[volume_id][key]
         
+        file_index = self._file_index.get(volume_id)
+        if file_index is not None:
+            record = file_index.get(key)
+            if record is not None:
+                self._add_to_lru(volume_id, key, record)
+            return record
+        
         cache_file = self._get_cache_file_path(volume_id)
         if not cache_file.exists():
             return None
@@ -61,14 +75,7 @@ class FileTranslationCache(TranslationCache):
                     entry["normalized_text"] == normalized_text
                     and entry["lang"] == lang
                 ):
-                    record = CacheRecord(
-                        normalized_text=entry["normalized_text"],
-                        lang=entry["lang"],
-                        translation=entry.get("translation"),
-                        explanation=entry.get("explanation"),
-                        model=entry["model"],
-                        updated_at=datetime.fromisoformat(entry["updated_at"]),
-                    )
+                    record = self._record_from_entry(entry)
                     self._add_to_lru(volume_id, key, record)
                     return record
         except (json.JSONDecodeError, KeyError, ValueError) as e:
@@ -77,6 +84,26 @@ class FileTranslationCache(TranslationCache):
         
         return None
 
+    def preload(self, volume_id: str) -> None:
+        """Parse the whole cache file once so later misses skip the file scan."""
+        generation = self._file_generation.get(volume_id, 0)
+        cache_file = self._get_cache_file_path(volume_id)
+        
+        file_index: dict[tuple[str, str], CacheRecord] = {}
+        if cache_file.exists():
+            try:
+                data = json.loads(cache_file.read_text(encoding="utf-8"))
+                for entry in data.get("entries", []):
+                    file_index[(entry["normalized_text"], entry["lang"])] = self._record_from_entry(entry)
+            except (json.JSONDecodeError, KeyError, ValueError, OSError) as e:
+                print(f"Error reading cache file {cache_file}: {e}")
+                return
+        
+        # A write that started or finished while the file was being read makes this snapshot stale
+        with self._file_index_lock:
+            if self._file_generation.get(volume_id, 0) == generation and not self._file_writes.get(volume_id):
+                self._file_index[volume_id] = file_index
+
     def put(
         self,
         volume_id: str,
@@ -85,8 +112,24 @@ class FileTranslationCache(TranslationCache):
         record: CacheRecord,
     ) -> None:
         """Store or update a cache entry in both LRU and file."""
-        key = (normalized_text, lang)
-        self._add_to_lru(volume_id, key, record)
+        self.put_many(volume_id, [(normalized_text, lang, record)])
+
+    def put_many(
+        self,
+        volume_id: str,
+        entries: list[tuple[str, str, CacheRecord]],
+    ) -> None:
+        """Store or update several entries, rewriting the cache file once."""
+        if not entries:
+            return
+
+        for normalized_text, lang, record in entries:
+            self._add_to_lru(volume_id, (normalized_text, lang), record)
+        with self._file_index_lock:
+            file_index = self._begin_file_write(volume_id)
+            if file_index is not None:
+                for normalized_text, lang, record in entries:
+                    file_index[(normalized_text, lang)] = record
         
         cache_file = self._get_cache_file_path(volume_id)
         
@@ -101,35 +144,36 @@ class FileTranslationCache(TranslationCache):
                     "entries": [],
                 }
             
-            entries = data.get("entries", [])
-            existing_idx = None
-            for idx, entry in enumerate(entries):
-                if (
-                    entry["normalized_text"] == normalized_text
-                    and entry["lang"] == lang
-                ):
-                    existing_idx = idx
-                    break
-            
-            entry_data = {
-                "normalized_text": record.normalized_text,
-                "lang": record.lang,
-                "translation": record.translation,
-                "explanation": record.explanation,
-                "model": record.model,
-                "updated_at": record.updated_at.isoformat(),
+            entries_data = data.get("entries", [])
+            index_by_key = {
+                (entry["normalized_text"], entry["lang"]): idx
+                for idx, entry in enumerate(entries_data)
             }
             
-            if existing_idx is not None:
-                entries[existing_idx] = entry_data
-            else:
-                entries.append(entry_data)
+            for normalized_text, lang, record in entries:
+                entry_data = {
+                    "normalized_text": record.normalized_text,
+                    "lang": record.lang,
+                    "translation": record.translation,
+                    "explanation": record.explanation,
+                    "model": record.model,
+                    "updated_at": record.updated_at.isoformat(),
+                }
+                
+                existing_idx = index_by_key.get((normalized_text, lang))
+                if existing_idx is not None:
+                    entries_data[existing_idx] = entry_data
+                else:
+                    index_by_key[(normalized_text, lang)] = len(entries_data)
+                    entries_data.append(entry_data)
             
-            data["entries"] = entries
+            data["entries"] = entries_data
             cache_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
             
         except (json.JSONDecodeError, OSError) as e:
             print(f"Error writing cache file {cache_file}: {e}")
+        finally:
+            self._end_file_write(volume_id)
 
     def delete(
         self, volume_id: str, normalized_text: str, lang: str = "en"
@@ -139,9 +183,14 @@ class FileTranslationCache(TranslationCache):
         
         if volume_id in self._in_memory_lru:
             self._in_memory_lru[volume_id].pop(key, None)
+        with self._file_index_lock:
+            file_index = self._begin_file_write(volume_id)
+            if file_index is not None:
+                file_index.pop(key, None)
         
         cache_file = self._get_cache_file_path(volume_id)
         if not cache_file.exists():
+            self._end_file_write(volume_id)
             return
         
         try:
@@ -156,17 +205,24 @@ class FileTranslationCache(TranslationCache):
             cache_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
         except (json.JSONDecodeError, OSError) as e:
             print(f"Error deleting from cache file {cache_file}: {e}")
+        finally:
+            self._end_file_write(volume_id)
 
     def clear_volume(self, volume_id: str) -> None:
         """Clear all cache entries for a volume."""
         self._in_memory_lru.pop(volume_id, None)
+        with self._file_index_lock:
+            if self._begin_file_write(volume_id) is not None:
+                self._file_index[volume_id] = {}
         
         cache_file = self._get_cache_file_path(volume_id)
-        if cache_file.exists():
-            try:
+        try:
+            if cache_file.exists():
                 cache_file.unlink()
-            except OSError as e:
-                print(f"Error deleting cache file {cache_file}: {e}")
+        except OSError as e:
+            print(f"Error deleting cache file {cache_file}: {e}")
+        finally:
+            self._end_file_write(volume_id)
 
     def list_keys(self, volume_id: str) -> list[tuple[str, str]]:
         """List all (normalized_text, lang) keys for a volume."""
@@ -184,6 +240,33 @@ class FileTranslationCache(TranslationCache):
             print(f"Error reading cache file {cache_file}: {e}")
             return []
 
+    def _begin_file_write(self, volume_id: str) -> Optional[dict[tuple[str, str], CacheRecord]]:
+        """Invalidate in-flight preloads of a volume and return its index to update, if loaded.
+
+        Must be called with _file_index_lock held, and paired with _end_file_write.
+        """
+        self._file_generation[volume_id] = self._file_generation.get(volume_id, 0) + 1
+        self._file_writes[volume_id] = self._file_writes.get(volume_id, 0) + 1
+        return self._file_index.get(volume_id)
+
+    def _end_file_write(self, volume_id: str) -> None:
+        """Invalidate preloads that read the cache file while it was being written."""
+        with self._file_index_lock:
+            self._file_generation[volume_id] += 1
+            self._file_writes[volume_id] -= 1
+
+    @staticmethod
+    def _record_from_entry(entry: dict) -> CacheRecord:
+        """Build a CacheRecord from one stored JSON entry."""
+        return CacheRecord(
+            normalized_text=entry["normalized_text"],
+            lang=entry["lang"],
+            translation=entry.get("translation"),
+            explanation=entry.get("explanation"),
+            model=entry["model"],
+            updated_at=datetime.fromisoformat(entry["updated_at"]),
+        )
+
     def _get_cache_file_path(self, volume_id: str) -> Path:
         """Get the cache file path for a given volume."""
         volume_path = Path(volume_id)
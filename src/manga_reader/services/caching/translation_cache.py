@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheRecord:
     """A cached translation/explanation entry."""
 
@@ -62,6 +62,35 @@ class TranslationCache(ABC):
         """
         pass
 
+    def put_many(
+        self,
+        volume_id: str,
+        entries: list[tuple[str, str, CacheRecord]],
+    ) -> None:
+        """
+        Store or overwrite several cache entries for one volume.
+
+        The default stores them one by one; persistent implementations should
+        override this to write all entries in a single operation.
+
+        Args:
+            volume_id: Identifier for the volume.
+            entries: (normalized_text, lang, record) tuples.
+        """
+        for normalized_text, lang, record in entries:
+            self.put(volume_id, normalized_text, lang, record)
+
+    def preload(self, volume_id: str) -> None:
+        """
+        Load a volume's stored entries so later lookups avoid storage reads.
+
+        Called from a worker thread ahead of lookups. The default does nothing;
+        implementations backed by slow storage may override it.
+
+        Args:
+            volume_id: Identifier for the volume.
+        """
+
     @abstractmethod
     def delete(
         self, volume_id: str, normalized_text: str, lang: str = "en"
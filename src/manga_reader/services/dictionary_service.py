@@ -1,5 +1,7 @@
 """Dictionary Service - Jamdict-backed noun definitions for popups."""
 
+import logging
+import threading
 from dataclasses import dataclass
 from typing import List, Optional, Literal, Union
 
@@ -8,6 +10,9 @@ from jamdict.jmdict import JMDEntry
 from jamdict.kanjidic2 import Character
 from jamdict.util import LookupResult
 
+logger = logging.getLogger(__name__)
+
+
 @dataclass
 class DictionarySense:
     """Single sense of a dictionary entry."""
@@ -71,7 +76,25 @@ class DictionaryService:
     """Wraps Jamdict to fetch definitions for nouns."""
 
     def __init__(self):
-        self._jamdict = Jamdict()
+        # Jamdict loads its dictionary database; defer that to the first lookup
+        self._jamdict_instance: Jamdict | None = None
+        self._jamdict_lock = threading.Lock()
+
+    @property
+    def _jamdict(self) -> Jamdict:
+        """Return the shared Jamdict, creating it on first use."""
+        with self._jamdict_lock:
+            if self._jamdict_instance is None:
+                self._jamdict_instance = Jamdict()
+            return self._jamdict_instance
+
+    def warm_up(self) -> None:
+        """Open Jamdict's database with a throwaway lookup.
+
+        Jamdict's SQLite context is bound to the thread that opens it, so call this
+        from the thread that serves lookups (the UI thread).
+        """
+        self.lookup("猫", "猫")
 
     def lookup(self, lemma: str, surface: str) -> Optional[DictionaryEntry]:
         """Lookup a noun by lemma, falling back to surface form."""
@@ -82,7 +105,7 @@ class DictionaryService:
         try:
             result: LookupResult = self._jamdict.lookup(query)
         except Exception as exc:  # pragma: no cover - jamdict internals
-            print(f"Jamdict lookup failed for '{query}': {exc}")
+            logger.warning("Jamdict lookup failed for %r: %s", query, exc)
             return None
 
         if not result.entries:
@@ -103,7 +126,7 @@ class DictionaryService:
         try:
             result: LookupResult = self._jamdict.lookup(query)
         except Exception as exc:  # pragma: no cover - jamdict internals
-            print(f"Jamdict lookup failed for '{query}': {exc}")
+            logger.warning("Jamdict lookup failed for %r: %s", query, exc)
             return None
 
         if not result.entries:
@@ -137,7 +160,7 @@ class DictionaryService:
         try:
             result: LookupResult = self._jamdict.lookup(query)
         except Exception as exc:  # pragma: no cover - jamdict internals
-            print(f"Jamdict lookup failed for '{query}': {exc}")
+            logger.warning("Jamdict lookup failed for %r: %s", query, exc)
             return None
 
         if not result.chars:
@@ -12,6 +12,7 @@ class ExplanationResult:
     text: Optional[str]
     model: Optional[str]
     error: Optional[str] = None
+    translation: Optional[str] = None  # Set by translate_and_explain
 
     def is_success(self) -> bool:
         """Return True when the call produced a usable explanation."""
@@ -38,3 +39,22 @@ class ExplanationService(ABC):
             ExplanationResult with explanation text or error message.
         """
         pass
+
+    def translate_and_explain(self, original_jp: str, api_key: str) -> ExplanationResult:
+        """Translate and explain Japanese text in a single request.
+
+        The default cannot translate, so it returns an error result; implementations
+        that can do both in one call (e.g., GeminiExplanationService) override it.
+
+        Args:
+            original_jp: Original Japanese text
+            api_key: API key for provider authentication.
+
+        Returns:
+            ExplanationResult with both `translation` and `text` set, or an error message.
+        """
+        return ExplanationResult(
+            text=None,
+            model=None,
+            error=f"{type(self).__name__} cannot explain untranslated text; translate it first.",
+        )
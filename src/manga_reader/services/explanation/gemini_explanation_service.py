@@ -1,13 +1,19 @@
 """Gemini Explanation Service - Provides sentence-level explanations via Google Gemini API."""
 
+import json
+import logging
+import threading
 import time
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-import google.genai as genai
-from google.genai import types
+if TYPE_CHECKING:
+    import google.genai as genai
 
 from manga_reader.services.explanation.explanation_service import ExplanationService, ExplanationResult
 
+logger = logging.getLogger(__name__)
+
 
 class GeminiExplanationService(ExplanationService):
     """Explanation service using Google Gemini API.
@@ -34,8 +40,35 @@ No markdown formatting. Use plain text with CAPITAL HEADINGS for each section.
 Focus on what a learner would not immediately understand from the translation alone.
 Constraint: Avoid "spoon-feeding" the user. Keep explanations extremely pithy. If the sentence is simple, standard, provide only the Semantic Parsing and nothing else."""
 
+    # Same tutoring instructions, but the model supplies the translation itself and answers in JSON
+    COMBINED_PROMPT_TEMPLATE = PROMPT_TEMPLATE.replace(
+        "English Translation: {translation_en}\n",
+        "First translate the sentence to natural, idiomatic English, then explain it as instructed below.\n",
+    ) + """
+
+Respond with a JSON object with exactly two string fields: "translation" (the English translation) and "explanation" (the explanation text)."""
+
+    def __init__(self):
+        # One client per API key, so its HTTP connection pool is reused across requests
+        self._client: "genai.Client | None" = None
+        self._client_api_key: str | None = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self, api_key: str) -> "genai.Client":
+        """Return the shared client for api_key, creating it on first use or key change."""
+        with self._client_lock:
+            if self._client is None or self._client_api_key != api_key:
+                # google.genai takes most of a second to import; pay that on first request
+                import google.genai as genai
+
+                self._client = genai.Client(api_key=api_key)
+                self._client_api_key = api_key
+            return self._client
+
     def explain(self, original_jp: str, translation_en: str, api_key: str) -> ExplanationResult:
         """Generate a guided explanation grounded in translation context."""
+        from google.genai import types
+
         max_retries = 3
         retry_delay = 2  # Start with 2 seconds
         attempt = 0
@@ -43,7 +76,7 @@ Constraint: Avoid "spoon-feeding" the user. Keep explanations extremely pithy. I
         while attempt < max_retries:
             attempt += 1
             try:
-                client = genai.Client(api_key=api_key)
+                client = self._get_client(api_key)
 
                 prompt = self.PROMPT_TEMPLATE.format(
                     original_jp=original_jp,
@@ -137,3 +170,96 @@ Constraint: Avoid "spoon-feeding" the user. Keep explanations extremely pithy. I
                     model=self.MODEL_NAME,
                     error=f"Explanation failed: {exc}",
                 )
+
+    def translate_and_explain(self, original_jp: str, api_key: str) -> ExplanationResult:
+        """Translate and explain in one Gemini call, returning both in a single result."""
+        from google.genai import types
+
+        max_retries = 3
+        retry_delay = 2  # Start with 2 seconds
+        attempt = 0
+
+        while attempt < max_retries:
+            attempt += 1
+            try:
+                client = self._get_client(api_key)
+                prompt = self.COMBINED_PROMPT_TEMPLATE.format(original_jp=original_jp)
+
+                logger.debug(
+                    "Translate+explain request: attempt %d/%d, original JP %r%s",
+                    attempt, max_retries, original_jp[:100], "..." if len(original_jp) > 100 else "",
+                )
+
+                response = client.models.generate_content(
+                    model=self.MODEL_NAME,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        temperature=0.3,
+                        top_p=0.95,
+                        top_k=40,
+                        max_output_tokens=2048,
+                        response_mime_type="application/json",
+                    ),
+                )
+
+                if not response.text:
+                    return ExplanationResult(
+                        text=None,
+                        model=self.MODEL_NAME,
+                        error="Empty response from API",
+                    )
+
+                try:
+                    payload = json.loads(response.text)
+                    translation = payload["translation"].strip()
+                    explanation = payload["explanation"].strip()
+                except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+                    return ExplanationResult(
+                        text=None,
+                        model=self.MODEL_NAME,
+                        error="Malformed response from API",
+                    )
+
+                return ExplanationResult(
+                    text=explanation,
+                    model=self.MODEL_NAME,
+                    translation=translation,
+                )
+
+            except Exception as exc:
+                error_msg = str(exc).lower()
+                logger.warning(
+                    "Translate+explain attempt %d/%d failed: %s: %s", attempt, max_retries, type(exc).__name__, exc
+                )
+
+                is_rate_limit = ("429" in error_msg or "resource_exhausted" in error_msg or "quota" in error_msg or "rate_limit" in error_msg)
+
+                if is_rate_limit and attempt < max_retries:
+                    time.sleep(retry_delay)
+                    retry_delay *= 2  # Exponential backoff
+                    continue
+
+                if "api_key" in error_msg or "authentication" in error_msg or "invalid" in error_msg:
+                    return ExplanationResult(
+                        text=None,
+                        model=self.MODEL_NAME,
+                        error=f"Invalid API key or request: {exc}",
+                    )
+                if is_rate_limit:
+                    return ExplanationResult(
+                        text=None,
+                        model=self.MODEL_NAME,
+                        error="API quota exceeded. Please try again later.",
+                    )
+                if "deadline" in error_msg or "timeout" in error_msg:
+                    return ExplanationResult(
+                        text=None,
+                        model=self.MODEL_NAME,
+                        error="Request timed out. Please check your connection.",
+                    )
+
+                return ExplanationResult(
+                    text=None,
+                    model=self.MODEL_NAME,
+                    error=f"Explanation failed: {exc}",
+                )
@@ -30,13 +30,21 @@ class SettingsManager:
         load_dotenv(dotenv_path=env_path)
         
         self._project_root = project_root
+        # Read once here and on reload_env; callers poll it on every translate/explain action
+        self._gemini_api_key = self._read_gemini_api_key()
 
     def get_gemini_api_key(self) -> Optional[str]:
-        """Get the Gemini API key from environment."""
-        key = os.getenv("GEMINI_API_KEY")
-        return key.strip() if key and key.strip() else None
+        """Get the Gemini API key loaded from the environment."""
+        return self._gemini_api_key
 
     def reload_env(self) -> None:
         """Reload environment variables from .env file."""
         env_path = self._project_root / ".env"
         load_dotenv(dotenv_path=env_path, override=True)
+        self._gemini_api_key = self._read_gemini_api_key()
+
+    @staticmethod
+    def _read_gemini_api_key() -> Optional[str]:
+        """Read and clean the Gemini API key from the environment."""
+        key = os.getenv("GEMINI_API_KEY")
+        return key.strip() if key and key.strip() else None
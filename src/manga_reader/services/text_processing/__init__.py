@@ -2,13 +2,19 @@
 
 from manga_reader.services.text_processing.morphology_service import MorphologyService, Token
 from manga_reader.services.text_processing.text_normalization import normalize_text
-from manga_reader.services.text_processing.api_workers import TranslationWorker, ExplanationWorker, WorkerSignals
+from manga_reader.services.text_processing.api_workers import (
+    BatchTranslationWorker,
+    ExplanationWorker,
+    TranslationWorker,
+    WorkerSignals,
+)
 
 __all__ = [
     "MorphologyService",
     "Token",
     "normalize_text",
     "TranslationWorker",
+    "BatchTranslationWorker",
     "ExplanationWorker",
     "WorkerSignals",
 ]
@@ -1,5 +1,7 @@
 """Async workers for non-blocking API calls using Qt threading."""
 
+import threading
+
 from PySide6.QtCore import QObject, QRunnable, Signal, Slot
 
 from manga_reader.services.translation import TranslationService, TranslationResult
@@ -17,6 +19,7 @@ class WorkerSignals(QObject):
     error = Signal(str)
     translation_result = Signal(object)  # TranslationResult
     explanation_result = Signal(object)  # ExplanationResult
+    batch_translation_result = Signal(object)  # list[TranslationResult]
 
 
 class TranslationWorker(QRunnable):
@@ -39,16 +42,24 @@ class TranslationWorker(QRunnable):
         self.api_key = api_key
         self.signals = WorkerSignals()
         self.setAutoDelete(True)
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Ask the worker to skip its API call (or drop its result) if it has not finished yet."""
+        self._cancelled.set()
 
     @Slot()
     def run(self):
         """Execute the translation API call in background thread."""
         try:
+            if self._cancelled.is_set():
+                return
             result = self.translation_service.translate(
                 text=self.text,
                 api_key=self.api_key,
             )
-            self.signals.translation_result.emit(result)
+            if not self._cancelled.is_set():
+                self.signals.translation_result.emit(result)
         except Exception as e:
             # Catch any unexpected exceptions not handled by service
             self.signals.error.emit(f"Unexpected translation error: {str(e)}")
@@ -56,19 +67,63 @@ class TranslationWorker(QRunnable):
             self.signals.finished.emit()
 
 
+class BatchTranslationWorker(QRunnable):
+    """
+    Worker that translates several texts with one API call in a background thread.
+
+    Emits the list of results (aligned with the input texts) when done.
+    """
+
+    def __init__(
+        self,
+        translation_service: TranslationService,
+        texts: list[str],
+        api_key: str,
+    ):
+        super().__init__()
+        self.translation_service = translation_service
+        self.texts = texts
+        self.api_key = api_key
+        self.signals = WorkerSignals()
+        self.setAutoDelete(True)
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Ask the worker to skip its API call (or drop its results) if it has not finished yet."""
+        self._cancelled.set()
+
+    @Slot()
+    def run(self):
+        """Execute the batched translation API call in background thread."""
+        try:
+            if self._cancelled.is_set():
+                return
+            results = self.translation_service.translate_batch(
+                texts=self.texts,
+                api_key=self.api_key,
+            )
+            if not self._cancelled.is_set():
+                self.signals.batch_translation_result.emit(results)
+        except Exception as e:
+            self.signals.error.emit(f"Unexpected batch translation error: {str(e)}")
+        finally:
+            self.signals.finished.emit()
+
+
 class ExplanationWorker(QRunnable):
     """
     Worker that runs explanation API call in a background thread.
     
     Uses Qt's thread pool for efficient thread management.
     Emits signals when explanation completes or fails.
+    Without a translation, it translates and explains in one call.
     """
 
     def __init__(
         self,
         explanation_service: ExplanationService,
         original_jp: str,
-        translation_en: str,
+        translation_en: str | None,
         api_key: str,
     ):
         super().__init__()
@@ -78,17 +133,31 @@ class ExplanationWorker(QRunnable):
         self.api_key = api_key
         self.signals = WorkerSignals()
         self.setAutoDelete(True)
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Ask the worker to skip its API call (or drop its result) if it has not finished yet."""
+        self._cancelled.set()
 
     @Slot()
     def run(self):
         """Execute the explanation API call in background thread."""
         try:
-            result = self.explanation_service.explain(
-                original_jp=self.original_jp,
-                translation_en=self.translation_en,
-                api_key=self.api_key,
-            )
-            self.signals.explanation_result.emit(result)
+            if self._cancelled.is_set():
+                return
+            if self.translation_en is None:
+                result = self.explanation_service.translate_and_explain(
+                    original_jp=self.original_jp,
+                    api_key=self.api_key,
+                )
+            else:
+                result = self.explanation_service.explain(
+                    original_jp=self.original_jp,
+                    translation_en=self.translation_en,
+                    api_key=self.api_key,
+                )
+            if not self._cancelled.is_set():
+                self.signals.explanation_result.emit(result)
         except Exception as e:
             # Catch any unexpected exceptions not handled by service
             self.signals.error.emit(f"Unexpected explanation error: {str(e)}")
@@ -1,13 +1,19 @@
 """Gemini Translation Service - Implements translation via Google Gemini API."""
 
+import logging
+import re
+import threading
 import time
 from datetime import datetime
+from typing import TYPE_CHECKING, List
 
-import google.genai as genai
-from google.genai import types
+if TYPE_CHECKING:
+    import google.genai as genai
 
 from manga_reader.services.translation.translation_service import TranslationResult, TranslationService
 
+logger = logging.getLogger(__name__)
+
 
 class GeminiTranslationService(TranslationService):
     """
@@ -26,6 +32,39 @@ Only output the translation, nothing else.
 Japanese text:
 {text}"""
 
+    BATCH_TRANSLATION_PROMPT = """Translate each numbered Japanese line below to natural, idiomatic English.
+Preserve the tone and nuance of the original.
+Answer with exactly one line per input, using the same numbering ("1. ..."), and nothing else.
+
+{lines}"""
+
+    _NUMBERED_LINE = re.compile(r"^\s*(\d+)[.)]\s*(.*)$")
+
+    def __init__(self):
+        # One client per API key, so its HTTP connection pool is reused across requests
+        self._client: "genai.Client | None" = None
+        self._client_api_key: str | None = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self, api_key: str) -> "genai.Client":
+        """Return the shared client for api_key, creating it on first use or key change."""
+        with self._client_lock:
+            if self._client is None or self._client_api_key != api_key:
+                # google.genai takes most of a second to import; pay that on first request
+                import google.genai as genai
+
+                self._client = genai.Client(api_key=api_key)
+                self._client_api_key = api_key
+            return self._client
+
+    def warm_up(self, api_key: str) -> None:
+        """Open the shared client's connection with a cheap model metadata request."""
+        try:
+            self._get_client(api_key).models.get(model=self.MODEL_NAME)
+        except Exception as e:
+            # Best effort: the real request reports any lasting failure
+            logger.debug("Translation warm-up failed: %s: %s", type(e).__name__, e)
+
     def translate(self, text: str, api_key: str) -> TranslationResult:
         """
         Translate Japanese text to English using Gemini API.
@@ -37,6 +76,8 @@ Japanese text:
         Returns:
             TranslationResult with translated text or error message.
         """
+        from google.genai import types
+
         max_retries = 3
         retry_delay = 2  # Start with 2 seconds
         attempt = 0
@@ -44,7 +85,7 @@ Japanese text:
         while attempt < max_retries:
             attempt += 1
             try:
-                client = genai.Client(api_key=api_key)
+                client = self._get_client(api_key)
                 
                 prompt = self.TRANSLATION_PROMPT.format(text=text)
                 
@@ -133,3 +174,53 @@ Japanese text:
                         model=self.MODEL_NAME,
                         error=f"Translation failed: {str(e)}",
                     )
+
+    def translate_batch(self, texts: List[str], api_key: str) -> List[TranslationResult]:
+        """
+        Translate several Japanese texts with a single Gemini request.
+
+        Texts whose numbered answer is missing from the response get an error
+        result, so callers can retry them individually.
+
+        Args:
+            texts: Japanese texts to translate.
+            api_key: Gemini API key for authentication.
+
+        Returns:
+            List of TranslationResult, aligned with texts.
+        """
+        from google.genai import types
+
+        if len(texts) <= 1:
+            return [self.translate(text, api_key) for text in texts]
+
+        # Numbered lines must stay on one line each
+        lines = "\n".join(f"{i}. {' '.join(text.split())}" for i, text in enumerate(texts, start=1))
+        try:
+            response = self._get_client(api_key).models.generate_content(
+                model=self.MODEL_NAME,
+                contents=self.BATCH_TRANSLATION_PROMPT.format(lines=lines),
+                config=types.GenerateContentConfig(
+                    temperature=0.3,
+                    top_p=0.95,
+                    top_k=40,
+                    max_output_tokens=1024 * len(texts),
+                ),
+            )
+        except Exception as e:
+            logger.warning("Batch translation failed: %s: %s", type(e).__name__, e)
+            error = f"Batch translation failed: {str(e)}"
+            return [TranslationResult(text="", model=self.MODEL_NAME, error=error) for _ in texts]
+
+        translations = {}
+        for line in (response.text or "").splitlines():
+            match = self._NUMBERED_LINE.match(line)
+            if match and match.group(2).strip():
+                translations[int(match.group(1))] = match.group(2).strip()
+
+        return [
+            TranslationResult(text=translations[i], model=self.MODEL_NAME)
+            if i in translations
+            else TranslationResult(text="", model=self.MODEL_NAME, error="Missing from batch response")
+            for i in range(1, len(texts) + 1)
+        ]
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 
 @dataclass
@@ -39,3 +39,30 @@ class TranslationService(ABC):
             TranslationResult with text or error message.
         """
         pass
+
+    def warm_up(self, api_key: str) -> None:
+        """
+        Prepare the connection to the provider ahead of the first request.
+
+        The default does nothing; implementations may open and prime a
+        persistent connection so the first translation skips the handshake.
+
+        Args:
+            api_key: Model provider API key for authentication.
+        """
+
+    def translate_batch(self, texts: List[str], api_key: str) -> List[TranslationResult]:
+        """
+        Translate several Japanese texts, returning one result per input in order.
+
+        The default issues one request per text; implementations may override
+        this to translate everything in a single API call.
+
+        Args:
+            texts: Japanese texts to translate.
+            api_key: Model provider API key for authentication.
+
+        Returns:
+            List of TranslationResult, aligned with texts.
+        """
+        return [self.translate(text, api_key) for text in texts]
@@ -1,5 +1,6 @@
 """Vocabulary Service - orchestrates tracking words and appearances."""
 
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -17,14 +18,40 @@ class VocabularyService:
     def __init__(self, db: DatabaseManager, morphology: MorphologyService) -> None:
         self._db = db
         self._morphology = morphology
+        # Lazily built lookup indexes over tracked words; reset on every write
+        self._tracked_by_lemma: Optional[Dict[str, TrackedWord]] = None
+        self._tracked_by_id: Optional[Dict[int, TrackedWord]] = None
+        self._tracked_words_version = 0
+        self._appearances_version = 0
+
+    @property
+    def tracked_words_version(self) -> int:
+        """Counter bumped whenever the set of tracked words may have changed."""
+        return self._tracked_words_version
+
+    @property
+    def appearances_version(self) -> int:
+        """Counter bumped whenever a word appearance is recorded."""
+        return self._appearances_version
 
     def list_tracked_words(self) -> List[TrackedWord]:
         return self._db.list_tracked_words()
 
-    def list_appearances(self, word_id: int) -> List[WordAppearance]:
-        return self._db.list_appearances_for_word(word_id)
+    def get_tracked_word_by_lemma(self, lemma: str) -> Optional[TrackedWord]:
+        """Return the tracked word with the given lemma, or None if not tracked."""
+        self._ensure_tracked_index()
+        return self._tracked_by_lemma.get(lemma)
+
+    def get_tracked_word_by_id(self, word_id: int) -> Optional[TrackedWord]:
+        """Return the tracked word with the given id, or None if not tracked."""
+        self._ensure_tracked_index()
+        return self._tracked_by_id.get(word_id)
+
+    def list_appearances(
+        self, word_id: int, offset: int = 0, limit: Optional[int] = None
+    ) -> List[WordAppearance]:
+        return self._db.list_appearances_for_word(word_id, limit=limit, offset=offset)
 
-    #TODO: make more efficient
     def is_word_tracked(self, lemma: str) -> bool:
         """Check if a word is already tracked by lemma.
         
@@ -34,8 +61,7 @@ class VocabularyService:
         Returns:
             True if the word is in vocabulary, False otherwise
         """
-        tracked_words = self.list_tracked_words()
-        return any(w.lemma == lemma for w in tracked_words)
+        return self.get_tracked_word_by_lemma(lemma) is not None
 
     def track_word(
         self,
@@ -61,6 +87,7 @@ class VocabularyService:
         """
         
         word = self._db.upsert_tracked_word(lemma, reading, part_of_speech)
+        self._invalidate_tracked_index()
         vol = self._db.upsert_volume(volume_path)
         
         appearance = self._db.insert_word_appearance(
@@ -70,6 +97,7 @@ class VocabularyService:
             crop_coordinates=crop_coordinates,
             sentence_text=sentence_text,
         )
+        self._appearances_version += 1
         
         return word, appearance
 
@@ -103,8 +131,8 @@ class VocabularyService:
         Returns:
             Set of lemma strings (dictionary base forms) that are currently tracked
         """
-        tracked = self.list_tracked_words()
-        return {word.lemma for word in tracked}
+        self._ensure_tracked_index()
+        return set(self._tracked_by_lemma)
 
     def add_appearance_if_new(
         self,
@@ -134,8 +162,7 @@ class VocabularyService:
             ValueError: If lemma is not in tracked_words (fail-fast philosophy)
         """
         # Fail fast: check that lemma is tracked
-        tracked_words = self.list_tracked_words()
-        word = next((w for w in tracked_words if w.lemma == lemma), None)
+        word = self.get_tracked_word_by_lemma(lemma)
         
         if word is None:
             raise ValueError(f"Cannot add appearance for untracked lemma: {lemma}")
@@ -150,8 +177,63 @@ class VocabularyService:
                 crop_coordinates=crop_coordinates,
                 sentence_text=sentence_text,
             )
+            self._appearances_version += 1
             return appearance
         except ValueError:
             # Duplicate appearance already exists, return None
             return None
 
+    def add_appearances_if_new(
+        self,
+        volume_path: Path,
+        appearances: List[Tuple[str, int, Dict[str, float], str]],
+    ) -> List[str]:
+        """
+        Add several appearances in one volume, skipping those already recorded.
+        
+        Batch form of add_appearance_if_new used by context synchronization:
+        the volume is resolved once and all rows are written in one transaction.
+        
+        Args:
+            volume_path: Path to the volume directory
+            appearances: (lemma, page_index, crop_coordinates, sentence_text) tuples
+            
+        Returns:
+            Lemma of each appearance that was newly added, in input order
+            
+        Raises:
+            ValueError: If any lemma is not in tracked_words (nothing is written)
+        """
+        if not appearances:
+            return []
+        
+        self._ensure_tracked_index()
+        rows = []
+        for lemma, page_index, crop_coordinates, sentence_text in appearances:
+            word = self._tracked_by_lemma.get(lemma)
+            if word is None:
+                raise ValueError(f"Cannot add appearance for untracked lemma: {lemma}")
+            rows.append((word.id, page_index, crop_coordinates, sentence_text))
+        
+        vol = self._db.upsert_volume(volume_path)
+        inserted = self._db.insert_word_appearances(
+            [(word_id, vol.id, page_index, coords, sentence) for word_id, page_index, coords, sentence in rows]
+        )
+        added = [appearance[0] for appearance, was_inserted in zip(appearances, inserted) if was_inserted]
+        if added:
+            self._appearances_version += 1
+        return added
+
+    def _ensure_tracked_index(self) -> None:
+        """Build the lemma/id indexes from the database if they are not current."""
+        if self._tracked_by_id is not None:
+            return
+        tracked_words = self.list_tracked_words()
+        # Interned keys let lookups with interned click lemmas match by identity
+        self._tracked_by_lemma = {sys.intern(w.lemma): w for w in tracked_words}
+        self._tracked_by_id = {w.id: w for w in tracked_words}
+
+    def _invalidate_tracked_index(self) -> None:
+        self._tracked_by_lemma = None
+        self._tracked_by_id = None
+        self._tracked_words_version += 1
@@ -31,6 +31,7 @@ class MangaViewer {
 
         // Channel/state
         this.lastData = null;
+        this.preloadedImages = []; // Keeps prefetched Image objects alive until replaced
 
         document.addEventListener("DOMContentLoaded", () => this.setup());
     }
@@ -285,6 +286,19 @@ class MangaViewer {
             this.overlayManager.highlightBlock(x, y, width, height, this.zoomController);
         }
     }
+
+    /**
+     * Warm the browser image cache for pages likely to be shown next.
+     * 
+     * @param {string[]} urls - Image URLs of the neighbouring pages
+     */
+    preloadImages(urls) {
+        this.preloadedImages = urls.map((url) => {
+            const img = new Image();
+            img.src = url;
+            return img;
+        });
+    }
 }
 
 
@@ -297,4 +311,5 @@ window.markWordAsTracked = () => mangaViewer.markWordAsTracked();
 window.markLemmaAsTracked = (lemma) => mangaViewer.markLemmaAsTracked(lemma);
 window.highlightBlockAtCoordinates = (x, y, width, height) => 
     mangaViewer.highlightBlockAtCoordinates(x, y, width, height);
+window.preloadImages = (urls) => mangaViewer.preloadImages(urls);
 
@@ -203,7 +203,7 @@ class MainWindow(QMainWindow):
         
         This keeps bootstrapping minimal while preserving dependency injection.
         The controller is expected to expose methods:
-        - handle_volume_opened(Path)
+        - load_volume_in_background(Path)
         - next_page()
         - previous_page()
         - handle_view_mode_changed(str)
@@ -215,7 +215,7 @@ class MainWindow(QMainWindow):
         """
         self._controller = controller
         # Signal wiring
-        self.volume_opened.connect(controller.handle_volume_opened)
+        self.volume_opened.connect(controller.load_volume_in_background)
         self.next_page.connect(controller.next_page)
         self.previous_page.connect(controller.previous_page)
         self.view_mode_changed.connect(controller.handle_view_mode_changed)
@@ -234,6 +234,14 @@ class MainWindow(QMainWindow):
         """Display an information message to the user."""
         QMessageBox.information(self, title, message)
     
+    def show_status(self, message: str):
+        """Show a transient message (e.g. a loading notice) in the status bar."""
+        self.statusBar().showMessage(message)
+    
+    def clear_status(self):
+        """Clear the status bar message."""
+        self.statusBar().clearMessage()
+    
     def show_question(self, title: str, message: str) -> bool:
         """
         Display a question dialog with Yes/No buttons.
@@ -1,6 +1,8 @@
 """Manga Canvas - Renders manga pages with OCR overlays using QWebEngineView."""
 
 import json
+import logging
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Set
 
@@ -13,6 +15,8 @@ from PySide6.QtWidgets import QVBoxLayout, QWidget
 from manga_reader.core import MangaPage, OCRBlock
 from manga_reader.services import MorphologyService
 
+logger = logging.getLogger(__name__)
+
 # Template directory
 TEMPLATES_DIR = Path(__file__).parent / "assets"
 
@@ -41,7 +45,7 @@ class WebConnector(QObject):
     @Slot(int, int)
     def blockClicked(self, block_id, page_index):
         """Called from JS when a block is clicked."""
-        print(f"DEBUG: Python received block click: block_id={block_id}, page_index={page_index}")
+        logger.debug("Python received block click: block_id=%s, page_index=%s", block_id, page_index)
         self.blockClickedSignal.emit(block_id, page_index)
 
     @Slot(str)
@@ -52,25 +56,28 @@ class WebConnector(QObject):
     @Slot(str, str, int, int, int, int)
     def requestWordLookup(self, lemma: str, surface: str, mouse_x: int, mouse_y: int, page_index: int, block_id: int):
         """Called from JS when a word span is clicked."""
-        print(f"DEBUG: Python received word click: lemma='{lemma}', surface='{surface}', x={mouse_x}, y={mouse_y}, page_index={page_index}, block_id={block_id}")
+        logger.debug(
+            "Python received word click: lemma=%r, surface=%r, x=%s, y=%s, page_index=%s, block_id=%s",
+            lemma, surface, mouse_x, mouse_y, page_index, block_id,
+        )
         self.wordClickedSignal.emit(lemma, surface, mouse_x, mouse_y, page_index, block_id)
 
     @Slot(str, str, str)
     def trackWord(self, lemma: str, reading: str, part_of_speech: str):
         """Called from JS when user clicks Track Word button in popup."""
-        print(f"DEBUG: Python received track word: lemma='{lemma}', reading='{reading}', pos='{part_of_speech}'")
+        logger.debug("Python received track word: lemma=%r, reading=%r, pos=%r", lemma, reading, part_of_speech)
         self.trackWordSignal.emit(lemma, reading, part_of_speech)
 
     @Slot(str)
     def viewWordContext(self, lemma: str):
         """Called from JS when user clicks View Context button in popup."""
-        print(f"DEBUG: Python received view context: lemma='{lemma}'")
+        logger.debug("Python received view context: lemma=%r", lemma)
         self.viewContextSignal.emit(lemma)
 
     @Slot(str)
     def showFullDefinition(self, lemma: str):
         """Called from JS when user clicks Expand button in popup."""
-        print(f"DEBUG: Python received show full definition: lemma='{lemma}'")
+        logger.debug("Python received show full definition: lemma=%r", lemma)
         self.showFullDefinitionSignal.emit(lemma)
 
 
@@ -94,6 +101,9 @@ class MangaCanvas(QWidget):
     view_context_by_lemma_requested = Signal(str)  # lemma
     # Signal emitted when user wants to expand popup to full dictionary panel
     show_full_definition_requested = Signal(str)  # lemma
+
+    # Max number of OCR block texts whose extracted words are kept in memory
+    BLOCK_WORDS_CACHE_SIZE = 256
     
     def __init__(self, morphology_service: MorphologyService):
         super().__init__()
@@ -103,6 +113,9 @@ class MangaCanvas(QWidget):
 
         # Initialize morphology service (dependency injection)
         self.morphology_service = morphology_service
+
+        # LRU cache of block text -> extracted word tokens (filled by render and prefetch)
+        self._block_words_cache: OrderedDict = OrderedDict()
         
         # Create layout
         layout = QVBoxLayout(self)
@@ -118,12 +131,11 @@ class MangaCanvas(QWidget):
             self.web_view.focusProxy().installEventFilter(self)
         
         # 1. Setup WebChannel
-        print("DEBUG: Setting up QWebChannel...")
         self.bridge = WebConnector()
         self.channel = QWebChannel()
         self.channel.registerObject("connector", self.bridge)
         self.web_view.page().setWebChannel(self.channel)
-        print("DEBUG: QWebChannel setup complete. Connector registered.")
+        logger.debug("QWebChannel setup complete. Connector registered.")
 
         # Forward JS navigation requests to canvas signal
         self.bridge.navigationSignal.connect(self.navigation_requested)
@@ -144,19 +156,18 @@ class MangaCanvas(QWidget):
         
         # Add load-finished handler to detect WebEngine failures
         self.web_view.loadFinished.connect(self._on_load_finished)
-        print("DEBUG: WebEngine load signal connected.")
         
         # 2. Load the static HTML viewer
         viewer_path = TEMPLATES_DIR / "viewer.html"
-        print(f"DEBUG: Loading viewer from {viewer_path}")
+        logger.debug("Loading viewer from %s", viewer_path)
         self.web_view.load(QUrl.fromLocalFile(str(viewer_path)))
     
     def _on_load_finished(self, success: bool):
         """Handle completion of HTML viewer load."""
         if success:
-            print("DEBUG: Viewer HTML loaded successfully.")
+            logger.debug("Viewer HTML loaded successfully.")
         else:
-            print("ERROR: Failed to load viewer HTML. Renderer may have crashed or URL is invalid.")
+            logger.error("Failed to load viewer HTML. Renderer may have crashed or URL is invalid.")
 
     def eventFilter(self, obj, event):
         """Intercept key events to prevent browser scrolling/navigation."""
@@ -199,6 +210,24 @@ class MangaCanvas(QWidget):
         
         self.web_view.page().runJavaScript(script)
     
+    def prefetch_pages(self, pages: list[MangaPage]):
+        """
+        Warm caches for pages likely to be rendered next.
+
+        Extracts the words of every OCR block up front and asks the viewer to
+        start loading the page images, so a later render_pages is cheap.
+
+        Args:
+            pages: Pages to prepare (typically the neighbouring spreads)
+        """
+        if not pages:
+            return
+        for page in pages:
+            for block in page.ocr_blocks:
+                self._cached_block_words(block.full_text)
+        urls = [QUrl.fromLocalFile(str(page.image_path)).toString() for page in pages]
+        self.web_view.page().runJavaScript(f"preloadImages({json.dumps(urls)});")
+
     def render_page(self, page: MangaPage):
         """
         Render a single manga page with OCR overlays (legacy method).
@@ -248,7 +277,7 @@ class MangaCanvas(QWidget):
             font_size = self._calculate_font_size(block)
             
             # Extract words from block text for HTML wrapping
-            words = self._extract_block_words(block.full_text)
+            words = self._cached_block_words(block.full_text)
             
             block_dict = {
                 "id": idx,  # Simple ID for now
@@ -258,7 +287,7 @@ class MangaCanvas(QWidget):
                 "height": block.height,
                 "fontSize": font_size,
                 "orientation": block.orientation,  # "vertical" or "horizontal"
-                "lines": block.text_lines,
+                "lines": list(block.text_lines),
                 "words": [  # Metadata for JavaScript highlight wrapping (nouns + verbs)
                     {
                         "surface": token.surface,
@@ -315,6 +344,18 @@ class MangaCanvas(QWidget):
         
         return max(MIN_FONT_SIZE, min(int(optimal_size), MAX_FONT_SIZE))
 
+    def _cached_block_words(self, text: str):
+        """Return _extract_block_words(text), memoized in a bounded LRU cache."""
+        words = self._block_words_cache.get(text)
+        if words is not None:
+            self._block_words_cache.move_to_end(text)
+            return words
+        words = self._extract_block_words(text)
+        self._block_words_cache[text] = words
+        if len(self._block_words_cache) > self.BLOCK_WORDS_CACHE_SIZE:
+            self._block_words_cache.popitem(last=False)
+        return words
+
     def _extract_block_words(self, text: str):
         """
         Extract words from OCR block text using morphology service.
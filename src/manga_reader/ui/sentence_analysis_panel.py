@@ -1,6 +1,6 @@
 """Sentence Analysis Panel - UI scaffold for translation/explanation actions."""
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, Slot
 from PySide6.QtWidgets import (
     QApplication,
     QFrame,
@@ -93,6 +93,7 @@ class SentenceAnalysisPanel(QWidget):
             clipboard = QApplication.clipboard()
             clipboard.setText(text)
 
+    @Slot(str)
     def set_original_text(self, text: str) -> None:
         self.original_text.setPlainText(text)
         self.translation_text.clear()
@@ -112,12 +113,14 @@ class SentenceAnalysisPanel(QWidget):
     def set_status(self, text: str) -> None:
         self.status_label.setText(text)
     
+    @Slot()
     def show_translation_loading(self) -> None:
         """Show loading state for translation."""
         self.translation_text.setPlaceholderText("Translating...")
         self.translate_button.setEnabled(False)
         self.status_label.setText("Loading...")
     
+    @Slot(str)
     def show_translation_error(self, error: str) -> None:
         """Show error state for translation."""
         self.translation_text.setPlainText(f"Error: {error}")
@@ -126,6 +129,7 @@ class SentenceAnalysisPanel(QWidget):
         self.status_label.setText("Failed")
         self.status_label.setStyleSheet("color: red;")
     
+    @Slot(str)
     def show_translation_success(self, text: str) -> None:
         """Show success state with translated text."""
         self.translation_text.setPlainText(text)
@@ -134,6 +138,7 @@ class SentenceAnalysisPanel(QWidget):
         self.status_label.setText("Ready")
         self.status_label.setStyleSheet("color: gray;")
 
+    @Slot(str)
     def show_explanation_loading(self, message: str) -> None:
         """Show loading state for explanation requests."""
         self.explanation_text.clear()
@@ -142,6 +147,7 @@ class SentenceAnalysisPanel(QWidget):
         self.status_label.setText(message)
         self.status_label.setStyleSheet("color: gray;")
 
+    @Slot(str)
     def show_explanation_error(self, error: str) -> None:
         """Show error state for explanations with retry affordance."""
         self.explanation_text.setPlainText(f"Error: {error}")
@@ -150,6 +156,7 @@ class SentenceAnalysisPanel(QWidget):
         self.status_label.setText("Failed")
         self.status_label.setStyleSheet("color: red;")
 
+    @Slot(str)
     def show_explanation_success(self, text: str) -> None:
         """Show successful explanation text."""
         self.explanation_text.setPlainText(text)
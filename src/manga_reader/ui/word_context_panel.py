@@ -29,6 +29,8 @@ class WordContextPanel(QWidget):
     Signals:
     - appearance_selected: emitted when user clicks on an appearance row
     - appearance_clicked_with_coords: emitted with coordinates for block highlighting
+    - more_appearances_requested: emitted when the user scrolls to the end of a partial list
+      or clicks "Load more"
     - closed: emitted when user closes the panel
     """
     
@@ -36,6 +38,8 @@ class WordContextPanel(QWidget):
     appearance_selected = Signal(int, int, int)
     # Signal emitted when user clicks with coordinates for highlighting (volume_id, volume_path, page_index, crop_coords_dict)
     appearance_clicked_with_coords = Signal(int, str, int, dict)
+    # Signal emitted when the next batch of appearances is needed (word_id, offset)
+    more_appearances_requested = Signal(int, int)
     # Signal emitted when user closes the panel
     closed = Signal()
     
@@ -43,6 +47,7 @@ class WordContextPanel(QWidget):
         super().__init__()
         self.current_word_id: Optional[int] = None
         self.appearances: List[WordAppearance] = []
+        self._has_more = False
         self._setup_ui()
     
     def _setup_ui(self):
@@ -68,7 +73,15 @@ class WordContextPanel(QWidget):
         
         # Connect table signals
         self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table.verticalScrollBar().valueChanged.connect(self._on_scrolled)
         layout.addWidget(self.table)
+
+        # Fallback for partial lists that fit without a scrollbar (no valueChanged to react to)
+        self.load_more_button = QPushButton("Load more")
+        self.load_more_button.setMaximumHeight(32)
+        self.load_more_button.clicked.connect(self._request_more)
+        self.load_more_button.hide()
+        layout.addWidget(self.load_more_button)
         
         # Create close button
         close_button = QPushButton("Close Context View")
@@ -77,7 +90,8 @@ class WordContextPanel(QWidget):
         layout.addWidget(close_button)
     
     def display_word_context(self, word_id: int, word_lemma: str, 
-                             appearances: List[WordAppearance]):
+                             appearances: List[WordAppearance],
+                             has_more: bool = False):
         """
         Display all appearances of a word.
         
@@ -85,9 +99,11 @@ class WordContextPanel(QWidget):
             word_id: The ID of the tracked word
             word_lemma: The lemma/base form of the word (for display)
             appearances: List of WordAppearance objects
+            has_more: Whether further appearances can be requested by scrolling down
         """
         self.current_word_id = word_id
-        self.appearances = appearances
+        self.appearances = list(appearances)
+        self._set_has_more(has_more)
         
         # Set panel title (via setWindowTitle or parent widget title)
         self.setWindowTitle(f"Appearances of '{word_lemma}'")
@@ -103,8 +119,34 @@ class WordContextPanel(QWidget):
             self.table.setItem(0, 0, item)
             return
         
-        # Add rows for each appearance
-        for idx, appearance in enumerate(appearances):
+        self._append_rows(appearances, start=0)
+
+    def append_appearances(self, appearances: List[WordAppearance], has_more: bool):
+        """
+        Append the next batch of appearances for the displayed word.
+
+        Args:
+            appearances: Additional WordAppearance objects, following those already shown
+            has_more: Whether further appearances remain after this batch
+        """
+        start = len(self.appearances)
+        self.appearances.extend(appearances)
+        self._set_has_more(has_more)
+        self._append_rows(appearances, start=start)
+
+    def more_appearances_failed(self):
+        """Re-arm paging after a requested batch could not be loaded."""
+        if self.current_word_id is not None:
+            self._set_has_more(True)
+
+    def _set_has_more(self, has_more: bool):
+        """Record whether another batch can be requested and show "Load more" accordingly."""
+        self._has_more = has_more
+        self.load_more_button.setVisible(has_more)
+
+    def _append_rows(self, appearances: List[WordAppearance], start: int):
+        """Add one table row per appearance, starting at row index start."""
+        for idx, appearance in enumerate(appearances, start=start):
             self.table.insertRow(idx)
             
             # Volume name
@@ -126,6 +168,19 @@ class WordContextPanel(QWidget):
             context_item = QTableWidgetItem(sentence)
             self.table.setItem(idx, 2, context_item)
     
+    def _on_scrolled(self, value: int):
+        """Request the next batch once the user scrolls to the bottom of a partial list."""
+        if value >= self.table.verticalScrollBar().maximum():
+            self._request_more()
+
+    def _request_more(self):
+        """Ask for the batch after the loaded appearances, once per outstanding request."""
+        if not self._has_more or self.current_word_id is None:
+            return
+        # Re-armed by append_appearances, or by more_appearances_failed on error
+        self._set_has_more(False)
+        self.more_appearances_requested.emit(self.current_word_id, len(self.appearances))
+
     def _on_selection_changed(self):
         """Handle when user selects a row in the table."""
         selected_rows = self.table.selectedIndexes()
@@ -157,3 +212,4 @@ class WordContextPanel(QWidget):
         self.table.setRowCount(0)
         self.current_word_id = None
         self.appearances = []
+        self._set_has_more(False)
@@ -160,6 +160,33 @@ class TestHandleOpenVocabularyList:
         assert "15 word(s)" in message
         assert "... and 5 more" in message
 
+    def test_vocabulary_list_summary_reused_until_tracking(self, coordinator, mock_main_window,
+                                                           mock_vocabulary_service, sample_volume):
+        """Test that the summary is reused across opens and rebuilt after tracking."""
+        mock_vocabulary_service.track_word(
+            lemma="taberu", reading="たべる", part_of_speech="Verb",
+            volume_path=sample_volume.volume_path, page_index=0,
+            crop_coordinates={"x": 0, "y": 0}, sentence_text="test"
+        )
+        coordinator.handle_open_vocabulary_list()
+
+        mock_vocabulary_service.list_tracked_words = MagicMock(
+            side_effect=AssertionError("summary should come from cache")
+        )
+        coordinator.handle_open_vocabulary_list()
+        mock_main_window.show_error.assert_not_called()
+        assert mock_main_window.show_info.call_count == 2
+        assert "1 word(s)" in mock_main_window.show_info.call_args[0][1]
+
+        del mock_vocabulary_service.list_tracked_words
+        mock_vocabulary_service.track_word(
+            lemma="hashiru", reading="はしる", part_of_speech="Verb",
+            volume_path=sample_volume.volume_path, page_index=1,
+            crop_coordinates={"x": 0, "y": 0}, sentence_text="test"
+        )
+        coordinator.handle_open_vocabulary_list()
+        assert "2 word(s)" in mock_main_window.show_info.call_args[0][1]
+
     def test_vocabulary_list_error_handling(self, coordinator, mock_main_window,
                                             mock_vocabulary_service):
         """Test error handling when list fails."""
@@ -200,6 +227,86 @@ class TestHandleViewWordContext:
         
         mock_main_window.show_context_panel.assert_called_once()
 
+    def test_view_word_context_keeps_same_page_across_volumes(self, coordinator, mock_context_panel,
+                                                             mock_vocabulary_service, sample_volume,
+                                                             tmp_path):
+        """Test that appearances on the same page index of two volumes are both shown."""
+        word = mock_vocabulary_service._db.upsert_tracked_word("test", "てすと", "Noun")
+        vol_a = mock_vocabulary_service._db.upsert_volume(sample_volume.volume_path, "Vol A")
+        vol_b = mock_vocabulary_service._db.upsert_volume(tmp_path / "other_volume", "Vol B")
+        mock_vocabulary_service._db.insert_word_appearance(
+            word.id, vol_a.id, 3, {"x": 0, "y": 0}, "from A"
+        )
+        mock_vocabulary_service._db.insert_word_appearance(
+            word.id, vol_b.id, 3, {"x": 0, "y": 0}, "from B"
+        )
+
+        coordinator.handle_view_word_context(word.id)
+
+        shown = mock_context_panel.display_word_context.call_args[1]["appearances"]
+        assert sorted((a.volume_name, a.page_index, a.sentence_text) for a in shown) == [
+            ("Vol A", 3, "from A"),
+            ("Vol B", 3, "from B"),
+        ]
+
+    def test_view_word_context_loads_appearances_in_batches(self, coordinator, mock_context_panel,
+                                                            mock_vocabulary_service, sample_volume):
+        """Test that only the first batch is shown and later ones are appended on request."""
+        coordinator.APPEARANCES_PAGE_SIZE = 2
+        word = mock_vocabulary_service._db.upsert_tracked_word("test", "てすと", "Noun")
+        vol = mock_vocabulary_service._db.upsert_volume(sample_volume.volume_path, "Test Vol")
+        for page_index in range(3):
+            mock_vocabulary_service._db.insert_word_appearance(
+                word.id, vol.id, page_index, {"x": 0, "y": 0}, f"sentence {page_index}"
+            )
+
+        coordinator.handle_view_word_context(word.id)
+
+        kwargs = mock_context_panel.display_word_context.call_args[1]
+        assert len(kwargs["appearances"]) == 2
+        assert kwargs["has_more"] is True
+
+        coordinator._on_more_appearances_requested(word.id, 2)
+
+        batch, = mock_context_panel.append_appearances.call_args[0]
+        assert [a.page_index for a in batch] == [2]
+        assert mock_context_panel.append_appearances.call_args[1]["has_more"] is False
+        assert batch[0].sentence_text == "sentence 2"
+
+    def test_failed_batch_rearms_panel_paging(self, coordinator, mock_context_panel,
+                                              mock_main_window, mock_vocabulary_service):
+        """Test that a failed batch fetch lets the panel request it again."""
+        mock_vocabulary_service.list_appearances = MagicMock(side_effect=RuntimeError("db gone"))
+
+        coordinator._on_more_appearances_requested(1, 50)
+
+        mock_context_panel.more_appearances_failed.assert_called_once()
+        mock_context_panel.append_appearances.assert_not_called()
+        mock_main_window.show_error.assert_called_once()
+
+    def test_reopening_word_context_reuses_appearances(self, coordinator, mock_context_panel,
+                                                       mock_vocabulary_service, sample_volume):
+        """Test that reopening the same word skips the fetch until an appearance is recorded."""
+        word, _ = mock_vocabulary_service.track_word(
+            lemma="test", reading="てすと", part_of_speech="Noun",
+            volume_path=sample_volume.volume_path, page_index=0,
+            crop_coordinates={"x": 0, "y": 0}, sentence_text="first"
+        )
+        fetch = MagicMock(wraps=mock_vocabulary_service.list_appearances)
+        mock_vocabulary_service.list_appearances = fetch
+
+        coordinator.handle_view_word_context(word.id)
+        coordinator.handle_view_word_context(word.id)
+        assert fetch.call_count == 1
+
+        mock_vocabulary_service.add_appearance_if_new(
+            lemma="test", volume_path=sample_volume.volume_path, page_index=1,
+            crop_coordinates={"x": 0, "y": 0}, sentence_text="second"
+        )
+        coordinator.handle_view_word_context(word.id)
+        assert fetch.call_count == 2
+        assert len(mock_context_panel.display_word_context.call_args[1]["appearances"]) == 2
+
     def test_view_context_word_not_found(self, coordinator, mock_main_window):
         """Test handling when word is not found."""
         coordinator.handle_view_word_context(999)
@@ -258,6 +365,22 @@ class TestHandleViewContextByLemma:
         # Should call display_word_context
         mock_context_panel.display_word_context.assert_called_once()
 
+    def test_view_context_by_lemma_looks_up_word_once(self, coordinator, mock_context_panel,
+                                                      mock_vocabulary_service, sample_volume):
+        """Test that the resolved word is handed through instead of fetched again."""
+        word = mock_vocabulary_service._db.upsert_tracked_word("taberu", "たべる", "Verb")
+        vol = mock_vocabulary_service._db.upsert_volume(sample_volume.volume_path, "Test")
+        mock_vocabulary_service._db.insert_word_appearance(
+            word.id, vol.id, 0, {"x": 0, "y": 0}, "sentence"
+        )
+        mock_vocabulary_service.get_tracked_word_by_id = MagicMock(
+            side_effect=AssertionError("word should not be looked up again")
+        )
+
+        coordinator.handle_view_context_by_lemma("taberu")
+
+        mock_context_panel.display_word_context.assert_called_once()
+
     def test_view_context_by_lemma_not_tracked(self, coordinator, mock_main_window):
         """Test handling when lemma is not tracked."""
         coordinator.handle_view_context_by_lemma("unknown")
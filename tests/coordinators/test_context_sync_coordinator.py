@@ -118,3 +118,36 @@ def test_sync_is_idempotent(main_window, vocabulary_service, sample_volume):
 
     # Second run should report no new appearances
     assert any("No new context appearances" in call.args[1] for call in main_window.show_info.call_args_list)
+
+
+def test_sync_keeps_tracked_appearances_when_a_lemma_is_untracked(main_window, sample_volume):
+    class TwoLemmaMorphology:
+        def tokenize(self, text: str):
+            class Token:
+                def __init__(self, lemma: str):
+                    self.surface = lemma
+                    self.lemma = lemma
+
+            return [Token("kept"), Token("dropped")]
+
+    vocabulary_service = MagicMock()
+    vocabulary_service.get_all_tracked_lemmas.side_effect = [{"kept", "dropped"}, {"kept"}]
+    vocabulary_service.add_appearances_if_new.side_effect = [
+        ValueError("Cannot add appearance for untracked lemma: dropped"),
+        ["kept"],
+    ]
+    coordinator = ContextSyncCoordinator(
+        main_window=main_window,
+        vocabulary_service=vocabulary_service,
+        morphology_service=TwoLemmaMorphology(),
+    )
+    coordinator.set_volume(sample_volume)
+    completed = MagicMock()
+    coordinator.sync_completed.connect(completed)
+
+    coordinator.synchronize_current_volume()
+
+    # One untracked lemma must not drop the rest of the page
+    retried = vocabulary_service.add_appearances_if_new.call_args_list[1].args[1]
+    assert [appearance[0] for appearance in retried] == ["kept"]
+    completed.assert_called_once_with(1, 1)
@@ -196,6 +196,18 @@ def test_handle_block_clicked_opens_sentence_panel(controller, sample_volume):
     controller.sentence_analysis_coordinator.on_block_selected.assert_called_once()
 
 
+def test_canvas_requests_are_wired_to_coordinators(controller, mock_canvas):
+    """The controller ctor routes canvas word and navigation requests."""
+    mock_canvas.word_clicked.connect.assert_called_once_with(
+        controller.word_interaction.handle_word_clicked
+    )
+    mock_canvas.view_context_by_lemma_requested.connect.assert_called_once_with(
+        controller.context_coordinator.handle_view_context_by_lemma
+    )
+    mock_canvas.first_page_requested.connect.assert_called_once_with(controller.jump_to_first_page)
+    mock_canvas.last_page_requested.connect.assert_called_once_with(controller.jump_to_last_page)
+
+
 # ============================================================================
 # Tests for handle_volume_opened
 # ============================================================================
@@ -217,6 +229,7 @@ class TestHandleVolumeOpened:
         controller.library_coordinator.add_volume_to_library.return_value = library_volume_mock
         
         controller.handle_volume_opened(volume_path)
+        controller._flush_render()
         
         assert controller.current_volume == sample_volume
         assert controller.current_page_number == 0
@@ -246,6 +259,53 @@ class TestHandleVolumeOpened:
         assert controller.current_volume is None
         mock_main_window.show_error.assert_called_once()
 
+    def test_background_load_opens_ingested_volume(self, controller, mock_ingestor,
+                                                   mock_main_window, sample_volume):
+        """Test that a background ingest result opens the volume on completion."""
+        from manga_reader.coordinators.reader_controller import _VolumeIngestWorker
+
+        volume_path = sample_volume.volume_path
+        mock_ingestor.ingest_volume.return_value = sample_volume
+        controller.library_coordinator.add_volume_to_library.return_value = MagicMock(
+            id=1, last_page_read=0
+        )
+        controller._pending_ingest_path = volume_path
+
+        worker = _VolumeIngestWorker(mock_ingestor, volume_path)
+        worker.signals.finished.connect(controller._on_volume_ingested)
+        worker.run()
+
+        assert controller.current_volume == sample_volume
+        mock_main_window.clear_status.assert_called_once()
+        mock_main_window.show_info.assert_called_once()
+
+    def test_superseded_background_load_ignored(self, controller, mock_main_window,
+                                                sample_volume):
+        """Test that a stale ingest result does not replace a newer request."""
+        controller._pending_ingest_path = Path("/newer")
+
+        controller._on_volume_ingested(sample_volume.volume_path, sample_volume)
+
+        assert controller.current_volume is None
+        mock_main_window.show_info.assert_not_called()
+
+    def test_synchronous_open_supersedes_background_load(self, controller, mock_ingestor,
+                                                         mock_main_window, sample_volume):
+        """Test that a synchronous open drops the pending ingest and its loading status."""
+        controller.library_coordinator.add_volume_to_library.return_value = MagicMock(
+            id=1, last_page_read=0
+        )
+        mock_ingestor.ingest_volume.return_value = sample_volume
+        controller.load_volume_in_background(Path("/pending"))
+        mock_main_window.show_status.assert_called_once_with("Loading pending...")
+
+        controller.handle_volume_opened(sample_volume.volume_path)
+        controller._on_volume_ingested(Path("/pending"), MagicMock())
+
+        assert controller._pending_ingest_path is None
+        mock_main_window.clear_status.assert_called_once()
+        assert controller.current_volume == sample_volume
+
 
 # ============================================================================
 # Tests for handle_word_clicked
@@ -631,6 +691,7 @@ class TestViewMode:
         controller.view_mode = SINGLE_PAGE_MODE
         
         controller.handle_view_mode_changed("double")
+        controller._flush_render()
         
         assert controller.view_mode.name == "double"
         mock_canvas.render_pages.assert_called()
@@ -641,10 +702,109 @@ class TestViewMode:
         controller.view_mode = DOUBLE_PAGE_MODE
         
         controller.handle_view_mode_changed("single")
+        controller._flush_render()
         
         assert controller.view_mode.name == "single"
         mock_canvas.render_pages.assert_called()
 
+    def test_mode_change_and_page_jump_render_once(self, controller, sample_volume, mock_canvas):
+        """Test that back-to-back navigation within one tick renders a single time."""
+        controller.current_volume = sample_volume
+        controller.view_mode = DOUBLE_PAGE_MODE
+
+        controller._handle_view_mode_change_request("single", 0)
+        controller.jump_to_page(1)
+        controller._flush_render()
+
+        mock_canvas.render_pages.assert_called_once()
+        rendered_pages = mock_canvas.render_pages.call_args[0][0]
+        assert [p.page_number for p in rendered_pages] == [1]
+
+    def test_unchanged_view_state_skips_render(self, controller, sample_volume, mock_canvas):
+        """Test that re-selecting the current mode and page does not re-render."""
+        controller.current_volume = sample_volume
+        controller.view_mode = SINGLE_PAGE_MODE
+        controller.current_page_number = 1
+
+        controller.handle_view_mode_changed("single")
+        controller._handle_view_mode_change_request("single", 1)
+        controller.jump_to_page(1)
+        controller._flush_render()
+
+        mock_canvas.render_pages.assert_not_called()
+
+    def test_prefetch_adjacent_pages(self, controller, sample_volume, mock_canvas):
+        """Test that the neighbouring page is handed to the canvas for prefetch."""
+        controller.current_volume = sample_volume
+        controller.view_mode = SINGLE_PAGE_MODE
+        controller.current_page_number = 0
+
+        controller._prefetch_adjacent_pages()
+
+        prefetched = mock_canvas.prefetch_pages.call_args[0][0]
+        assert [p.page_number for p in prefetched] == [1]
+
+    def test_double_mode_spread_updates_after_page_added(self, sample_volume):
+        """Test that memoized double-page spreads are recomputed when the volume grows."""
+        assert [p.page_number for p in DOUBLE_PAGE_MODE.pages_to_render(sample_volume, 1)] == [1]
+
+        sample_volume.add_page(MangaPage(
+            page_number=2,
+            image_path=sample_volume.volume_path / "0003.jpg",
+            width=1280,
+            height=1600,
+        ))
+
+        assert [p.page_number for p in DOUBLE_PAGE_MODE.pages_to_render(sample_volume, 1)] == [1, 2]
+        assert DOUBLE_PAGE_MODE.next_page_number(sample_volume, 0) == 2
+
+    def test_double_mode_navigation_with_landscape_page(self, sample_volume):
+        """Test that spreads step around a landscape page using the volume's orientation mask."""
+        sample_volume.add_page(MangaPage(
+            page_number=2,
+            image_path=sample_volume.volume_path / "0003.jpg",
+            width=2400,
+            height=1600,
+        ))
+
+        assert [sample_volume.is_portrait(i) for i in range(3)] == [True, True, False]
+        assert not sample_volume.is_portrait(3)
+        assert DOUBLE_PAGE_MODE.next_page_number(sample_volume, 0) == 2
+        assert DOUBLE_PAGE_MODE.previous_page_number(sample_volume, 2) == 0
+        assert DOUBLE_PAGE_MODE.page_for_appearance(sample_volume, 1, 2) == 0
+        assert DOUBLE_PAGE_MODE.page_for_appearance(sample_volume, 2, 0) == 2
+
+    def test_rerender_skips_unchanged_session_sync(self, controller, sample_volume):
+        """Test that coordinators are only re-synced when the session state changes."""
+        controller.current_volume = sample_volume
+        controller.word_interaction.set_volume_context = MagicMock()
+
+        controller._render_current_page()
+        controller._render_current_page()
+        assert controller.word_interaction.set_volume_context.call_count == 1
+
+        controller.current_page_number = 1
+        controller._render_current_page()
+        assert controller.word_interaction.set_volume_context.call_count == 2
+
+    def test_context_session_only_pushed_while_panel_active(self, controller, sample_volume):
+        """Test that the context coordinator is synced while open and pulls state when opening."""
+        controller.current_volume = sample_volume
+        controller.context_coordinator.set_session_context = MagicMock()
+
+        controller._render_current_page()
+        controller.context_coordinator.set_session_context.assert_not_called()
+
+        controller.context_coordinator.session_context_requested.emit()
+        controller.context_coordinator.set_session_context.assert_called_once_with(
+            sample_volume, SINGLE_PAGE_MODE, 0
+        )
+
+        controller.context_coordinator.context_panel_active = True
+        controller.current_page_number = 1
+        controller._render_current_page()
+        assert controller.context_coordinator.set_session_context.call_count == 2
+
     def test_invalid_view_mode_raises(self, controller, sample_volume):
         """Test that invalid view modes raise a ValueError (fail-fast)."""
         controller.view_mode = SINGLE_PAGE_MODE
@@ -662,6 +822,7 @@ class TestViewMode:
         controller.view_mode = SINGLE_PAGE_MODE
         
         controller.toggle_view_mode()
+        controller._flush_render()
         
         assert controller.view_mode.name == "double"
         mock_canvas.render_pages.assert_called()
@@ -672,6 +833,7 @@ class TestViewMode:
         controller.view_mode = DOUBLE_PAGE_MODE
         
         controller.toggle_view_mode()
+        controller._flush_render()
         
         assert controller.view_mode.name == "single"
         mock_canvas.render_pages.assert_called()
@@ -736,6 +898,7 @@ def test_handle_navigate_to_appearance_jumps_to_page(controller, sample_volume):
     # Navigate to appearance on page 1
     crop_coords = {'x': 100, 'y': 200, 'width': 300, 'height': 50}
     controller.handle_navigate_to_appearance(volume_id=1, volume_path=str(sample_volume.volume_path), page_index=1, crop_coords=crop_coords)
+    controller._flush_render()
     
     # Should have jumped to page 1
     assert controller.current_page_number == 1
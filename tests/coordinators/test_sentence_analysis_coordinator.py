@@ -152,6 +152,25 @@ class TestSentenceAnalysisCoordinatorInitialization:
         assert coordinator.actions_enabled()
 
 
+    def test_coordinator_warms_up_translation_connection_with_api_key(
+        self, mock_main_window, translation_cache, mock_translation_service, mock_explanation_service, settings_manager
+    ):
+        """A configured API key should trigger a background warm-up of the translation service."""
+        settings_manager.get_gemini_api_key.return_value = "test-key"
+        pool = MagicMock()
+        with patch("manga_reader.coordinators.sentence_analysis_coordinator.QThreadPool", return_value=pool):
+            SentenceAnalysisCoordinator(
+                main_window=mock_main_window,
+                translation_cache=translation_cache,
+                translation_service=mock_translation_service,
+                explanation_service=mock_explanation_service,
+                settings_manager=settings_manager,
+            )
+
+        pool.start.assert_called_once()
+        pool.start.call_args[0][0]()
+        mock_translation_service.warm_up.assert_called_once_with("test-key")
+
 class TestSentenceAnalysisCoordinatorBlockSelection:
     """Tests for block selection and panel updates."""
 
@@ -259,6 +278,7 @@ class TestSentenceAnalysisCoordinatorTranslationRequest:
 
         coordinator.request_translation()
         process_qt_events()
+        coordinator.flush_cache()
         
         cached = translation_cache.get("vol1", "何か", "en")
         assert cached is not None
@@ -317,6 +337,177 @@ class TestSentenceAnalysisCoordinatorTranslationRequest:
         mock_main_window.show_error.assert_called()
 
 
+    def test_repeat_request_reuses_cache_lookup(
+        self, coordinator, translation_cache, settings_manager
+    ):
+        """Re-clicking translate on the same block should not hit the backing cache again."""
+        settings_manager.get_gemini_api_key.return_value = "test-key"
+        coordinator.on_block_selected("何か", "vol1")
+        translation_cache.put("vol1", "何か", "en", CacheRecord(
+            normalized_text="何か",
+            lang="en",
+            translation="Something",
+            explanation=None,
+            model="gemini-pro",
+            updated_at=datetime.now(),
+        ))
+
+        with patch.object(translation_cache, "get", wraps=translation_cache.get) as get_spy:
+            coordinator.request_translation()
+            coordinator.request_translation()
+
+        assert get_spy.call_count == 1
+
+    def test_duplicate_requests_share_one_worker(
+        self, coordinator, mock_translation_service, settings_manager
+    ):
+        """A second translate click while the first is in flight should not start another API call."""
+        settings_manager.get_gemini_api_key.return_value = "test-key"
+        coordinator.thread_pool.start = MagicMock()
+        coordinator.on_block_selected("何か", "vol1")
+        completed_spy = MagicMock()
+        coordinator.translation_completed.connect(completed_spy)
+
+        coordinator.request_translation()
+        coordinator.request_translation()
+
+        assert coordinator.thread_pool.start.call_count == 1
+        mock_translation_service.translate.return_value = TranslationResult(
+            text="Something",
+            model="gemini-1.5-flash",
+        )
+        coordinator.thread_pool.start.call_args[0][0].run()
+
+        mock_translation_service.translate.assert_called_once()
+        assert completed_spy.call_count == 2
+        completed_spy.assert_called_with("Something")
+
+    def test_warm_page_translations_batches_uncached_blocks(
+        self, coordinator_with_sync_workers, translation_cache, mock_translation_service, settings_manager
+    ):
+        """Page warm-up should translate only uncached blocks, in one batched call."""
+        coordinator = coordinator_with_sync_workers
+        settings_manager.get_gemini_api_key.return_value = "test-key"
+        coordinator.on_block_selected("何か", "vol1")
+        translation_cache.put("vol1", "何か", "en", CacheRecord(
+            normalized_text="何か",
+            lang="en",
+            translation="Something",
+            explanation=None,
+            model="gemini-pro",
+            updated_at=datetime.now(),
+        ))
+        mock_translation_service.translate_batch.return_value = [
+            TranslationResult(text="Run", model="gemini-2.0-flash"),
+            TranslationResult(text="", model="gemini-2.0-flash", error="Missing from batch response"),
+        ]
+
+        coordinator.warm_page_translations(["何か", "走る", "食べる", "走る"], "vol1")
+        coordinator.flush_cache()
+
+        mock_translation_service.translate_batch.assert_called_once_with(
+            texts=["走る", "食べる"], api_key="test-key"
+        )
+        assert translation_cache.get("vol1", "走る", "en").translation == "Run"
+        assert translation_cache.get("vol1", "食べる", "en") is None
+
+        # The failed block is remembered for the session rather than re-requested on every render
+        coordinator.warm_page_translations(["何か", "走る", "食べる"], "vol1")
+
+        mock_translation_service.translate_batch.assert_called_once()
+
+    def test_warm_page_translations_skips_blocks_already_in_flight(
+        self, coordinator, mock_translation_service, settings_manager
+    ):
+        """A re-render while a warm-up is running should not start a second paid request."""
+        settings_manager.get_gemini_api_key.return_value = "test-key"
+        coordinator.on_block_selected("何か", "vol1")
+        coordinator.thread_pool.start = MagicMock()
+
+        coordinator.warm_page_translations(["走る", "食べる"], "vol1")
+        coordinator.warm_page_translations(["走る", "食べる"], "vol1")
+        coordinator.warm_page_translations(["走る", "飲む"], "vol1")
+
+        assert coordinator.thread_pool.start.call_count == 2
+        assert coordinator.thread_pool.start.call_args[0][0].texts == ["飲む"]
+
+    def test_warm_page_translations_ignores_other_volumes(
+        self, coordinator, settings_manager
+    ):
+        """Pages of a volume other than the selection's should not be cached under it."""
+        settings_manager.get_gemini_api_key.return_value = "test-key"
+        coordinator.on_block_selected("何か", "vol1")
+        coordinator.thread_pool.start = MagicMock()
+
+        coordinator.warm_page_translations(["走る"], "vol2")
+
+        coordinator.thread_pool.start.assert_not_called()
+
+    @pytest.mark.parametrize("close", ["on_panel_closed", "on_volume_changed"])
+    def test_page_warm_up_is_cancelled(
+        self, coordinator, translation_cache, mock_translation_service, settings_manager, close
+    ):
+        """Closing the panel or switching volume should cancel running warm-ups and drop their results."""
+        settings_manager.get_gemini_api_key.return_value = "test-key"
+        coordinator.on_block_selected("何か", "vol1")
+        coordinator.thread_pool.start = MagicMock()
+        mock_translation_service.translate_batch.return_value = [
+            TranslationResult(text="Run", model="gemini-2.0-flash"),
+        ]
+        coordinator.warm_page_translations(["走る"], "vol1")
+        worker = coordinator.thread_pool.start.call_args[0][0]
+
+        getattr(coordinator, close)()
+        worker.run()
+        coordinator.flush_cache()
+
+        mock_translation_service.translate_batch.assert_not_called()
+        assert translation_cache.get("vol1", "走る", "en") is None
+        # The cancelled blocks are no longer held, so a later render can warm them again
+        coordinator.on_block_selected("何か", "vol1")
+        coordinator.warm_page_translations(["走る"], "vol1")
+        assert coordinator.thread_pool.start.call_count == 2
+
+    def test_cache_lookup_memo_is_bounded(self, coordinator, settings_manager):
+        """The in-memory lookup tier should evict the least recently used entries."""
+        coordinator.CACHE_LOOKUP_MEMO_SIZE = 2
+        coordinator.current_volume_id = "vol1"
+
+        coordinator._lookup_cached("a")
+        coordinator._lookup_cached("b")
+        coordinator._lookup_cached("a")
+        coordinator._lookup_cached("c")
+
+        assert list(coordinator._cache_lookups) == [("vol1", "a", "en"), ("vol1", "c", "en")]
+
+    def test_cache_writes_are_buffered_and_flushed_together(
+        self, coordinator, translation_cache, settings_manager
+    ):
+        """Finished results should reach the backing cache in one batch per volume."""
+        coordinator.current_volume_id = "vol1"
+        records = [
+            CacheRecord(
+                normalized_text=text,
+                lang="en",
+                translation=text.upper(),
+                explanation=None,
+                model="gemini-2.0-flash",
+                updated_at=datetime.now(),
+            )
+            for text in ("a", "b")
+        ]
+
+        with patch.object(translation_cache, "put_many", wraps=translation_cache.put_many) as put_many_spy:
+            for record in records:
+                coordinator._store_cached(record.normalized_text, record)
+            assert translation_cache.get("vol1", "a", "en") is None
+            assert coordinator._lookup_cached("a") is records[0]
+
+            coordinator.flush_cache()
+
+        put_many_spy.assert_called_once()
+        assert translation_cache.get("vol1", "b", "en").translation == "B"
+
 class TestSentenceAnalysisCoordinatorExplanationRequest:
     """Tests for explanation request handling."""
 
@@ -346,21 +537,18 @@ class TestSentenceAnalysisCoordinatorExplanationRequest:
         mock_translation_service.translate.assert_not_called()
         mock_explanation_service.explain.assert_not_called()
 
-    def test_explanation_fetches_translation_if_missing(
+    def test_explanation_translates_and_explains_in_one_call_if_translation_missing(
         self, coordinator_with_sync_workers, settings_manager, mock_translation_service, mock_explanation_service, translation_cache
     ):
-        """When translation is not cached, explanation flow should fetch it first."""
+        """When translation is not cached, explanation flow should get both from a single call."""
         coordinator = coordinator_with_sync_workers
         settings_manager.get_gemini_api_key.return_value = "key"
         coordinator.on_block_selected("何か", "vol1")
 
-        mock_translation_service.translate.return_value = TranslationResult(
-            text="Something",
-            model="gemini-2.0-flash",
-        )
-        mock_explanation_service.explain.return_value = ExplanationResult(
+        mock_explanation_service.translate_and_explain.return_value = ExplanationResult(
             text="Explanation text",
             model="gemini-2.0-flash",
+            translation="Something",
         )
 
         completed_spy = MagicMock()
@@ -371,15 +559,16 @@ class TestSentenceAnalysisCoordinatorExplanationRequest:
         coordinator.request_explanation()
         process_qt_events()
 
-        mock_translation_service.translate.assert_called_once()
-        mock_explanation_service.explain.assert_called_once_with(
+        mock_translation_service.translate.assert_not_called()
+        mock_explanation_service.explain.assert_not_called()
+        mock_explanation_service.translate_and_explain.assert_called_once_with(
             original_jp="何か",
-            translation_en="Something",
             api_key="key",
         )
         completed_spy.assert_called_once_with("Explanation text")
         translation_spy.assert_called_once_with("Something")
 
+        coordinator.flush_cache()
         cached = translation_cache.get("vol1", "何か", "en")
         assert cached is not None
         assert cached.translation == "Something"
@@ -422,16 +611,16 @@ class TestSentenceAnalysisCoordinatorExplanationRequest:
         )
         translation_spy.assert_called_once_with("to run")
 
-    def test_explanation_fails_when_translation_fails_without_cache(
-        self, coordinator_with_sync_workers, settings_manager, mock_translation_service, mock_main_window
+    def test_explanation_fails_when_combined_call_fails_without_cache(
+        self, coordinator_with_sync_workers, settings_manager, mock_explanation_service, mock_main_window
     ):
-        """Translation failure without cache should emit explanation_failed."""
+        """A failed translate+explain call without cache should emit explanation_failed."""
         coordinator = coordinator_with_sync_workers
         settings_manager.get_gemini_api_key.return_value = "key"
         coordinator.on_block_selected("何か", "vol1")
 
-        mock_translation_service.translate.return_value = TranslationResult(
-            text="",
+        mock_explanation_service.translate_and_explain.return_value = ExplanationResult(
+            text=None,
             model="gemini-2.0-flash",
             error="API down",
         )
@@ -445,17 +634,21 @@ class TestSentenceAnalysisCoordinatorExplanationRequest:
         failed_spy.assert_called_once_with("API down")
 
     def test_explanation_failure_emits_error(
-        self, coordinator_with_sync_workers, settings_manager, mock_translation_service, mock_explanation_service
+        self, coordinator_with_sync_workers, translation_cache, settings_manager, mock_explanation_service
     ):
-        """Explanation failure should emit failed signal even when translation succeeded."""
+        """Explanation failure should emit failed signal even when translation is cached."""
         coordinator = coordinator_with_sync_workers
         settings_manager.get_gemini_api_key.return_value = "key"
         coordinator.on_block_selected("何か", "vol1")
-
-        mock_translation_service.translate.return_value = TranslationResult(
-            text="Something",
+        translation_cache.put("vol1", "何か", "en", CacheRecord(
+            normalized_text="何か",
+            lang="en",
+            translation="Something",
+            explanation=None,
             model="gemini-2.0-flash",
-        )
+            updated_at=datetime.now(),
+        ))
+
         mock_explanation_service.explain.return_value = ExplanationResult(
             text=None,
             model="gemini-2.0-flash",
@@ -531,3 +724,94 @@ class TestSentenceAnalysisCoordinatorPanelLifecycle:
         coordinator.on_block_selected("次", "vol1")
         assert coordinator.selected_block_text == "次"
         assert coordinator.current_volume_id == "vol1"
+
+    def test_translation_result_ignored_after_block_change(
+        self, coordinator, mock_translation_service, settings_manager
+    ):
+        """A translation finishing after the selection changed should not reach the panel."""
+        settings_manager.get_gemini_api_key.return_value = "test-key"
+        coordinator.thread_pool.start = MagicMock()
+        coordinator.on_block_selected("何か", "vol1")
+        coordinator.request_translation()
+        worker = coordinator.thread_pool.start.call_args[0][0]
+
+        completed_spy = MagicMock()
+        coordinator.translation_completed.connect(completed_spy)
+        coordinator.on_block_selected("次", "vol1")
+
+        mock_translation_service.translate.return_value = TranslationResult(
+            text="Something",
+            model="gemini-1.5-flash",
+        )
+        worker.run()
+        process_qt_events()
+
+        completed_spy.assert_not_called()
+
+
+    def test_speculative_translation_fills_cache_without_emitting(
+        self, coordinator_with_sync_workers, translation_cache, mock_translation_service, settings_manager
+    ):
+        """Selecting a block should prefetch its translation so a later click is a cache hit."""
+        coordinator = coordinator_with_sync_workers
+        settings_manager.get_gemini_api_key.return_value = "test-key"
+        mock_translation_service.translate.return_value = TranslationResult(
+            text="Something",
+            model="gemini-1.5-flash",
+        )
+        completed_spy = MagicMock()
+        coordinator.translation_completed.connect(completed_spy)
+
+        coordinator.on_block_selected("何か", "vol1")
+        coordinator._speculative_translate()
+
+        completed_spy.assert_not_called()
+        coordinator.flush_cache()
+        assert translation_cache.get("vol1", "何か", "en").translation == "Something"
+
+        coordinator.request_translation()
+        completed_spy.assert_called_once_with("Something")
+        mock_translation_service.translate.assert_called_once()
+
+    def test_panel_close_stops_pending_speculative_translation(self, coordinator, settings_manager):
+        """Closing the panel should cancel the debounced speculative translation."""
+        settings_manager.get_gemini_api_key.return_value = "test-key"
+        coordinator.on_block_selected("何か", "vol1")
+        assert coordinator._speculative_timer.isActive()
+
+        coordinator.on_panel_closed()
+        assert not coordinator._speculative_timer.isActive()
+
+    def test_block_change_cancels_inflight_worker(
+        self, coordinator, mock_translation_service, settings_manager
+    ):
+        """Selecting another block should stop a queued translation before it calls the API."""
+        settings_manager.get_gemini_api_key.return_value = "test-key"
+        coordinator.thread_pool.start = MagicMock()
+        coordinator.on_block_selected("何か", "vol1")
+        coordinator.request_translation()
+        worker = coordinator.thread_pool.start.call_args[0][0]
+
+        coordinator.on_block_selected("次", "vol1")
+        worker.run()
+
+        mock_translation_service.translate.assert_not_called()
+
+    def test_inflight_callbacks_do_not_keep_worker_alive(
+        self, coordinator, mock_translation_service, settings_manager
+    ):
+        """A finished worker should be freed; its signal callbacks must not reference it."""
+        import gc
+        import weakref
+
+        settings_manager.get_gemini_api_key.return_value = "test-key"
+        coordinator.thread_pool.start = MagicMock()
+        coordinator.on_block_selected("何か", "vol1")
+        coordinator.request_translation()
+        worker_ref = weakref.ref(coordinator.thread_pool.start.call_args[0][0])
+
+        coordinator.on_block_selected("次", "vol1")
+        coordinator.thread_pool.start.reset_mock()
+        gc.collect()
+
+        assert worker_ref() is None
@@ -150,6 +150,26 @@ class TestHandleWordClicked:
         payload = mock_canvas.show_dictionary_popup.call_args[0][0]
         assert payload["isTracked"] is True
 
+    def test_repeat_click_reuses_dictionary_lookup(self, coordinator, mock_canvas, mock_dictionary_service,
+                                                   mock_vocabulary_service):
+        """Test that clicking the same word again reuses the lookup but refreshes position and tracking."""
+        mock_entry = MagicMock()
+        mock_entry.reading = "よむ"
+        mock_entry.senses = []
+        mock_dictionary_service.lookup.return_value = mock_entry
+        mock_vocabulary_service.is_word_tracked.return_value = False
+        
+        coordinator.handle_word_clicked("読む", "読んで", 100, 200)
+        mock_vocabulary_service.is_word_tracked.return_value = True
+        coordinator.handle_word_clicked("読む", "読んで", 300, 400)
+        
+        mock_dictionary_service.lookup.assert_called_once_with("読む", "読んで")
+        payload = mock_canvas.show_dictionary_popup.call_args[0][0]
+        assert payload["mouseX"] == 300
+        assert payload["mouseY"] == 400
+        assert payload["isTracked"] is True
+        assert payload["reading"] == "よむ"
+
 
 # ============================================================================
 # Tests for handle_track_word
@@ -23,6 +23,28 @@ def test_schema_created(manager):
     )
 
 
+def test_schema_is_not_reapplied_once_current(manager, tmp_path):
+    manager.connection.execute("DROP INDEX idx_tracked_words_lemma;")
+    manager.close()
+
+    reopened = DatabaseManager(tmp_path / "vocab.db")
+    reopened.ensure_schema()
+    index_names = {
+        row["name"]
+        for row in reopened.connection.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    }
+    reopened.close()
+
+    assert "idx_tracked_words_lemma" not in index_names
+
+
+def test_file_database_uses_wal_journal(manager):
+    journal_mode = manager.connection.execute("PRAGMA journal_mode;").fetchone()[0]
+    synchronous = manager.connection.execute("PRAGMA synchronous;").fetchone()[0]
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
+
+
 def test_upsert_tracked_word_is_idempotent(manager):
     first = manager.upsert_tracked_word("taberu", "taberu", "Verb")
     updated = manager.upsert_tracked_word("taberu", "taberu", "Ichidan")
@@ -30,6 +52,16 @@ def test_upsert_tracked_word_is_idempotent(manager):
     assert updated.part_of_speech == "Ichidan"
 
 
+def test_unchanged_upserts_do_not_write(manager, tmp_path):
+    word = manager.upsert_tracked_word("taberu", "taberu", "Verb")
+    volume = manager.upsert_volume(tmp_path / "vol", "Vol")
+    changes_before = manager.connection.total_changes
+
+    assert manager.upsert_tracked_word("taberu", "taberu", "Verb") == word
+    assert manager.upsert_volume(tmp_path / "vol", "Vol") == volume
+    assert manager.connection.total_changes == changes_before
+
+
 def test_upsert_volume_updates_existing(manager, tmp_path):
     volume_path = tmp_path / "naruto_vol_1"
     created = manager.upsert_volume(volume_path, "Naruto")
@@ -58,6 +90,22 @@ def test_insert_word_appearance_is_idempotent(manager, tmp_path):
     assert count == 1
 
 
+def test_insert_word_appearances_skips_existing_rows(manager, tmp_path):
+    word = manager.upsert_tracked_word("hashiru", "hashiru", "Verb")
+    volume = manager.upsert_volume(tmp_path / "vol", "Vol")
+    coords = {"x": 1, "y": 2, "width": 3, "height": 4}
+    manager.insert_word_appearance(word.id, volume.id, 0, coords, "text")
+
+    inserted = manager.insert_word_appearances([
+        (word.id, volume.id, 0, coords, "text"),
+        (word.id, volume.id, 1, coords, "more text"),
+    ])
+
+    assert inserted == [False, True]
+    pages = [a.page_index for a in manager.list_appearances_for_word(word.id)]
+    assert pages == [0, 1]
+
+
 def test_list_tracked_words_returns_latest_first(manager):
     manager.upsert_tracked_word("hayai", "hayai", "Adj")
     manager.upsert_tracked_word("aoi", "aoi", "Adj")
@@ -80,3 +128,45 @@ def test_list_appearances_for_word_includes_volume_info(manager, tmp_path):
     assert appearance.volume_name == volume.name
     assert appearance.volume_path == volume.path
     assert appearance.crop_coordinates["width"] == 7
+
+
+def test_list_appearances_for_word_pages_results(manager, tmp_path):
+    word = manager.upsert_tracked_word("miru", "miru", "Verb")
+    volume = manager.upsert_volume(tmp_path / "vol3", "Vol3")
+    for page_index in range(5):
+        manager.insert_word_appearance(word.id, volume.id, page_index, {"x": 0}, "s")
+
+    first = manager.list_appearances_for_word(word.id, limit=2)
+    rest = manager.list_appearances_for_word(word.id, limit=10, offset=2)
+
+    assert [a.page_index for a in first] == [0, 1]
+    assert [a.page_index for a in rest] == [2, 3, 4]
+
+
+def test_list_appearances_for_word_is_served_in_index_order(manager):
+    plan = manager.connection.execute(
+        """
+        EXPLAIN QUERY PLAN
+        SELECT id, word_id, volume_id, page_index, crop_coordinates, sentence_text
+        FROM word_appearances
+        WHERE word_id = ?
+        ORDER BY volume_id ASC, page_index ASC, id ASC
+        """,
+        (1,),
+    ).fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert "idx_word_appearances_word_volume_page" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_insert_word_appearance_returns_volume_info(manager, tmp_path):
+    word = manager.upsert_tracked_word("miru", "miru", "Verb")
+    volume = manager.upsert_volume(tmp_path / "vol", "Vol")
+
+    appearance = manager.insert_word_appearance(word.id, volume.id, 2, {"x": 1.5}, "text")
+
+    assert appearance.id is not None
+    assert appearance.page_index == 2
+    assert appearance.crop_coordinates == {"x": 1.5}
+    assert appearance.volume_name == "Vol"
+    assert appearance.volume_path == volume.path
@@ -179,6 +179,39 @@ def test_library_repository_update_title(library_repo):
     assert retrieved.title == "New Title"
 
 
+def test_library_repository_cached_read_sees_page_progress(library_repo):
+    """Test a repeated path lookup reuses the row until the volume is written."""
+    folder_path = Path("/test/manga/volume1")
+    added = library_repo.add_volume(
+        title="Volume 1",
+        folder_path=folder_path,
+        cover_image_path=Path("/cache/cover1.jpg"),
+    )
+
+    first = library_repo.get_volume_by_path(folder_path)
+    assert library_repo.get_volume_by_path(folder_path) is first
+
+    library_repo.update_last_page_read(added.id, 12)
+
+    assert library_repo.get_volume_by_path(folder_path).last_page_read == 12
+
+
+def test_library_repository_resolves_relative_paths_against_current_dir(
+    library_repo, tmp_path, monkeypatch
+):
+    """Test a relative folder path resolves against the working directory at call time."""
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+
+    monkeypatch.chdir(tmp_path / "a")
+    first = library_repo.add_volume("A", Path("volume"), Path("/cache/a.jpg"))
+    monkeypatch.chdir(tmp_path / "b")
+    second = library_repo.add_volume("B", Path("volume"), Path("/cache/b.jpg"))
+
+    assert first.folder_path == (tmp_path / "a" / "volume").resolve()
+    assert second.folder_path == (tmp_path / "b" / "volume").resolve()
+
+
 def test_library_repository_update_title_empty_raises_error(library_repo):
     """Test that updating title to empty string raises RuntimeError."""
     folder_path = Path("/test/manga/volume1")
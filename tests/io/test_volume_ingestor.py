@@ -3,6 +3,7 @@
 Tests for VolumeIngestor - validates volume ingestion from Mokuro format.
 """
 
+import json
 from pathlib import Path
 
 from manga_reader.io import VolumeIngestor
@@ -44,3 +45,60 @@ def test_volume_ingestor_loads_first_page():
     assert first_page.height > 0, "Page should have a valid height"
     assert len(first_page.ocr_blocks) > 0, "Page should have OCR blocks"
     assert len(first_page.ocr_blocks[0].full_text) > 0, "OCR block should contain text"
+
+
+def test_volume_ingestor_builds_orientation_mask():
+    """Test that ingested pages are registered in the volume's orientation mask."""
+    test_vol_path = Path(__file__).parent.parent / "test_assets" / "testVol"
+    
+    ingestor = VolumeIngestor()
+    volume = ingestor.ingest_volume(test_vol_path)
+    
+    assert volume is not None, "Failed to ingest volume"
+    for index, page in enumerate(volume.pages):
+        assert volume.is_portrait(index) == page.is_portrait()
+
+
+def test_volume_ingestor_skips_pages_with_missing_images(tmp_path):
+    """Test that pages whose image file is absent are left out of the volume."""
+    (tmp_path / "0001.jpg").write_bytes(b"")
+    mokuro = {
+        "pages": [
+            {"img_path": "0001.jpg", "img_width": 100, "img_height": 200, "blocks": []},
+            {"img_path": "0002.jpg", "img_width": 100, "img_height": 200, "blocks": []},
+        ]
+    }
+    (tmp_path / "vol.mokuro").write_text(json.dumps(mokuro), encoding="utf-8")
+    
+    volume = VolumeIngestor().ingest_volume(tmp_path)
+    
+    assert volume is not None, "Failed to ingest volume"
+    assert [page.image_path.name for page in volume.pages] == ["0001.jpg"]
+
+
+def test_volume_ingestor_reports_malformed_blocks_once_per_page(tmp_path, caplog):
+    """Test that bad OCR blocks are dropped with a single warning for their page."""
+    (tmp_path / "0001.jpg").write_bytes(b"")
+    mokuro = {
+        "pages": [
+            {
+                "img_path": "0001.jpg",
+                "img_width": 100,
+                "img_height": 200,
+                "blocks": [
+                    {"box": [0, 0, 10, 10], "lines": ["ok"]},
+                    {"box": [0, 0]},
+                    {"box": ["a", "b", "c", "d"]},
+                ],
+            },
+        ]
+    }
+    (tmp_path / "vol.mokuro").write_text(json.dumps(mokuro), encoding="utf-8")
+    
+    with caplog.at_level("WARNING", logger="manga_reader.io.volume_ingestor"):
+        volume = VolumeIngestor().ingest_volume(tmp_path)
+    
+    assert volume is not None, "Failed to ingest volume"
+    assert [block.full_text for block in volume.get_page(0).ocr_blocks] == ["ok"]
+    assert len(caplog.records) == 1
+    assert "skipped 2 malformed" in caplog.records[0].getMessage()
@@ -114,3 +114,21 @@ def test_lookup_kanji_extracts_meanings(dictionary_service):
 def test_lookup_kanji_with_not_found_returns_none(dictionary_service):
     entry = dictionary_service.lookup_kanji("𐍈")
     assert entry is None
+
+
+def test_jamdict_is_opened_on_first_lookup():
+    service = DictionaryService()
+
+    assert service._jamdict_instance is None
+
+    service.lookup(lemma="猫", surface="猫")
+
+    assert service._jamdict_instance is not None
+
+
+def test_warm_up_opens_jamdict():
+    service = DictionaryService()
+
+    service.warm_up()
+
+    assert service._jamdict_instance is not None
@@ -4,6 +4,7 @@ from datetime import datetime
 from pathlib import Path
 import json
 import tempfile
+from unittest.mock import patch
 
 import pytest
 
@@ -428,3 +429,83 @@ class TestFileTranslationCache:
 
         result = file_cache.get(volume_id=volume_id, normalized_text="test", lang="en")
         assert result is None
+
+    def test_put_many_writes_all_entries_in_one_file(self, file_cache, temp_volume_dir):
+        """put_many should add new entries and overwrite existing ones in a single write."""
+        volume_id = str(temp_volume_dir)
+
+        def make_record(text, translation):
+            return CacheRecord(
+                normalized_text=text,
+                lang="en",
+                translation=translation,
+                explanation=None,
+                model="gemini-pro",
+                updated_at=datetime(2026, 1, 19, 12, 0, 0),
+            )
+
+        file_cache.put(volume_id=volume_id, normalized_text="猫", lang="en", record=make_record("猫", "cat"))
+        file_cache.put_many(volume_id, [
+            ("猫", "en", make_record("猫", "kitty")),
+            ("犬", "en", make_record("犬", "dog")),
+        ])
+
+        new_cache = FileTranslationCache()
+        assert sorted(new_cache.list_keys(volume_id)) == [("犬", "en"), ("猫", "en")]
+        assert new_cache.get(volume_id, "猫", "en").translation == "kitty"
+        assert new_cache.get(volume_id, "犬", "en").translation == "dog"
+
+    def test_preload_serves_lookups_and_tracks_writes(self, file_cache, temp_volume_dir):
+        """After preload, misses and hits come from memory and later writes stay visible."""
+        volume_id = str(temp_volume_dir)
+
+        def make_record(text, translation):
+            return CacheRecord(
+                normalized_text=text,
+                lang="en",
+                translation=translation,
+                explanation=None,
+                model="gemini-pro",
+                updated_at=datetime(2026, 1, 19, 12, 0, 0),
+            )
+
+        file_cache.put(volume_id=volume_id, normalized_text="猫", lang="en", record=make_record("猫", "cat"))
+
+        new_cache = FileTranslationCache()
+        new_cache.preload(volume_id)
+        new_cache.put(volume_id=volume_id, normalized_text="犬", lang="en", record=make_record("犬", "dog"))
+        (temp_volume_dir / ".translations-cache.json").unlink()
+
+        assert new_cache.get(volume_id, "猫", "en").translation == "cat"
+        assert new_cache.get(volume_id, "犬", "en").translation == "dog"
+        assert new_cache.get(volume_id, "鳥", "en") is None
+
+    def test_preload_during_write_is_discarded(self, file_cache, temp_volume_dir):
+        """A preload that reads the file while a write is in progress must not install its snapshot."""
+        volume_id = str(temp_volume_dir)
+
+        def make_record(text, translation):
+            return CacheRecord(
+                normalized_text=text,
+                lang="en",
+                translation=translation,
+                explanation=None,
+                model="gemini-pro",
+                updated_at=datetime(2026, 1, 19, 12, 0, 0),
+            )
+
+        file_cache.put(volume_id=volume_id, normalized_text="猫", lang="en", record=make_record("猫", "cat"))
+
+        new_cache = FileTranslationCache()
+        real_dumps = json.dumps
+
+        def dumps_with_preload(*args, **kwargs):
+            # Preload runs after the write began but before the file holds the new entry
+            new_cache.preload(volume_id)
+            return real_dumps(*args, **kwargs)
+
+        with patch("manga_reader.services.caching.file_translation_cache.json.dumps", dumps_with_preload):
+            new_cache.put(volume_id=volume_id, normalized_text="犬", lang="en", record=make_record("犬", "dog"))
+        new_cache._in_memory_lru.clear()
+
+        assert new_cache.get(volume_id, "犬", "en").translation == "dog"
@@ -184,6 +184,32 @@ def test_get_all_tracked_lemmas_returns_set(tmp_path):
     assert lemmas == {"食べる", "走る", "猫"}
 
 
+def test_tracked_word_lookups_refresh_after_tracking(tmp_path):
+    """Test lemma/id lookups see words tracked after the index was built."""
+    db = DatabaseManager(tmp_path / "vocab_index.db")
+    db.ensure_schema()
+
+    service = VocabularyService(db, FakeMorphology())
+
+    assert service.get_tracked_word_by_lemma("猫") is None
+    assert not service.is_word_tracked("猫")
+
+    word, _ = service.track_word(
+        lemma="猫",
+        reading="ねこ",
+        part_of_speech="NOUN",
+        volume_path=tmp_path / "vol",
+        page_index=0,
+        crop_coordinates={"x": 0, "y": 0, "width": 10, "height": 10},
+        sentence_text="猫がいる",
+    )
+
+    assert service.is_word_tracked("猫")
+    assert service.get_tracked_word_by_lemma("猫").id == word.id
+    assert service.get_tracked_word_by_id(word.id).lemma == "猫"
+    assert service.get_tracked_word_by_id(word.id + 1) is None
+
+
 def test_add_appearance_if_new_raises_for_untracked_lemma(tmp_path):
     """Test add_appearance_if_new raises ValueError for untracked lemma."""
     db = DatabaseManager(tmp_path / "vocab_untracked.db")
@@ -99,4 +99,24 @@ def test_add_tracked_lemma_executes_javascript(manga_canvas):
     # Check that the call includes the lemma and calls the tracking function
     js_code = manga_canvas.web_view.page.return_value.runJavaScript.call_args[0][0]
     assert lemma in js_code
-    assert "markLemmaAsTracked" in js_code
\ No newline at end of file
+    assert "markLemmaAsTracked" in js_code
+
+def test_prefetch_pages_warms_word_cache(manga_canvas, tmp_path):
+    """Test that prefetched blocks are not re-tokenized on render."""
+    from manga_reader.core.manga_page import MangaPage
+
+    manga_canvas.morphology_service.extract_words.return_value = []
+    page = MangaPage(
+        page_number=1,
+        image_path=tmp_path / "0002.jpg",
+        width=800,
+        height=1200,
+        ocr_blocks=[OCRBlock(x=0, y=0, width=100, height=100, text_lines=["猫"])],
+    )
+
+    manga_canvas.prefetch_pages([page])
+    manga_canvas.render_pages([page], tracked_lemmas=set())
+
+    manga_canvas.morphology_service.extract_words.assert_called_once()
+    scripts = [c[0][0] for c in manga_canvas.web_view.page.return_value.runJavaScript.call_args_list]
+    assert any(script.startswith("preloadImages(") for script in scripts)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for WordContextPanel - validates batched appearance loading.
+"""
+
+from PySide6.QtWidgets import QApplication
+
+from manga_reader.core import WordAppearance
+from manga_reader.ui import WordContextPanel
+
+
+def ensure_qt_app():
+    if QApplication.instance() is None:
+        QApplication([])
+
+
+def make_appearances(count, start=0):
+    return [
+        WordAppearance(
+            id=i,
+            word_id=1,
+            volume_id=1,
+            page_index=i,
+            crop_coordinates={"x": 0, "y": 0},
+            sentence_text=f"sentence {i}",
+            volume_name="Volume 1",
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def test_load_more_requests_next_batch_without_scrollbar():
+    """A partial list that fits on screen can still be extended via Load more."""
+    ensure_qt_app()
+    panel = WordContextPanel()
+    requests = []
+    panel.more_appearances_requested.connect(lambda word_id, offset: requests.append((word_id, offset)))
+
+    panel.display_word_context(1, "test", make_appearances(2), has_more=True)
+    assert not panel.load_more_button.isHidden()
+
+    panel.load_more_button.click()
+    panel.load_more_button.click()
+
+    assert requests == [(1, 2)]
+    assert panel.load_more_button.isHidden()
+
+    panel.append_appearances(make_appearances(1, start=2), has_more=False)
+
+    assert panel.table.rowCount() == 3
+    assert panel.load_more_button.isHidden()
+
+
+def test_failed_batch_can_be_requested_again():
+    """Paging is re-armed when the requested batch could not be loaded."""
+    ensure_qt_app()
+    panel = WordContextPanel()
+    requests = []
+    panel.more_appearances_requested.connect(lambda word_id, offset: requests.append((word_id, offset)))
+
+    panel.display_word_context(1, "test", make_appearances(2), has_more=True)
+    panel.load_more_button.click()
+    panel.more_appearances_failed()
+    panel.load_more_button.click()
+
+    assert requests == [(1, 2), (1, 2)]